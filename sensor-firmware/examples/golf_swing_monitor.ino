@@ -121,10 +121,7 @@ void loop() {
         M5.Lcd.setTextColor(WHITE);
         M5.Lcd.println("SWING DETECTED!");
         
-        // Send initial swing data
-        String club_name = club_selector.getCurrentClubName();
-        String player_name = club_selector.getCurrentPlayerName();
-        data_transmitter.sendSwingData(current_data, club_name, player_name, DUAL_MODE);
+        // The detection sample is queued below with the rest of the swing
     }
     
     // Continue recording during swing
@@ -132,13 +129,16 @@ void loop() {
         String club_name = club_selector.getCurrentClubName();
         String player_name = club_selector.getCurrentPlayerName();
         
-        // Send data at high frequency during swing
-        data_transmitter.sendSwingData(current_data, club_name, player_name, DUAL_MODE);
+        // Queue data at high frequency during swing (one swing_batch packet per SWING_BATCH_SIZE samples)
+        data_transmitter.queueSwingData(current_data, club_name, player_name, DUAL_MODE);
         
         // Check if swing recording period is complete
         if (millis() - swing_start_time > SWING_DURATION_MS) {
             swing_in_progress = false;
             
+            // Send the samples still queued from the end of the swing
+            data_transmitter.flushSwingBatch(club_name, player_name, DUAL_MODE);
+            
             // Visual feedback - swing complete
             M5.Lcd.fillScreen(GREEN);
             M5.Lcd.setCursor(10, 30);
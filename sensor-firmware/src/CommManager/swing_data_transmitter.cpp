@@ -5,6 +5,7 @@ SwingDataTransmitter::SwingDataTransmitter() {
     is_serial_initialized = false;
     is_wifi_connected = false;
     baud_rate = 115200;
+    batch_count = 0;
 }
 
 bool SwingDataTransmitter::initializeSerial(unsigned long baud) {
@@ -43,6 +44,12 @@ bool SwingDataTransmitter::initializeMQTT(const char* broker, int port) {
     
     mqtt_client.setServer(broker, port);
     
+    // A full swing_batch packet does not fit the default 256 B buffer and
+    // publish() would fail without an error
+    if (!mqtt_client.setBufferSize(SWING_BATCH_MQTT_BUFFER)) {
+        return false;
+    }
+    
     // Connect to MQTT broker
     if (mqtt_client.connect("M5StickCPlus2_Golf_Sensor")) {
         return true;
@@ -78,6 +85,53 @@ String SwingDataTransmitter::createSwingDataPacket(const SwingData& swing_data,
     return packet;
 }
 
+String SwingDataTransmitter::createSwingBatchPacket(const SwingData* samples, int count,
+                                                   const String& club_name, 
+                                                   const String& player_name) {
+    // One packet for `count` samples: metadata once, then one array per axis.
+    // Timestamps are offsets from t0 and the axes are fixed-point integers,
+    // e.g. {"type":"swing_batch",...,"t0":123450,"t":[0,10,...],
+    //       "scale":{"accel":0.001,"gyro":0.1},"sensor_data":{"accel_x":[279,...],...}}
+    JsonDocument doc;
+    
+    doc["type"] = "swing_batch";
+    doc["device_id"] = "M5StickCPlus2_001";
+    doc["player"] = player_name;
+    doc["club"] = club_name;
+    
+    unsigned long t0 = samples[0].timestamp;
+    doc["t0"] = t0;
+    JsonArray offsets = doc["t"].to<JsonArray>();
+    
+    JsonObject scale = doc["scale"].to<JsonObject>();
+    scale["accel"] = SWING_BATCH_ACCEL_SCALE;
+    scale["gyro"] = SWING_BATCH_GYRO_SCALE;
+    
+    JsonObject sensor = doc["sensor_data"].to<JsonObject>();
+    JsonArray accel_x = sensor["accel_x"].to<JsonArray>();
+    JsonArray accel_y = sensor["accel_y"].to<JsonArray>();
+    JsonArray accel_z = sensor["accel_z"].to<JsonArray>();
+    JsonArray gyro_x = sensor["gyro_x"].to<JsonArray>();
+    JsonArray gyro_y = sensor["gyro_y"].to<JsonArray>();
+    JsonArray gyro_z = sensor["gyro_z"].to<JsonArray>();
+    
+    for (int i = 0; i < count; i++) {
+        const SwingData& sample = samples[i];
+        offsets.add(sample.timestamp - t0);
+        accel_x.add(lroundf(sample.accel_x / SWING_BATCH_ACCEL_SCALE));
+        accel_y.add(lroundf(sample.accel_y / SWING_BATCH_ACCEL_SCALE));
+        accel_z.add(lroundf(sample.accel_z / SWING_BATCH_ACCEL_SCALE));
+        gyro_x.add(lroundf(sample.gyro_x / SWING_BATCH_GYRO_SCALE));
+        gyro_y.add(lroundf(sample.gyro_y / SWING_BATCH_GYRO_SCALE));
+        gyro_z.add(lroundf(sample.gyro_z / SWING_BATCH_GYRO_SCALE));
+    }
+    
+    String packet;
+    serializeJson(doc, packet);
+    
+    return packet;
+}
+
 bool SwingDataTransmitter::sendViaSerial(const String& data) {
     if (!is_serial_initialized) {
         return false;
@@ -100,7 +154,36 @@ bool SwingDataTransmitter::sendSwingData(const SwingData& swing_data,
                                         const String& player_name,
                                         TransmissionMode mode) {
     String packet = createSwingDataPacket(swing_data, club_name, player_name);
+    return sendPacket(packet, mode);
+}
+
+bool SwingDataTransmitter::queueSwingData(const SwingData& swing_data, 
+                                         const String& club_name, 
+                                         const String& player_name,
+                                         TransmissionMode mode) {
+    batch_buffer[batch_count++] = swing_data;
+    
+    if (batch_count < SWING_BATCH_SIZE) {
+        return true;
+    }
+    
+    return flushSwingBatch(club_name, player_name, mode);
+}
+
+bool SwingDataTransmitter::flushSwingBatch(const String& club_name, 
+                                          const String& player_name,
+                                          TransmissionMode mode) {
+    if (batch_count == 0) {
+        return true;
+    }
     
+    String packet = createSwingBatchPacket(batch_buffer, batch_count, club_name, player_name);
+    batch_count = 0;
+    
+    return sendPacket(packet, mode);
+}
+
+bool SwingDataTransmitter::sendPacket(const String& packet, TransmissionMode mode) {
     switch (mode) {
         case SERIAL_MODE:
             return sendViaSerial(packet);
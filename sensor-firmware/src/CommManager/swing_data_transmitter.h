@@ -6,6 +6,17 @@
 #include <PubSubClient.h>
 #include "../SensorManager/imu_data_acquisition.h"
 
+// Samples per "swing_batch" packet (10 samples = one packet every 100 ms at 100 Hz)
+#define SWING_BATCH_SIZE 10
+
+// Fixed-point scales used in swing_batch packets
+#define SWING_BATCH_ACCEL_SCALE 0.001f   // 1 mG per count
+#define SWING_BATCH_GYRO_SCALE  0.1f     // 0.1 dps per count
+
+// MQTT buffer for one swing_batch publish: ~200 B of metadata and keys plus
+// up to 7 fields of 8 characters per sample (PubSubClient defaults to 256 B)
+#define SWING_BATCH_MQTT_BUFFER (256 + SWING_BATCH_SIZE * 64)
+
 enum TransmissionMode {
     SERIAL_MODE,
     MQTT_MODE,
@@ -21,9 +32,17 @@ private:
     WiFiClient wifi_client;
     PubSubClient mqtt_client;
     
+    // Samples waiting for the next swing_batch packet
+    SwingData batch_buffer[SWING_BATCH_SIZE];
+    int batch_count;
+    
     String createSwingDataPacket(const SwingData& swing_data, 
                                const String& club_name, 
                                const String& player_name);
+    String createSwingBatchPacket(const SwingData* samples, int count,
+                                const String& club_name, 
+                                const String& player_name);
+    bool sendPacket(const String& packet, TransmissionMode mode);
     
     bool sendViaSerial(const String& data);
     bool sendViaMQTT(const String& data, const char* topic);
@@ -42,6 +61,17 @@ public:
                       const String& player_name,
                       TransmissionMode mode = SERIAL_MODE);
     
+    // Queue a sample and send a swing_batch packet every SWING_BATCH_SIZE samples
+    bool queueSwingData(const SwingData& swing_data, 
+                       const String& club_name, 
+                       const String& player_name,
+                       TransmissionMode mode = SERIAL_MODE);
+    
+    // Send the queued samples now (end of swing, club or player change)
+    bool flushSwingBatch(const String& club_name, 
+                        const String& player_name,
+                        TransmissionMode mode = SERIAL_MODE);
+    
     // Maintain active connections
     void maintainConnections();
 };
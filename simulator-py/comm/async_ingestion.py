@@ -0,0 +1,227 @@
+"""
+Golf HILS System - asyncio Ingestion Pipeline
+
+This module runs sample ingestion on a single asyncio event loop instead
+of the listener thread and the staged worker threads of the default mode:
+
+    serial StreamReader -> sample queue -> segmentation -> swing queue
+                                                          -> simulate (CPU executor)
+                                                          -> live display (posted to the display thread)
+                                                          -> persist (I/O executor)
+                                                             + PNG export (render executor)
+
+Swings are processed one at a time in arrival order. Screens are posted to
+the simulator's display thread, which also handles the "return to waiting
+screen" delay.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import concurrent.futures
+from typing import Optional
+
+import serial
+
+from comm.serial_data_listener import SampleBlock, SerialDataListener
+
+async def open_serial_connection(port: str, baud_rate: int = 115200,
+                                 limit: int = 64 * 1024) -> tuple:
+    """Open a serial port as an asyncio StreamReader (POSIX only)
+
+    The port's file descriptor is watched with loop.add_reader(), so no
+    thread is involved. Returns (reader, serial_connection); release it
+    with close_serial_connection().
+    """
+    loop = asyncio.get_running_loop()
+    serial_connection = serial.Serial(port=port, baudrate=baud_rate, timeout=0)
+    fd = serial_connection.fileno()
+    reader = asyncio.StreamReader(limit=limit, loop=loop)
+
+    def on_readable():
+        try:
+            data = os.read(fd, limit)
+        except OSError as e:
+            loop.remove_reader(fd)
+            reader.set_exception(e)
+            return
+        if data:
+            reader.feed_data(data)
+        else:
+            loop.remove_reader(fd)
+            reader.feed_eof()
+
+    loop.add_reader(fd, on_readable)
+    return reader, serial_connection
+
+def close_serial_connection(serial_connection):
+    """Stop watching and close a port opened by open_serial_connection()"""
+    try:
+        asyncio.get_running_loop().remove_reader(serial_connection.fileno())
+    except (RuntimeError, ValueError):
+        pass
+    serial_connection.close()
+
+class AsyncIngestionPipeline:
+    """Event-loop front end driving a GolfHILSSimulator
+
+    ``reader`` is any object with an ``async read(n)`` returning bytes
+    (b'' at end of stream), such as an asyncio.StreamReader. The
+    simulator application provides the stages: segment_sample() and
+    segment_block() (for binary SampleBlocks, queued whole), take_swing(), simulate_swing(), persist_swing(), show_live_result(),
+    export_trajectory_plot() and return_to_waiting().
+
+    The CPU executor defaults to one thread: the simulator keeps its cache
+    and lookup table in-process, so a process pool would not share them.
+    PNG export gets its own single thread because matplotlib must not be
+    drawn from several threads at once.
+    """
+
+    def __init__(self, app, reader, queue_size: int = 1000, read_size: int = 4096,
+                 protocol: str = 'auto',
+                 cpu_executor: Optional[concurrent.futures.Executor] = None):
+        self.app = app
+        self.reader = reader
+        self.read_size = read_size
+        self.logger = logging.getLogger(__name__)
+
+        self.sample_queue = asyncio.Queue(maxsize=queue_size)
+        self.swing_queue = asyncio.Queue()
+        self.parser = SerialDataListener(read_mode='select', protocol=protocol)  # Used only for feed()
+
+        self.cpu_executor = cpu_executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sim")
+        self.io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="store")
+        self.render_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="render")
+
+        self._stop = None
+
+        if app.sample_ring.overflow == 'block':
+            # Producer and consumer share the loop thread: waiting for space would stall both
+            self.logger.warning("sample_buffer overflow 'block' is not supported with asyncio, using drop_oldest")
+            app.sample_ring.overflow = 'drop_oldest'
+
+        # Counters
+        self.samples_received = 0
+        self.swings_processed = 0
+        self.sample_queue_high_water = 0
+
+    def stop(self):
+        """Ask run() to finish (safe to call from the event loop thread)"""
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run(self, drain: bool = True):
+        """Run until the reader hits end of stream or stop() is called
+
+        With ``drain`` the queued samples and swings are processed before
+        returning; the consumer tasks are then cancelled either way.
+        """
+        self._stop = asyncio.Event()
+        reader_task = asyncio.create_task(self._read_loop(), name="read")
+        consumers = [asyncio.create_task(self._segment_loop(), name="segment"),
+                     asyncio.create_task(self._swing_loop(), name="swing")]
+        stop_task = asyncio.create_task(self._stop.wait(), name="stop")
+
+        try:
+            await asyncio.wait([reader_task, stop_task], return_when=asyncio.FIRST_COMPLETED)
+            if not reader_task.done():
+                reader_task.cancel()
+            if drain:
+                await self.sample_queue.join()
+                await self.swing_queue.join()
+        finally:
+            for task in consumers + [reader_task, stop_task]:
+                task.cancel()
+            await asyncio.gather(*consumers, reader_task, stop_task, return_exceptions=True)
+            for executor in (self.cpu_executor, self.io_executor, self.render_executor):
+                executor.shutdown(wait=True)
+
+        self.logger.info(f"Ingestion stopped: {self.stats()}")
+
+    def stats(self) -> dict:
+        """Counters and current queue depths"""
+        return {
+            'samples_received': self.samples_received,
+            'swings_processed': self.swings_processed,
+            'sample_queue_depth': self.sample_queue.qsize(),
+            'sample_queue_high_water': self.sample_queue_high_water,
+            'swing_queue_depth': self.swing_queue.qsize()
+        }
+
+    async def _read_loop(self):
+        """Read bytes in bulk, split complete lines and queue the parsed samples"""
+        while True:
+            data = await self.reader.read(self.read_size)
+            if not data:
+                self.logger.info("Sensor stream ended")
+                return
+            for item in self.parser.feed(data):
+                await self.sample_queue.put(item)
+                self.samples_received += len(item) if isinstance(item, SampleBlock) else 1
+            self.sample_queue_high_water = max(self.sample_queue_high_water, self.sample_queue.qsize())
+
+    async def _segment_loop(self):
+        """Segment samples and blocks on the loop; closed swings go to the swing queue"""
+        # Imported here to keep comm free of a hard dependency on sim
+        from sim.swing_segmenter import SwingSegmenter
+
+        while True:
+            item = await self.sample_queue.get()
+            try:
+                if isinstance(item, SampleBlock):
+                    events = self.app.segment_block(item)
+                else:
+                    events = [self.app.segment_sample(item)]
+
+                for event, swing_closed in events:
+                    if event == SwingSegmenter.SWING_START:
+                        if self.app.display_manager:
+                            self.app.display_manager.post('display_swing_detected',
+                                                          item.player, item.club)
+                    elif swing_closed:
+                        self.swing_queue.put_nowait(swing_closed)
+                    elif event == SwingSegmenter.SWING_ABORT:
+                        self.app.return_to_waiting()
+            except Exception as e:
+                self.logger.error(f"Error segmenting sample: {e}")
+            finally:
+                self.sample_queue.task_done()
+
+    async def _swing_loop(self):
+        """Simulate, persist and display closed swings in arrival order"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self.swing_queue.get()
+            try:
+                # Segmentation and this loop share the event loop thread, so the
+                # committed block is always there to take
+                swing = self.app.take_swing()
+                if swing is None:
+                    self.logger.warning("No swing data to process")
+                    continue
+                swing_samples, swing_analysis, impact_time = swing
+                simulation_results = await loop.run_in_executor(
+                    self.cpu_executor, self.app.simulate_swing, swing_samples, swing_analysis)
+
+                # Live result first, then storage and PNG export side by side
+                self.app.show_live_result(simulation_results, impact_time)
+
+                exported = loop.run_in_executor(self.render_executor,
+                                                self.app.export_trajectory_plot, simulation_results)
+                try:
+                    await loop.run_in_executor(self.io_executor, self.app.persist_swing,
+                                               swing_samples, simulation_results)
+                    # Stored latency covers storage only, as in the threaded persist stage
+                    if impact_time is not None:
+                        self.app.stored_latency.record(time.perf_counter() - impact_time)
+                finally:
+                    await exported
+                self.swings_processed += 1
+            except Exception as e:
+                self.logger.error(f"Error processing swing: {e}")
+            finally:
+                self.swing_queue.task_done()
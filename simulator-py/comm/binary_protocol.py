@@ -0,0 +1,206 @@
+"""
+Golf HILS System - Binary Sensor Frame Protocol
+
+Compact alternative to the JSON line protocol for the UART link. Every
+frame is COBS encoded and terminated by a 0x00 byte, so a receiver can
+resynchronize at the next zero after any corruption:
+
+    COBS( type:u8 | seq:u8 | body | crc32(type..body):u32le ) 0x00
+
+Frame types:
+    HEADER  (0x01) - device_id, club and player as u8-length-prefixed
+                     UTF-8 strings; sent once and whenever they change
+    SAMPLES (0x02) - N packed records of timestamp:u32le followed by
+                     accel_x..z and gyro_x..z as float32le (28 bytes each)
+
+A sample record is 28 bytes on the wire against roughly 200 bytes for a
+JSON packet, and a block of records decodes with one numpy.frombuffer()
+call instead of one json.loads() per sample.
+"""
+
+import zlib
+import struct
+import logging
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from comm.serial_data_listener import SAMPLE_DTYPE, SampleBlock
+
+FRAME_DELIMITER = b'\x00'
+FRAME_HEADER = 0x01
+FRAME_SAMPLES = 0x02
+
+MAX_SAMPLES_PER_FRAME = 32
+MAX_FRAME_BYTES = 2 * 1024    # Longer runs without a delimiter are noise
+
+def cobs_encode(data: bytes) -> bytes:
+    """Consistent Overhead Byte Stuffing: remove every zero byte from data"""
+    encoded = bytearray()
+    for block in bytes(data).split(b'\x00'):
+        # Blocks longer than 254 bytes are split with 0xFF codes (no implied zero)
+        while len(block) >= 0xFE:
+            encoded.append(0xFF)
+            encoded += block[:0xFE]
+            block = block[0xFE:]
+        encoded.append(len(block) + 1)
+        encoded += block
+    return bytes(encoded)
+
+def cobs_decode(data: bytes) -> bytes:
+    """Inverse of cobs_encode(); raises ValueError on a malformed frame"""
+    decoded = bytearray()
+    index = 0
+    length = len(data)
+    while index < length:
+        code = data[index]
+        if code == 0:
+            raise ValueError("Zero byte inside COBS frame")
+        end = index + code
+        if end > length:
+            raise ValueError("COBS block runs past the end of the frame")
+        decoded += data[index + 1:end]
+        index = end
+        if code != 0xFF and index < length:
+            decoded.append(0)
+    return bytes(decoded)
+
+def encode_frame(frame_type: int, seq: int, body: bytes) -> bytes:
+    """Build one delimited frame ready to be written to the link"""
+    payload = bytes((frame_type, seq & 0xFF)) + body
+    return cobs_encode(payload + struct.pack('<I', zlib.crc32(payload))) + FRAME_DELIMITER
+
+def encode_header_frame(device_id: str, club: str, player: str, seq: int = 0) -> bytes:
+    """HEADER frame carrying the per-stream strings"""
+    body = bytearray()
+    for text in (device_id, club, player):
+        raw = text.encode('utf-8')[:255]
+        body.append(len(raw))
+        body += raw
+    return encode_frame(FRAME_HEADER, seq, bytes(body))
+
+def encode_sample_frame(samples: Sequence, seq: int = 0) -> bytes:
+    """SAMPLES frame from SwingData objects or a SAMPLE_DTYPE array"""
+    if not isinstance(samples, np.ndarray):
+        samples = np.array([(s.timestamp, s.accel_x, s.accel_y, s.accel_z,
+                             s.gyro_x, s.gyro_y, s.gyro_z) for s in samples], dtype=SAMPLE_DTYPE)
+    if len(samples) > MAX_SAMPLES_PER_FRAME:
+        raise ValueError(f"At most {MAX_SAMPLES_PER_FRAME} samples per frame")
+    return encode_frame(FRAME_SAMPLES, seq, samples.astype(SAMPLE_DTYPE, copy=False).tobytes())
+
+def decode_frame(frame: bytes) -> tuple:
+    """Decode one frame (without its delimiter) into (type, seq, body)
+
+    Raises ValueError on a COBS or CRC error.
+    """
+    payload = cobs_decode(frame)
+    if len(payload) < 6:
+        raise ValueError(f"Frame too short ({len(payload)} bytes)")
+    crc, = struct.unpack_from('<I', payload, len(payload) - 4)
+    if zlib.crc32(memoryview(payload)[:-4]) != crc:
+        raise ValueError("CRC mismatch")
+    return payload[0], payload[1], payload[2:-4]
+
+class BinaryFrameDecoder:
+    """Incremental decoder turning received bytes into SampleBlocks
+
+    Bytes are buffered until a delimiter arrives, so frames may be split
+    across reads. Corrupt frames are counted and skipped; samples that
+    arrive before any HEADER frame are dropped because they have no
+    club or player to attach.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.device_id: Optional[str] = None
+        self.club: Optional[str] = None
+        self.player: Optional[str] = None
+        self.logger = logging.getLogger(__name__)
+
+        # Counters
+        self.frames_received = 0
+        self.frame_errors = 0
+        self.frames_lost = 0
+        self.samples_received = 0
+        self.samples_without_header = 0
+        self._last_seq = None
+
+    def feed(self, data: bytes) -> List[SampleBlock]:
+        """Append received bytes and decode every complete frame"""
+        buffer = self.buffer
+        buffer.extend(data)
+
+        end = buffer.rfind(FRAME_DELIMITER)
+        if end < 0:
+            if len(buffer) > MAX_FRAME_BYTES:
+                self.logger.warning(f"Discarding {len(buffer)} bytes without a frame delimiter")
+                self.frame_errors += 1
+                buffer.clear()
+            return []
+
+        frames = bytes(buffer[:end]).split(FRAME_DELIMITER)
+        del buffer[:end + 1]
+
+        blocks = []
+        for frame in frames:
+            if not frame:
+                continue
+            block = self._handle_frame(frame)
+            if block is not None:
+                blocks.append(block)
+        return blocks
+
+    def _handle_frame(self, frame: bytes) -> Optional[SampleBlock]:
+        try:
+            frame_type, seq, body = decode_frame(frame)
+        except ValueError as e:
+            self.frame_errors += 1
+            self.logger.debug(f"Dropping frame: {e}")
+            return None
+
+        self.frames_received += 1
+        if self._last_seq is not None:
+            self.frames_lost += (seq - self._last_seq - 1) & 0xFF
+        self._last_seq = seq
+
+        if frame_type == FRAME_HEADER:
+            self._read_header(body)
+            return None
+
+        if frame_type != FRAME_SAMPLES or len(body) % SAMPLE_DTYPE.itemsize:
+            self.frame_errors += 1
+            self.logger.debug(f"Dropping frame of type {frame_type} with {len(body)} byte body")
+            return None
+
+        samples = np.frombuffer(body, dtype=SAMPLE_DTYPE)
+        if self.club is None:
+            self.samples_without_header += len(samples)
+            return None
+
+        self.samples_received += len(samples)
+        return SampleBlock(self.device_id, self.club, self.player, samples)
+
+    def _read_header(self, body: bytes):
+        fields = []
+        index = 0
+        try:
+            for _ in range(3):
+                length = body[index]
+                fields.append(body[index + 1:index + 1 + length].decode('utf-8'))
+                index += 1 + length
+        except (IndexError, UnicodeDecodeError):
+            self.frame_errors += 1
+            self.logger.warning("Malformed header frame")
+            return
+        self.device_id, self.club, self.player = fields
+        self.logger.info(f"Binary stream from {self.device_id}: {self.player} / {self.club}")
+
+    def stats(self) -> dict:
+        """Frame and sample counters"""
+        return {
+            'frames_received': self.frames_received,
+            'frame_errors': self.frame_errors,
+            'frames_lost': self.frames_lost,
+            'samples_received': self.samples_received,
+            'samples_without_header': self.samples_without_header
+        }
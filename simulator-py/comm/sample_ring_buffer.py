@@ -0,0 +1,217 @@
+"""
+Golf HILS System - Sample Ring Buffer
+
+Fixed-capacity, preallocated NumPy ring buffer that carries the samples of
+each swing from the ingest thread to the swing processing worker. Memory
+stays at ``capacity`` records however long a swing or a session runs.
+
+The buffer is single-producer/single-consumer and takes no lock:
+
+    producer: push() samples into a pending block, then commit() publishes
+              the whole block at once (or rollback() discards it)
+    consumer: read_block() copies the oldest committed block out and
+              frees its slots
+
+Each position counter is written by one side only (the producer owns the
+write position, the consumer owns the read position). Python int assignment
+is atomic, so each side reads a consistent value of the other's counter.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from comm.serial_data_listener import SAMPLE_DTYPE
+
+class SampleRingBuffer:
+    """SPSC ring of SAMPLE_DTYPE records, handed over in committed blocks
+
+    Overflow policies, applied when a push finds every slot in use:
+        drop_oldest - never wait: drop the oldest sample of the block being
+                      written; committed blocks the consumer has not read
+                      are never overwritten, so with those in the way the
+                      new sample is dropped instead
+        block       - backpressure: wait up to block_timeout_s for the
+                      consumer to read a block, then drop the new sample;
+                      a single block larger than the ring drops its oldest
+                      samples as there is nothing to wait for
+    """
+
+    OVERFLOW_POLICIES = ('drop_oldest', 'block')
+
+    def __init__(self, capacity: int = 4096, overflow: str = 'drop_oldest',
+                 block_timeout_s: float = 1.0, dtype: np.dtype = SAMPLE_DTYPE):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}', expected one of {self.OVERFLOW_POLICIES}")
+
+        self.capacity = capacity
+        self.overflow = overflow
+        self.block_timeout_s = block_timeout_s
+        self.buffer = np.zeros(capacity, dtype=dtype)
+        self.logger = logging.getLogger(__name__)
+
+        # Positions count samples since creation; slot = position % capacity
+        self._write_pos = 0        # Producer: next slot to write
+        self._pending_start = 0    # Producer: first sample of the open block
+        self._read_pos = 0         # Consumer: first slot not yet freed
+        self._committed = deque()  # (start, end, tag), appended by the producer
+        self._space = threading.Event()
+
+        # Counters
+        self.pushed = 0
+        self.dropped = 0
+        self.blocks_committed = 0
+        self.blocks_read = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        """Slots in use (unread committed blocks and the pending block)"""
+        return self._used()
+
+    @property
+    def pending(self) -> int:
+        """Samples in the block being written"""
+        return self._write_pos - self._pending_start
+
+    def _used(self) -> int:
+        # Once every committed block has been read, everything before the
+        # pending block is free (including dropped and rolled back samples)
+        if self.blocks_read == self.blocks_committed:
+            return self._write_pos - self._pending_start
+        return self._write_pos - self._read_pos
+
+    # Producer side
+
+    def push(self, sample) -> bool:
+        """Append one SwingData-like sample to the pending block
+
+        Returns False when the sample (not an older one) was dropped.
+        """
+        return self._push_record((
+            sample.timestamp, sample.accel_x, sample.accel_y, sample.accel_z,
+            sample.gyro_x, sample.gyro_y, sample.gyro_z))
+
+    def push_block(self, samples: np.ndarray) -> int:
+        """Append an array of records (e.g. SampleBlock.samples) to the pending block
+
+        The part that fits in the free slots is copied in at most two
+        slice assignments; only samples that overflow go through the
+        overflow policy one at a time. Returns the number of samples stored.
+        """
+        count = len(samples)
+        fits = min(count, max(self.capacity - self._used(), 0))
+        if fits:
+            start = self._write_pos % self.capacity
+            first = min(fits, self.capacity - start)
+            self.buffer[start:start + first] = samples[:first]
+            self.buffer[:fits - first] = samples[first:fits]
+            self._write_pos += fits
+            self.pushed += fits
+
+            used = self._used()
+            if used > self.high_water:
+                self.high_water = used
+
+        stored = fits
+        for record in samples[fits:]:
+            stored += self._push_record(record)
+        return stored
+
+    def _push_record(self, record) -> bool:
+        if self._used() >= self.capacity and not self._make_room():
+            self.dropped += 1
+            return False
+
+        self.buffer[self._write_pos % self.capacity] = record
+        self._write_pos += 1
+        self.pushed += 1
+
+        used = self._used()
+        if used > self.high_water:
+            self.high_water = used
+        return True
+
+    def _make_room(self) -> bool:
+        """Free one slot according to the overflow policy"""
+        if self.overflow == 'block' and self.blocks_read != self.blocks_committed:
+            deadline = time.monotonic() + self.block_timeout_s
+            while self._used() >= self.capacity:
+                self._space.clear()
+                # Re-check after clear() so a read in between is not missed
+                if self._used() < self.capacity:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._space.wait(remaining):
+                    self.logger.warning("Sample ring buffer full, consumer did not free space in time")
+                    return False
+            return True
+
+        # drop_oldest, or a pending block that fills the whole ring (waiting
+        # would never free space): give up the oldest pending sample if its
+        # slot is the one to be reused
+        if self.blocks_read == self.blocks_committed and self.pending:
+            self._pending_start += 1
+            self.dropped += 1
+            return True
+        return False
+
+    def commit(self, tag: Any = None) -> int:
+        """Publish the pending block with an optional tag; returns its size"""
+        size = self._write_pos - self._pending_start
+        if size:
+            self.blocks_committed += 1
+            self._committed.append((self._pending_start, self._write_pos, tag))
+        self._pending_start = self._write_pos
+        return size
+
+    def rollback(self) -> int:
+        """Discard the pending block; returns the number of samples dropped"""
+        size = self._write_pos - self._pending_start
+        self._write_pos = self._pending_start
+        return size
+
+    # Consumer side
+
+    def read_block(self) -> Optional[Tuple[np.ndarray, Any]]:
+        """Copy out the oldest committed block and free its slots
+
+        Returns (samples, tag), or None when no block is committed.
+        """
+        try:
+            start, end, tag = self._committed.popleft()
+        except IndexError:
+            return None
+
+        first = start % self.capacity
+        count = end - start
+        if first + count <= self.capacity:
+            samples = self.buffer[first:first + count].copy()
+        else:
+            samples = np.concatenate((self.buffer[first:], self.buffer[:first + count - self.capacity]))
+
+        # Free this block (and any samples dropped in front of it); the
+        # position is published before the counter the producer checks
+        self._read_pos = end
+        self.blocks_read += 1
+        self._space.set()
+        return samples, tag
+
+    def stats(self) -> dict:
+        """Counters and current fill level"""
+        return {
+            'capacity': self.capacity,
+            'overflow': self.overflow,
+            'used': len(self),
+            'pending': self.pending,
+            'pushed': self.pushed,
+            'dropped': self.dropped,
+            'blocks_committed': self.blocks_committed,
+            'blocks_read': self.blocks_read,
+            'high_water': self.high_water
+        }
@@ -2,17 +2,23 @@
 Golf HILS System - Serial Communication Listener
 
 This module handles receiving swing data from the M5StickC Plus2 sensor unit
-via USB serial connection. It parses JSON packets and forwards them to the
-simulation engine.
+via USB serial connection. It parses JSON packets (one sample per line, or
+a columnar "swing_batch" of many samples; binary frames are handled by
+comm.binary_protocol) and forwards them to the simulation engine.
 """
 
+import os
 import serial
 import json
 import time
 import logging
-from typing import Dict, Any, Optional
+import selectors
+import threading
+from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 
+import numpy as np
+
 @dataclass
 class SwingData:
     """Data structure for golf swing measurements"""
@@ -27,15 +33,85 @@ class SwingData:
     player: str
     device_id: str
 
+# Columnar layout shared by batched JSON packets and binary frames
+SAMPLE_DTYPE = np.dtype([
+    ('timestamp', '<u4'),
+    ('accel_x', '<f4'), ('accel_y', '<f4'), ('accel_z', '<f4'),
+    ('gyro_x', '<f4'), ('gyro_y', '<f4'), ('gyro_z', '<f4')
+])
+SENSOR_AXES = SAMPLE_DTYPE.names[1:]
+
+@dataclass
+class SampleBlock:
+    """Columnar block of samples from one batched packet or binary frame"""
+    device_id: str
+    club: str
+    player: str
+    samples: np.ndarray    # SAMPLE_DTYPE records
+    
+    def __len__(self) -> int:
+        return len(self.samples)
+    
+    def column(self, name: str) -> np.ndarray:
+        """One column, e.g. block.column('gyro_y')"""
+        return self.samples[name]
+    
+    def to_swing_data(self) -> List[SwingData]:
+        """Per-sample SwingData objects (compatibility with per-sample callbacks)"""
+        columns = [self.samples[name].tolist() for name in SAMPLE_DTYPE.names]
+        return [SwingData(timestamp, ax, ay, az, gx, gy, gz,
+                          self.club, self.player, self.device_id)
+                for timestamp, ax, ay, az, gx, gy, gz in zip(*columns)]
+
 class SerialDataListener:
-    """Handles serial communication with M5StickC Plus2 sensor unit"""
+    """Handles serial communication with M5StickC Plus2 sensor unit
+    
+    Read modes:
+        poll   - check in_waiting every millisecond and readline() one packet
+        select - block on the port's file descriptor, read everything that
+                 is available in one call and dispatch the complete lines
+                 as a batch (partial lines wait in the buffer)
     
-    def __init__(self, port: str = '/dev/ttyUSB0', baud_rate: int = 115200):
+    Protocols:
+        json   - one JSON packet per line
+        binary - COBS framed binary records (select mode only)
+        auto   - start with JSON and switch to binary at the first 0x00
+                 byte, which never occurs in a JSON line
+    """
+    
+    READ_MODES = ('poll', 'select')
+    PROTOCOLS = ('auto', 'json', 'binary')
+    MAX_LINE_BYTES = 64 * 1024    # Drop a buffer that never sees a newline
+    MAX_FRAME_HOLDBACK = 2 * 1024 # Non-JSON tail kept for a split binary frame (auto)
+    
+    def __init__(self, port: str = '/dev/ttyUSB0', baud_rate: int = 115200,
+                 read_mode: str = 'poll', read_size: int = 4096, protocol: str = 'auto'):
+        if read_mode not in self.READ_MODES:
+            raise ValueError(f"Unknown read mode '{read_mode}', expected one of {self.READ_MODES}")
+        if protocol not in self.PROTOCOLS:
+            raise ValueError(f"Unknown protocol '{protocol}', expected one of {self.PROTOCOLS}")
+        if protocol == 'binary' and read_mode == 'poll':
+            raise ValueError("The binary protocol needs read_mode 'select'")
+        
         self.port = port
         self.baud_rate = baud_rate
+        self.read_mode = read_mode
+        self.read_size = read_size
+        self.protocol = protocol
         self.serial_connection = None
         self.is_connected = False
         self.data_callback = None
+        self.batch_callback = None
+        self.block_callback = None
+        
+        # Bulk-read state (select mode)
+        self.line_buffer = bytearray()
+        self.frame_decoder = None
+        self._wakeup_pipe = None             # Owned (created and closed) by listen_with_select()
+        self._wakeup_lock = threading.Lock()  # Guards _wakeup_pipe against disconnect() on other threads
+        self.reads = 0
+        self.packets_received = 0
+        self.parse_errors = 0
         
         # Setup logging
         self.logger = logging.getLogger(__name__)
@@ -63,6 +139,17 @@ class SerialDataListener:
     
     def disconnect(self):
         """Close serial connection"""
+        with self._wakeup_lock:
+            wakeup_pipe = self._wakeup_pipe
+            if wakeup_pipe:
+                # Wake a listener blocked in select() so it sees is_connected; the
+                # lock keeps the listener from closing the pipe under this write
+                self.is_connected = False
+                try:
+                    os.write(wakeup_pipe[1], b'\0')
+                except (OSError, TypeError):
+                    pass
+        
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
             self.is_connected = False
@@ -72,11 +159,85 @@ class SerialDataListener:
         """Set callback function for received data"""
         self.data_callback = callback
     
-    def parse_swing_data(self, json_str: str) -> Optional[SwingData]:
-        """Parse JSON string into SwingData object"""
+    def set_batch_callback(self, callback):
+        """Set callback receiving a list of SwingData per read (select mode)
+        
+        Without a batch callback the data callback is called per packet.
+        """
+        self.batch_callback = callback
+    
+    def set_block_callback(self, callback):
+        """Set callback receiving each SampleBlock (swing_batch packet or binary frame) whole
+        
+        Without a block callback, blocks are split into SwingData for the
+        batch or data callback.
+        """
+        self.block_callback = callback
+    
+    def parse_packet(self, json_str: str) -> List[Union[SwingData, SampleBlock]]:
+        """Parse one JSON line holding a single sample (SwingData) or a swing_batch (SampleBlock)"""
         try:
             data_dict = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse data: {e}")
+            return []
+        
+        if isinstance(data_dict, dict) and data_dict.get('type') == 'swing_batch':
+            block = self.parse_batch(data_dict)
+            return [block] if block else []
+        
+        swing_data = self.swing_data_from_dict(data_dict)
+        return [swing_data] if swing_data else []
+    
+    def parse_batch(self, data_dict: Dict[str, Any]) -> Optional[SampleBlock]:
+        """Decode a swing_batch packet into a columnar SampleBlock
+        
+        Timestamps are t0 plus the per-sample offsets in t. Axis arrays
+        may be scaled integers; scale.accel and scale.gyro (default 1)
+        convert them back to G and dps.
+        """
+        try:
+            for field in ('club', 'player', 't0', 't', 'sensor_data'):
+                if field not in data_dict:
+                    self.logger.warning(f"Missing field '{field}' in batch packet")
+                    return None
+            
+            offsets = data_dict['t']
+            sensor_data = data_dict['sensor_data']
+            scale = data_dict.get('scale', {})
+            
+            samples = np.empty(len(offsets), dtype=SAMPLE_DTYPE)
+            samples['timestamp'] = np.asarray(offsets, dtype=np.int64) + int(data_dict['t0'])
+            for axis in SENSOR_AXES:
+                values = sensor_data[axis]
+                if len(values) != len(offsets):
+                    self.logger.warning(f"Batch axis '{axis}' has {len(values)} values for {len(offsets)} timestamps")
+                    return None
+                samples[axis] = np.asarray(values, dtype=np.float32) * float(
+                    scale.get(axis.split('_')[0], 1.0))
             
+            return SampleBlock(
+                device_id=str(data_dict.get('device_id', 'unknown')),
+                club=str(data_dict['club']),
+                player=str(data_dict['player']),
+                samples=samples
+            )
+            
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.error(f"Failed to parse batch packet: {e}")
+            return None
+    
+    def parse_swing_data(self, json_str: str) -> Optional[SwingData]:
+        """Parse JSON string into SwingData object"""
+        try:
+            return self.swing_data_from_dict(json.loads(json_str))
+        except json.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse data: {e}")
+            return None
+    
+    def swing_data_from_dict(self, data_dict: Dict[str, Any]) -> Optional[SwingData]:
+        """Validate a single-sample packet and build its SwingData"""
+        try:
             # Validate required fields
             required_fields = ['timestamp', 'accel_x', 'accel_y', 'accel_z',
                              'gyro_x', 'gyro_y', 'gyro_z', 'club', 'player']
@@ -99,7 +260,7 @@ class SerialDataListener:
                 device_id=data_dict.get('device_id', 'unknown')
             )
             
-        except (json.JSONDecodeError, ValueError) as e:
+        except (TypeError, ValueError) as e:
             self.logger.error(f"Failed to parse data: {e}")
             return None
     
@@ -109,6 +270,10 @@ class SerialDataListener:
             self.logger.error("Not connected to sensor unit")
             return
         
+        if self.read_mode == 'select':
+            self.listen_with_select()
+            return
+        
         self.logger.info("Starting data listener...")
         
         try:
@@ -118,12 +283,8 @@ class SerialDataListener:
                     line = self.serial_connection.readline().decode('utf-8').strip()
                     
                     if line:
-                        # Parse swing data
-                        swing_data = self.parse_swing_data(line)
-                        
-                        if swing_data and self.data_callback:
-                            # Forward data to callback
-                            self.data_callback(swing_data)
+                        # Parse swing data (one sample or a whole batch) and forward it
+                        self.dispatch(self.parse_packet(line))
                         
                         self.logger.debug(f"Received: {line}")
                 
@@ -137,6 +298,212 @@ class SerialDataListener:
         finally:
             self.disconnect()
 
+    def feed(self, data: bytes) -> List[Union[SwingData, SampleBlock]]:
+        """Append received bytes to the line buffer and parse every complete line
+        
+        A trailing partial line stays in the buffer for the next read.
+        Binary frames are decoded instead once the stream is binary.
+        swing_batch packets and binary frames come back as SampleBlocks,
+        single-sample packets as SwingData.
+        """
+        if self.frame_decoder is not None:
+            return self.feed_binary(data)
+        
+        if self.protocol != 'json':
+            zero = data.find(b'\0') if self.protocol == 'auto' else 0
+            if zero >= 0:
+                # Lines completed before the first frame are still JSON; the
+                # frame may have started in bytes held in the line buffer
+                data = bytes(self.line_buffer) + data
+                zero += len(self.line_buffer)
+                self.line_buffer.clear()
+                start = self._binary_start(data, zero) if zero else 0
+                batch = self._feed_lines(data[:start], hold_back=False) if start else []
+                self._switch_to_binary()
+                return batch + self.feed_binary(data[start:])
+        
+        return self._feed_lines(data)
+    
+    @staticmethod
+    def _is_json_line(line: bytes) -> bool:
+        line = line.strip()
+        return line.startswith(b'{') and line.endswith(b'}')
+    
+    def _binary_start(self, data: bytes, zero: int) -> int:
+        """Offset in data of the first binary frame, which ends at ``zero``
+        
+        The frame may contain newline bytes and may follow a partial line,
+        so it starts at the earliest offset (within one frame's length of
+        the delimiter) that it decodes from with a valid CRC. If it is
+        corrupt, it is taken to start after the last line that still looks
+        like a JSON object.
+        """
+        from comm.binary_protocol import decode_frame
+        
+        for start in range(max(zero - self.MAX_FRAME_HOLDBACK, 0), zero):
+            try:
+                decode_frame(data[start:zero])
+                return start
+            except ValueError:
+                continue
+        
+        start = 0
+        end = data.find(b'\n')
+        while 0 <= end < zero and self._is_json_line(data[start:end]):
+            start = end + 1
+            end = data.find(b'\n', start)
+        return start
+    
+    def _feed_lines(self, data: bytes, hold_back: bool = True) -> List[Union[SwingData, SampleBlock]]:
+        buffer = self.line_buffer
+        buffer.extend(data)
+        
+        end = buffer.rfind(b'\n')
+        if end < 0:
+            if len(buffer) > self.MAX_LINE_BYTES:
+                self.logger.warning(f"Discarding {len(buffer)} bytes without a line terminator")
+                buffer.clear()
+            return []
+        
+        if hold_back and self.protocol == 'auto':
+            end = self._held_back_end(buffer, end)
+            if end < 0:
+                return []
+        
+        lines = bytes(buffer[:end]).split(b'\n')
+        del buffer[:end + 1]
+        
+        batch = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            items = self.parse_packet(line.decode('utf-8', errors='replace'))
+            if items:
+                batch.extend(items)
+            else:
+                self.parse_errors += 1
+        
+        self.packets_received += self.count_samples(batch)
+        return batch
+    
+    def _held_back_end(self, buffer: bytearray, end: int) -> int:
+        """Last newline to parse up to in auto mode, or -1 to wait
+        
+        Trailing lines that are not JSON may be the start of a binary frame
+        whose delimiter has not arrived yet; up to MAX_FRAME_HOLDBACK bytes
+        of them stay in the buffer so the switch to binary can find it.
+        """
+        while len(buffer) - end <= self.MAX_FRAME_HOLDBACK:
+            previous = buffer.rfind(b'\n', 0, end)
+            if self._is_json_line(buffer[previous + 1:end]):
+                break
+            end = previous
+            if end < 0:
+                break
+        return end
+    
+    def _switch_to_binary(self):
+        """Decode the rest of the stream as binary frames"""
+        # Imported here: comm.binary_protocol depends on SampleBlock from this module
+        from comm.binary_protocol import BinaryFrameDecoder
+        
+        self.frame_decoder = BinaryFrameDecoder()
+        if self.line_buffer:
+            self.logger.debug(f"Discarding {len(self.line_buffer)} bytes of partial line")
+            self.line_buffer.clear()
+        if self.protocol == 'auto':
+            self.logger.info("Binary frames detected, switching protocol")
+    
+    def feed_binary(self, data: bytes) -> List[SampleBlock]:
+        """Decode binary frames into columnar SampleBlocks (one per SAMPLES frame)"""
+        decoder = self.frame_decoder
+        errors_before = decoder.frame_errors
+        blocks = decoder.feed(data)
+        self.parse_errors += decoder.frame_errors - errors_before
+        self.packets_received += self.count_samples(blocks)
+        return blocks
+    
+    @staticmethod
+    def count_samples(batch: List[Union[SwingData, SampleBlock]]) -> int:
+        """Number of samples in a feed() result"""
+        return sum(len(item) if isinstance(item, SampleBlock) else 1 for item in batch)
+    
+    def dispatch(self, batch: List[Union[SwingData, SampleBlock]]):
+        """Forward a feed() result to the callbacks, in arrival order
+        
+        SampleBlocks go to the block callback whole. Without one they are
+        split into SwingData, which like single-sample packets go to the
+        batch callback as a list, or one by one to the data callback.
+        """
+        samples = []
+        for item in batch:
+            if not isinstance(item, SampleBlock):
+                samples.append(item)
+            elif self.block_callback:
+                self._dispatch_samples(samples)
+                samples = []
+                self.block_callback(item)
+            else:
+                samples.extend(item.to_swing_data())
+        self._dispatch_samples(samples)
+    
+    def _dispatch_samples(self, samples: List[SwingData]):
+        if not samples:
+            return
+        if self.batch_callback:
+            self.batch_callback(samples)
+        elif self.data_callback:
+            for swing_data in samples:
+                self.data_callback(swing_data)
+    
+    def listen_with_select(self) -> None:
+        """Listening loop that sleeps in select() until bytes arrive"""
+        fd = self.serial_connection.fileno()
+        wakeup_pipe = os.pipe()
+        with self._wakeup_lock:
+            self._wakeup_pipe = wakeup_pipe
+        selector = selectors.DefaultSelector()
+        selector.register(fd, selectors.EVENT_READ, 'serial')
+        selector.register(wakeup_pipe[0], selectors.EVENT_READ, 'wakeup')
+        self.line_buffer.clear()
+        self.frame_decoder = None
+        
+        self.logger.info("Starting data listener (select mode)...")
+        
+        try:
+            while self.is_connected:
+                for key, _ in selector.select():
+                    if key.data == 'wakeup':
+                        os.read(wakeup_pipe[0], 64)
+                        continue
+                    
+                    data = os.read(fd, self.read_size)
+                    if not data:
+                        # EOF: the device went away
+                        self.logger.warning("Serial port closed by the device")
+                        self.is_connected = False
+                        break
+                    self.reads += 1
+                    self.dispatch(self.feed(data))
+                
+        except KeyboardInterrupt:
+            self.logger.info("Data listener stopped by user")
+        except OSError as e:
+            if self.is_connected:
+                self.logger.error(f"Error in data listener: {e}")
+        except Exception as e:
+            self.logger.error(f"Error in data listener: {e}")
+        finally:
+            selector.close()
+            # Unpublish first: once disconnect() can no longer see the pipe, only
+            # this thread holds its fds and closing them cannot race a write
+            with self._wakeup_lock:
+                self._wakeup_pipe = None
+            for pipe_fd in wakeup_pipe:
+                os.close(pipe_fd)
+            self.disconnect()
+    
     def send_acknowledgment(self, data_id: str) -> bool:
         """Send acknowledgment back to sensor unit"""
         if not self.is_connected:
@@ -0,0 +1,128 @@
+"""
+Golf HILS System - SQLite Connection Management
+
+This module shares one SQLite database between the serial listener thread,
+the swing processing workers and any dashboard or statistics queries: a
+single writer connection serialized by a lock, and a small pool of
+read-only connections that can run in parallel with it.
+"""
+
+import queue
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Tuple
+
+class ConnectionManager:
+    """One locked writer connection plus a pool of read-only connections
+
+    writer() hands out the writer connection while holding a re-entrant
+    lock, so nested calls on the same thread (e.g. a migration calling a
+    helper that inserts) do not deadlock. reader() hands out a pooled
+    read-only connection, opening up to ``read_pool_size`` of them on
+    demand and blocking when all are in use.
+
+    An in-memory database cannot be opened twice, so reader() falls back
+    to the writer connection there.
+    """
+
+    # Only meaningful on the connection that writes
+    WRITER_ONLY_PRAGMAS = ('journal_mode', 'synchronous')
+
+    def __init__(self, db_path: str, pragmas: Iterable[Tuple[str, object]] = (),
+                 read_pool_size: int = 4, timeout: float = 5.0):
+        if read_pool_size < 1:
+            # reader() would wait forever for a connection that is never opened
+            raise ValueError(f"read_pool_size must be at least 1, got {read_pool_size}")
+
+        self.db_path = db_path
+        self.pragmas = tuple(pragmas)
+        self.read_pool_size = read_pool_size
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+        self.in_memory = db_path == ":memory:" or db_path.startswith("file::memory:")
+        self.write_lock = threading.RLock()
+        self.writer_connection = self._open(db_path, self.pragmas)
+
+        self._readers = queue.LifoQueue()
+        self._readers_opened = 0
+        self._readers_lock = threading.Lock()
+        self._all_readers = []
+
+    def _open(self, database: str, pragmas, uri: bool = False) -> sqlite3.Connection:
+        """Open a connection usable from any thread and apply the pragmas"""
+        connection = sqlite3.connect(database, timeout=self.timeout,
+                                     check_same_thread=False, uri=uri)
+        for pragma, value in pragmas:
+            connection.execute(f"PRAGMA {pragma} = {value}")
+        return connection
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection (the database must already exist)"""
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        pragmas = [(pragma, value) for pragma, value in self.pragmas
+                   if pragma not in self.WRITER_ONLY_PRAGMAS]
+        return self._open(uri, pragmas, uri=True)
+
+    @contextmanager
+    def writer(self):
+        """Exclusive access to the writer connection"""
+        with self.write_lock:
+            yield self.writer_connection
+
+    @contextmanager
+    def reader(self):
+        """A read-only connection from the pool"""
+        if self.in_memory:
+            with self.writer() as connection:
+                yield connection
+            return
+
+        connection = self._acquire_reader()
+        try:
+            yield connection
+        finally:
+            # Never hand a connection back with an open read transaction
+            if connection.in_transaction:
+                connection.rollback()
+            self._readers.put(connection)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Reuse an idle reader, open a new one, or wait for one"""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._readers_lock:
+            if self._readers_opened < self.read_pool_size:
+                connection = self._open_reader()
+                self._readers_opened += 1
+                self._all_readers.append(connection)
+                self.logger.debug(f"Opened read connection {self._readers_opened}/{self.read_pool_size}")
+                return connection
+
+        return self._readers.get()
+
+    def stats(self) -> dict:
+        """Reader pool usage"""
+        return {
+            'readers_opened': self._readers_opened,
+            'readers_idle': self._readers.qsize(),
+            'read_pool_size': self.read_pool_size
+        }
+
+    def close(self):
+        """Close the writer and every reader connection"""
+        with self._readers_lock:
+            for connection in self._all_readers:
+                connection.close()
+            self._all_readers = []
+            self._readers_opened = 0
+            self._readers = queue.LifoQueue()
+
+        with self.write_lock:
+            self.writer_connection.close()
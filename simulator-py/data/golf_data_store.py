@@ -9,23 +9,172 @@ import sqlite3
 import csv
 import json
 import os
+import queue
+import struct
+import threading
+import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import logging
+import zlib
+
+import numpy as np
+
+from data.connection_manager import ConnectionManager
 
 class GolfDataStore:
-    """Manages persistent storage of golf swing data and simulation results"""
+    """Manages persistent storage of golf swing data and simulation results
+    
+    With ``sample_storage="blob"`` a swing is stored as a single row whose
+    ``samples`` column holds the packed IMU samples (store_swing_samples),
+    instead of one JSON row per sample.
+    
+    With ``trajectory_storage="blob"`` a simulation result's trajectory is
+    stored as packed float32 columns (encode_trajectory) instead of a JSON
+    list of point dicts; load_trajectory() reads either format.
+    
+    With ``performance_profile`` enabled, every connection runs in WAL mode
+    with synchronous=NORMAL and a larger page cache and mmap window, and
+    the indexes used by the per-player and per-session queries are created.
+    
+    With ``write_behind`` enabled, enqueue_swing_data() only puts the row on
+    a queue; a dedicated writer thread commits the queued rows in one
+    transaction per ``batch_size`` rows or ``flush_interval_ms``, whichever
+    comes first.
+    
+    The store is safe to use from several threads: writes go through the
+    single writer connection of a ConnectionManager, and queries use its
+    pool of read-only connections so they do not wait for ingestion.
+    """
+    
+    SWING_INSERT = """
+        INSERT INTO swings (session_id, timestamp, club_name, player_name, device_id, raw_data)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    
+    SWING_BLOB_INSERT = """
+        INSERT INTO swings (session_id, timestamp, club_name, player_name, device_id,
+                            samples, sample_count, sample_encoding)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    # migrate_to_blob_storage() keeps the creation time of the original rows
+    SWING_BLOB_MIGRATE_INSERT = """
+        INSERT INTO swings (session_id, timestamp, club_name, player_name, device_id,
+                            samples, sample_count, sample_encoding, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP))
+    """
     
-    def __init__(self, db_path: str = "golf_hils_data.db"):
+    # Packed sample layout: int32 ms offsets from the swing's first timestamp,
+    # followed by an (N, 6) float32 block of accel_x..gyro_z
+    SAMPLE_ENCODINGS = ('raw-v1', 'zlib-v1')
+    SAMPLE_COLUMNS = 6
+    
+    # Packed trajectory layout: a (5, N) float32 block, one contiguous column
+    # each for time, x, y, vx, vy. The delta encoding stores each column's
+    # float32 bit patterns as uint32 differences, which is lossless and
+    # compresses far better than the raw floats.
+    TRAJECTORY_COLUMNS = ('time', 'x', 'y', 'vx', 'vy')
+    TRAJECTORY_ENCODINGS = ('f32-v1', 'f32-zlib-v1', 'f32-delta-zlib-v1')
+    TRAJECTORY_COMPRESSION = {'none': 'f32-v1', 'zlib': 'f32-zlib-v1', 'delta-zlib': 'f32-delta-zlib-v1'}
+    
+    # Applied to each connection when the performance profile is enabled.
+    # WAL lets readers run during the writer thread's commits, and
+    # synchronous=NORMAL only fsyncs at checkpoints instead of every commit.
+    PERFORMANCE_PRAGMAS = (
+        ('journal_mode', 'WAL'),
+        ('synchronous', 'NORMAL'),
+        ('mmap_size', 64 * 1024 * 1024),   # bytes
+        ('cache_size', -16 * 1024),        # negative: KiB
+        ('temp_store', 'MEMORY'),
+    )
+    
+    # Carry distance histogram per player/club for p50/p90: fixed-width bins
+    # of little-endian uint32 counts, the last bin also takes longer shots
+    DISTANCE_SKETCH_BIN_M = 2.0
+    DISTANCE_SKETCH_BINS = 200
+    
+    # Single-statement Welford update; SET expressions see the old row
+    PLAYER_STATISTICS_UPSERT = """
+        INSERT INTO player_statistics (player_name, club_name, avg_distance, max_distance,
+                                       avg_accuracy, total_swings, m2_distance, distance_sketch,
+                                       last_updated)
+        VALUES (:player, :club, :distance, :distance, 0.0, 1, 0.0,
+                distance_sketch_add(NULL, :distance), :now)
+        ON CONFLICT(player_name, club_name) DO UPDATE SET
+            total_swings = total_swings + 1,
+            avg_distance = avg_distance + (:distance - avg_distance) / (total_swings + 1),
+            m2_distance = COALESCE(m2_distance, 0.0) + (:distance - avg_distance) *
+                          (:distance - (avg_distance + (:distance - avg_distance) / (total_swings + 1))),
+            max_distance = MAX(max_distance, :distance),
+            distance_sketch = distance_sketch_add(distance_sketch, :distance),
+            last_updated = :now
+    """
+    
+    # Streaming export: rows fetched and written per chunk
+    EXPORT_CHUNK_SIZE = 5000
+    EXPORT_FORMATS = ('parquet', 'arrow')
+    EXPORT_RESULT_COLUMNS = ('carry_distance', 'max_height', 'flight_time', 'ball_speed',
+                             'launch_angle', 'spin_rate', 'landing_angle')
+    EXPORT_SAMPLE_COLUMNS = ('accel_x', 'accel_y', 'accel_z', 'gyro_x', 'gyro_y', 'gyro_z')
+    
+    PERFORMANCE_INDEXES = (
+        ('idx_swings_player_created', 'swings(player_name, created_at)'),
+        ('idx_swings_session', 'swings(session_id)'),
+        ('idx_simulation_results_swing', 'simulation_results(swing_id)'),
+    )
+    
+    def __init__(self, db_path: str = "golf_hils_data.db", write_behind: bool = False,
+                 batch_size: int = 100, flush_interval_ms: float = 200.0,
+                 sample_storage: str = "json", compress_samples: bool = False,
+                 trajectory_storage: str = "json", trajectory_compression: str = "none",
+                 performance_profile: bool = False, read_pool_size: int = 4):
+        if sample_storage not in ('json', 'blob'):
+            raise ValueError(f"Unknown sample storage '{sample_storage}', expected 'json' or 'blob'")
+        if trajectory_storage not in ('json', 'blob'):
+            raise ValueError(f"Unknown trajectory storage '{trajectory_storage}', expected 'json' or 'blob'")
+        if trajectory_compression not in self.TRAJECTORY_COMPRESSION:
+            raise ValueError(f"Unknown trajectory compression '{trajectory_compression}', "
+                             f"expected one of {list(self.TRAJECTORY_COMPRESSION)}")
+        
         self.db_path = db_path
+        self.sample_storage = sample_storage      # json: one row per sample, blob: one row per swing
+        self.compress_samples = compress_samples
+        self.trajectory_storage = trajectory_storage  # json: list of point dicts, blob: packed columns
+        self.trajectory_compression = trajectory_compression
+        self.performance_profile = performance_profile
+        self.read_pool_size = read_pool_size
         self.logger = logging.getLogger(__name__)
-        self.connection = None
+        self.connections = None
+        self.connection = None  # Writer connection; other threads go through connections.writer()
         self.init_database()
+        
+        # Write-behind queue
+        self.write_behind = write_behind
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.write_queue = queue.Queue()
+        self.writer_thread = None
+        self.rows_written = 0
+        self.batches_committed = 0
+        self.last_commit_ms = 0.0
+        self.max_commit_ms = 0.0
+        self.total_commit_ms = 0.0
+        
+        if self.write_behind:
+            self.writer_thread = threading.Thread(target=self._writer_loop,
+                                                  name="GolfDataStoreWriter", daemon=True)
+            self.writer_thread.start()
     
     def init_database(self):
         """Initialize SQLite database with required tables"""
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            self.connections = ConnectionManager(
+                self.db_path,
+                self.PERFORMANCE_PRAGMAS if self.performance_profile else (),
+                read_pool_size=self.read_pool_size
+            )
+            self.connection = self.connections.writer_connection
             cursor = self.connection.cursor()
             
             # Create sessions table
@@ -52,10 +201,20 @@ class GolfDataStore:
                     device_id TEXT,
                     raw_data TEXT,  -- JSON string of swing data
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    samples BLOB,  -- Packed samples of a whole swing (blob storage)
+                    sample_count INTEGER,
+                    sample_encoding TEXT,
                     FOREIGN KEY (session_id) REFERENCES sessions (id)
                 )
             """)
             
+            # Databases created before blob storage lack the packed sample columns
+            existing_columns = {row[1] for row in cursor.execute("PRAGMA table_info(swings)")}
+            for column, column_type in (('samples', 'BLOB'), ('sample_count', 'INTEGER'),
+                                        ('sample_encoding', 'TEXT')):
+                if column not in existing_columns:
+                    cursor.execute(f"ALTER TABLE swings ADD COLUMN {column} {column_type}")
+            
             # Create simulation_results table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS simulation_results (
@@ -70,10 +229,20 @@ class GolfDataStore:
                     landing_angle REAL,
                     trajectory_data TEXT,  -- JSON string of trajectory points
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    trajectory_blob BLOB,  -- Packed trajectory columns (blob storage)
+                    trajectory_points INTEGER,
+                    trajectory_encoding TEXT,
+                    landed INTEGER,  -- 0 if the ball was still airborne at the flight time cap
                     FOREIGN KEY (swing_id) REFERENCES swings (id)
                 )
             """)
             
+            existing_columns = {row[1] for row in cursor.execute("PRAGMA table_info(simulation_results)")}
+            for column, column_type in (('trajectory_blob', 'BLOB'), ('trajectory_points', 'INTEGER'),
+                                        ('trajectory_encoding', 'TEXT'), ('landed', 'INTEGER')):
+                if column not in existing_columns:
+                    cursor.execute(f"ALTER TABLE simulation_results ADD COLUMN {column} {column_type}")
+            
             # Create player_statistics table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS player_statistics (
@@ -85,10 +254,25 @@ class GolfDataStore:
                     avg_accuracy REAL,
                     total_swings INTEGER,
                     last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    m2_distance REAL DEFAULT 0.0,  -- Welford sum of squared deviations
+                    distance_sketch BLOB,  -- Carry distance histogram for percentiles
                     UNIQUE(player_name, club_name)
                 )
             """)
             
+            existing_columns = {row[1] for row in cursor.execute("PRAGMA table_info(player_statistics)")}
+            for column, column_type in (('m2_distance', 'REAL DEFAULT 0.0'), ('distance_sketch', 'BLOB')):
+                if column not in existing_columns:
+                    cursor.execute(f"ALTER TABLE player_statistics ADD COLUMN {column} {column_type}")
+            
+            # Used by PLAYER_STATISTICS_UPSERT, which only runs on the writer connection
+            self.connection.create_function("distance_sketch_add", 2, self.distance_sketch_add,
+                                            deterministic=True)
+            
+            if self.performance_profile:
+                for index_name, definition in self.PERFORMANCE_INDEXES:
+                    cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {definition}")
+            
             self.connection.commit()
             self.logger.info("Database initialized successfully")
             
@@ -100,235 +284,910 @@ class GolfDataStore:
                       weather_conditions: str = "", notes: str = "") -> int:
         """Create a new practice session"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO sessions (session_date, player_name, location, weather_conditions, notes)
-                VALUES (?, ?, ?, ?, ?)
-            """, (datetime.now().isoformat(), player_name, location, weather_conditions, notes))
-            
-            self.connection.commit()
-            session_id = cursor.lastrowid
-            self.logger.info(f"Created session {session_id} for {player_name}")
-            return session_id
+            with self.connections.writer() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    INSERT INTO sessions (session_date, player_name, location, weather_conditions, notes)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (datetime.now().isoformat(), player_name, location, weather_conditions, notes))
+                
+                connection.commit()
+                session_id = cursor.lastrowid
+                self.logger.info(f"Created session {session_id} for {player_name}")
+                return session_id
             
         except sqlite3.Error as e:
             self.logger.error(f"Error creating session: {e}")
             raise
     
+    @staticmethod
+    def _swing_row(session_id: int, swing_data: Dict[str, Any]) -> tuple:
+        """Parameters for SWING_INSERT"""
+        return (
+            session_id,
+            swing_data.get('timestamp', int(datetime.now().timestamp() * 1000)),
+            swing_data.get('club', 'Unknown'),
+            swing_data.get('player', 'Unknown'),
+            swing_data.get('device_id', 'Unknown'),
+            json.dumps(swing_data)
+        )
+    
     def store_swing_data(self, session_id: int, swing_data: Dict[str, Any]) -> int:
         """Store swing data from sensor"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO swings (session_id, timestamp, club_name, player_name, device_id, raw_data)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                session_id,
-                swing_data.get('timestamp', int(datetime.now().timestamp() * 1000)),
-                swing_data.get('club', 'Unknown'),
-                swing_data.get('player', 'Unknown'),
-                swing_data.get('device_id', 'Unknown'),
-                json.dumps(swing_data)
-            ))
-            
-            self.connection.commit()
-            swing_id = cursor.lastrowid
-            self.logger.debug(f"Stored swing data with ID {swing_id}")
-            return swing_id
+            with self.connections.writer() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self.SWING_INSERT, self._swing_row(session_id, swing_data))
+                
+                connection.commit()
+                swing_id = cursor.lastrowid
+                self.logger.debug(f"Stored swing data with ID {swing_id}")
+                return swing_id
             
         except sqlite3.Error as e:
             self.logger.error(f"Error storing swing data: {e}")
             raise
     
-    def store_simulation_result(self, swing_id: int, simulation_result: Dict[str, Any]) -> int:
-        """Store simulation results"""
-        try:
-            cursor = self.connection.cursor()
-            results = simulation_result.get('results', {})
-            launch_conditions = simulation_result.get('launch_conditions', {})
+    def enqueue_swing_data(self, session_id: int, swing_data: Dict[str, Any]):
+        """Store swing data without waiting for the disk (write-behind)
+        
+        Falls back to store_swing_data() when write-behind is disabled.
+        """
+        if not self.write_behind:
+            self.store_swing_data(session_id, swing_data)
+            return
+        
+        self.write_queue.put(self._swing_row(session_id, swing_data))
+    
+    def _writer_loop(self):
+        """Writer thread: commit queued rows in batches"""
+        running = True
+        
+        while running:
+            row = self.write_queue.get()
+            if row is None:
+                self.write_queue.task_done()
+                break
             
-            cursor.execute("""
-                INSERT INTO simulation_results (
-                    swing_id, carry_distance, max_height, flight_time, 
-                    ball_speed, launch_angle, spin_rate, landing_angle, trajectory_data
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                swing_id,
-                results.get('carry_distance', 0),
-                results.get('max_height', 0),
-                results.get('flight_time', 0),
-                launch_conditions.get('ball_speed', 0),
-                launch_conditions.get('launch_angle', 0),
-                launch_conditions.get('spin_rate', 0),
-                results.get('landing_angle', 0),
-                json.dumps([
-                    {
-                        'time': p.time,
-                        'x': p.x,
-                        'y': p.y,
-                        'vx': p.velocity_x,
-                        'vy': p.velocity_y
-                    } for p in simulation_result.get('trajectory', [])
-                ])
-            ))
+            # Collect more rows until the batch is full or the interval elapses
+            batch = [row]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    row = self.write_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if row is None:
+                    running = False
+                    self.write_queue.task_done()
+                    break
+                batch.append(row)
             
-            self.connection.commit()
-            result_id = cursor.lastrowid
-            self.logger.debug(f"Stored simulation result with ID {result_id}")
-            return result_id
+            self._commit_batch(batch)
+            for _ in batch:
+                self.write_queue.task_done()
+    
+    def _commit_batch(self, batch: List[tuple]):
+        """Insert a batch of swing rows in one transaction on the writer connection"""
+        try:
+            with self.connections.writer() as connection:
+                start = time.perf_counter()
+                with connection:
+                    connection.executemany(self.SWING_INSERT, batch)
+                elapsed_ms = (time.perf_counter() - start) * 1000.0
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing batch of {len(batch)} swing rows: {e}")
+            return
+        
+        self.rows_written += len(batch)
+        self.batches_committed += 1
+        self.last_commit_ms = elapsed_ms
+        self.max_commit_ms = max(self.max_commit_ms, elapsed_ms)
+        self.total_commit_ms += elapsed_ms
+    
+    def flush(self):
+        """Block until every queued row has been committed"""
+        if self.write_behind:
+            self.write_queue.join()
+    
+    def get_write_stats(self) -> Dict[str, Any]:
+        """Write-behind queue depth and commit latency"""
+        return {
+            'queue_depth': self.write_queue.qsize(),
+            'rows_written': self.rows_written,
+            'batches_committed': self.batches_committed,
+            'last_commit_ms': self.last_commit_ms,
+            'max_commit_ms': self.max_commit_ms,
+            'avg_commit_ms': (self.total_commit_ms / self.batches_committed
+                              if self.batches_committed else 0.0)
+        }
+    
+    @classmethod
+    def encode_swing_samples(cls, timestamps, samples, compress: bool = False) -> tuple:
+        """Pack samples into (start_timestamp, blob, encoding)"""
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        samples = np.asarray(samples, dtype='<f4').reshape(-1, cls.SAMPLE_COLUMNS)
+        start_timestamp = int(timestamps[0]) if len(timestamps) else 0
+        
+        blob = (timestamps - start_timestamp).astype('<i4').tobytes() + samples.tobytes()
+        if compress:
+            return start_timestamp, zlib.compress(blob, 6), 'zlib-v1'
+        return start_timestamp, blob, 'raw-v1'
+    
+    @classmethod
+    def decode_swing_samples(cls, blob: bytes, encoding: str, start_timestamp: int,
+                             sample_count: int) -> tuple:
+        """Unpack a samples blob into (timestamps int64, (N, 6) float32 samples)
+        
+        The samples array is a read-only view on the blob for 'raw-v1'.
+        """
+        if encoding == 'zlib-v1':
+            blob = zlib.decompress(blob)
+        elif encoding != 'raw-v1':
+            raise ValueError(f"Unknown sample encoding '{encoding}'")
+        
+        offsets = np.frombuffer(blob, dtype='<i4', count=sample_count)
+        samples = np.frombuffer(blob, dtype='<f4', offset=4 * sample_count,
+                                count=sample_count * cls.SAMPLE_COLUMNS)
+        return offsets + np.int64(start_timestamp), samples.reshape(sample_count, cls.SAMPLE_COLUMNS)
+    
+    def store_swing_samples(self, session_id: int, timestamps, samples, club: str,
+                            player: str, device_id: str = 'Unknown') -> int:
+        """Store a whole swing as one row with packed samples"""
+        start_timestamp, blob, encoding = self.encode_swing_samples(
+            timestamps, samples, self.compress_samples
+        )
+        
+        try:
+            with self.connections.writer() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self.SWING_BLOB_INSERT, (
+                    session_id, start_timestamp, club, player, device_id,
+                    blob, len(timestamps), encoding
+                ))
+                
+                connection.commit()
+                swing_id = cursor.lastrowid
+                self.logger.debug(f"Stored {len(timestamps)} packed samples with swing ID {swing_id}")
+                return swing_id
             
         except sqlite3.Error as e:
-            self.logger.error(f"Error storing simulation result: {e}")
+            self.logger.error(f"Error storing swing samples: {e}")
             raise
     
-    def update_player_statistics(self, player_name: str, club_name: str, distance: float):
-        """Update player statistics with new swing data"""
+    def get_swing_samples(self, swing_id: int) -> Optional[tuple]:
+        """(timestamps, (N, 6) samples) of a blob-stored swing, or None"""
         try:
-            cursor = self.connection.cursor()
+            with self.connections.reader() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT samples, sample_encoding, timestamp, sample_count
+                    FROM swings WHERE id = ? AND samples IS NOT NULL
+                """, (swing_id,))
+                row = cursor.fetchone()
             
-            # Get current statistics
-            cursor.execute("""
-                SELECT avg_distance, max_distance, total_swings 
-                FROM player_statistics 
-                WHERE player_name = ? AND club_name = ?
-            """, (player_name, club_name))
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading swing samples: {e}")
+            return None
+        
+        if row is None:
+            return None
+        return self.decode_swing_samples(row[0], row[1], row[2], row[3])
+    
+    def iter_swing_samples(self, session_id: Optional[int] = None):
+        """Yield (swing_id, timestamps, samples) for blob-stored swings"""
+        query = """
+            SELECT id, samples, sample_encoding, timestamp, sample_count
+            FROM swings WHERE samples IS NOT NULL
+        """
+        params = ()
+        if session_id is not None:
+            query += " AND session_id = ?"
+            params = (session_id,)
+        
+        # The read connection stays checked out until the generator is exhausted or closed
+        with self.connections.reader() as connection:
+            cursor = connection.execute(query + " ORDER BY id", params)
+            for swing_id, blob, encoding, start_timestamp, sample_count in cursor:
+                timestamps, samples = self.decode_swing_samples(blob, encoding, start_timestamp, sample_count)
+                yield swing_id, timestamps, samples
+    
+    def migrate_to_blob_storage(self, gap_ms: int = 500) -> int:
+        """Convert JSON-per-sample swing rows into one packed row per swing
+        
+        Rows of the same session/device/club/player are grouped into a swing
+        until the gap between timestamps exceeds ``gap_ms``. Simulation
+        results pointing at any of the old rows are re-pointed at the new
+        swing row, and the old rows are deleted. The new row keeps the
+        earliest created_at of the rows it replaces. Returns the number of
+        swings created.
+        """
+        fields = ('accel_x', 'accel_y', 'accel_z', 'gyro_x', 'gyro_y', 'gyro_z')
+        created = 0
+        group_key = None
+        group = None
+        
+        def flush_group():
+            nonlocal created
+            if not group or not group['timestamps']:
+                return
+            swing_id = self._insert_blob_row(group)
+            placeholders = ','.join('?' * len(group['ids']))
+            self.connection.execute(
+                f"UPDATE simulation_results SET swing_id = ? WHERE swing_id IN ({placeholders})",
+                [swing_id] + group['ids']
+            )
+            self.connection.execute(f"DELETE FROM swings WHERE id IN ({placeholders})", group['ids'])
+            created += 1
+        
+        try:
+            # Holds the write lock for the whole migration (an offline maintenance step)
+            with self.connections.writer() as connection, connection:
+                rows = connection.execute("""
+                    SELECT id, session_id, timestamp, club_name, player_name, device_id, raw_data,
+                           created_at
+                    FROM swings
+                    WHERE samples IS NULL AND raw_data IS NOT NULL
+                    ORDER BY session_id, device_id, player_name, club_name, timestamp, id
+                """).fetchall()
+                for row_id, session_id, timestamp, club, player, device_id, raw_data, created_at in rows:
+                    key = (session_id, device_id, player, club)
+                    if (key != group_key or group is None or
+                            timestamp - group['timestamps'][-1] > gap_ms):
+                        flush_group()
+                        group_key = key
+                        group = {'key': key, 'ids': [], 'timestamps': [], 'samples': [],
+                                 'created_at': None}
+                    
+                    group['ids'].append(row_id)
+                    if created_at is not None and (group['created_at'] is None or
+                                                   created_at < group['created_at']):
+                        group['created_at'] = created_at
+                    # process_swing stored a duplicate of each swing's first sample
+                    if group['timestamps'] and timestamp == group['timestamps'][-1]:
+                        continue
+                    
+                    try:
+                        sample = json.loads(raw_data)
+                        group['samples'].append([float(sample.get(field, 0.0)) for field in fields])
+                        group['timestamps'].append(timestamp)
+                    except (json.JSONDecodeError, TypeError, ValueError):
+                        self.logger.warning(f"Skipping unreadable swing row {row_id}")
+                flush_group()
             
-            result = cursor.fetchone()
+            self.logger.info(f"Migrated JSON swing rows into {created} packed swings")
+            return created
             
-            if result:
-                # Update existing statistics
-                avg_distance, max_distance, total_swings = result
-                new_total_swings = total_swings + 1
-                new_avg_distance = ((avg_distance * total_swings) + distance) / new_total_swings
-                new_max_distance = max(max_distance, distance)
-                
+        except sqlite3.Error as e:
+            self.logger.error(f"Error migrating to blob storage: {e}")
+            raise
+    
+    def _insert_blob_row(self, group: Dict[str, Any]) -> int:
+        """Insert one migrated swing (inside the caller's transaction)"""
+        session_id, device_id, player, club = group['key']
+        start_timestamp, blob, encoding = self.encode_swing_samples(
+            group['timestamps'], group['samples'], self.compress_samples
+        )
+        cursor = self.connection.execute(self.SWING_BLOB_MIGRATE_INSERT, (
+            session_id, start_timestamp, club, player, device_id,
+            blob, len(group['timestamps']), encoding, group['created_at']
+        ))
+        return cursor.lastrowid
+    
+    def store_simulation_result(self, swing_id: int, simulation_result: Dict[str, Any]) -> int:
+        """Store simulation results"""
+        results = simulation_result.get('results', {})
+        launch_conditions = simulation_result.get('launch_conditions', {})
+        trajectory = simulation_result.get('trajectory', [])
+        
+        # Serialize before taking the write lock
+        trajectory_data = None
+        trajectory_blob = trajectory_points = trajectory_encoding = None
+        if self.trajectory_storage == 'blob':
+            trajectory_blob, trajectory_points, trajectory_encoding = self.encode_trajectory(
+                trajectory, self.trajectory_compression
+            )
+        else:
+            trajectory_data = json.dumps(self._trajectory_to_records(trajectory))
+        
+        try:
+            with self.connections.writer() as connection:
+                cursor = connection.cursor()
                 cursor.execute("""
-                    UPDATE player_statistics 
-                    SET avg_distance = ?, max_distance = ?, total_swings = ?, last_updated = ?
-                    WHERE player_name = ? AND club_name = ?
-                """, (new_avg_distance, new_max_distance, new_total_swings, 
-                      datetime.now().isoformat(), player_name, club_name))
-            else:
-                # Insert new statistics
+                    INSERT INTO simulation_results (
+                        swing_id, carry_distance, max_height, flight_time, 
+                        ball_speed, launch_angle, spin_rate, landing_angle, trajectory_data,
+                        trajectory_blob, trajectory_points, trajectory_encoding, landed
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    swing_id,
+                    results.get('carry_distance', 0),
+                    results.get('max_height', 0),
+                    results.get('flight_time', 0),
+                    launch_conditions.get('ball_speed', 0),
+                    launch_conditions.get('launch_angle', 0),
+                    launch_conditions.get('spin_rate', 0),
+                    results.get('landing_angle', 0),
+                    trajectory_data,
+                    trajectory_blob,
+                    trajectory_points,
+                    trajectory_encoding,
+                    int(results.get('landed', True))
+                ))
+                
+                connection.commit()
+                result_id = cursor.lastrowid
+                self.logger.debug(f"Stored simulation result with ID {result_id}")
+                return result_id
+            
+        except sqlite3.Error as e:
+            self.logger.error(f"Error storing simulation result: {e}")
+            raise
+    
+    @staticmethod
+    def _trajectory_to_records(trajectory) -> List[Dict[str, float]]:
+        """Trajectory as a list of point dicts for JSON storage"""
+        if hasattr(trajectory, 'velocity_x') and not isinstance(trajectory, list):
+            # Columnar TrajectoryArray: read the column views directly
+            columns = (trajectory.time, trajectory.x, trajectory.y,
+                       trajectory.velocity_x, trajectory.velocity_y)
+            return [
+                {'time': t, 'x': x, 'y': y, 'vx': vx, 'vy': vy}
+                for t, x, y, vx, vy in zip(*(column.tolist() for column in columns))
+            ]
+        
+        return [
+            {
+                'time': p.time,
+                'x': p.x,
+                'y': p.y,
+                'vx': p.velocity_x,
+                'vy': p.velocity_y
+            } for p in trajectory
+        ]
+    
+    @classmethod
+    def _trajectory_columns(cls, trajectory) -> np.ndarray:
+        """(5, N) array of time, x, y, vx, vy from any trajectory representation
+        
+        Accepts a TrajectoryArray, a dict of columns (load_trajectory), a list
+        of TrajectoryPoint objects or a list of point dicts (legacy JSON).
+        """
+        if hasattr(trajectory, 'velocity_x') and not isinstance(trajectory, list):
+            return np.vstack((trajectory.time, trajectory.x, trajectory.y,
+                              trajectory.velocity_x, trajectory.velocity_y))
+        
+        if isinstance(trajectory, dict):
+            return np.vstack([np.asarray(trajectory[column], dtype=float)
+                              for column in cls.TRAJECTORY_COLUMNS])
+        
+        if len(trajectory) and isinstance(trajectory[0], dict):
+            rows = [[point[column] for column in cls.TRAJECTORY_COLUMNS] for point in trajectory]
+        else:
+            rows = [[p.time, p.x, p.y, p.velocity_x, p.velocity_y] for p in trajectory]
+        return np.array(rows, dtype=float).reshape(-1, len(cls.TRAJECTORY_COLUMNS)).T
+    
+    @classmethod
+    def encode_trajectory(cls, trajectory, compression: str = "none") -> tuple:
+        """Pack a trajectory into (blob, point_count, encoding)"""
+        encoding = cls.TRAJECTORY_COMPRESSION.get(compression)
+        if encoding is None:
+            raise ValueError(f"Unknown trajectory compression '{compression}'")
+        
+        columns = np.ascontiguousarray(cls._trajectory_columns(trajectory), dtype='<f4')
+        point_count = columns.shape[1]
+        
+        if encoding == 'f32-delta-zlib-v1':
+            bits = columns.view('<u4')
+            deltas = np.diff(bits, axis=1, prepend=np.zeros((len(bits), 1), dtype='<u4'))
+            return zlib.compress(deltas.tobytes(), 6), point_count, encoding
+        if encoding == 'f32-zlib-v1':
+            return zlib.compress(columns.tobytes(), 6), point_count, encoding
+        return columns.tobytes(), point_count, encoding
+    
+    @classmethod
+    def decode_trajectory(cls, blob: bytes, encoding: str, point_count: int) -> Dict[str, np.ndarray]:
+        """Unpack a trajectory blob into a dict of float32 column arrays
+        
+        The columns are read-only views on the blob for 'f32-v1'.
+        """
+        shape = (len(cls.TRAJECTORY_COLUMNS), point_count)
+        if encoding == 'f32-v1':
+            columns = np.frombuffer(blob, dtype='<f4').reshape(shape)
+        elif encoding == 'f32-zlib-v1':
+            columns = np.frombuffer(zlib.decompress(blob), dtype='<f4').reshape(shape)
+        elif encoding == 'f32-delta-zlib-v1':
+            deltas = np.frombuffer(zlib.decompress(blob), dtype='<u4').reshape(shape)
+            # uint32 cumsum wraps around exactly like the diff did
+            columns = np.cumsum(deltas, axis=1, dtype='<u4').view('<f4')
+        else:
+            raise ValueError(f"Unknown trajectory encoding '{encoding}'")
+        return dict(zip(cls.TRAJECTORY_COLUMNS, columns))
+    
+    def load_trajectory(self, result_id: int) -> Optional[Dict[str, np.ndarray]]:
+        """Trajectory of a simulation result as {'time', 'x', 'y', 'vx', 'vy'} arrays
+        
+        Reads packed rows directly and converts legacy JSON rows. Returns
+        None if the result does not exist or has no readable trajectory.
+        """
+        try:
+            with self.connections.reader() as connection:
+                cursor = connection.cursor()
                 cursor.execute("""
-                    INSERT INTO player_statistics 
-                    (player_name, club_name, avg_distance, max_distance, avg_accuracy, total_swings)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (player_name, club_name, distance, distance, 0.0, 1))
+                    SELECT trajectory_blob, trajectory_encoding, trajectory_points, trajectory_data
+                    FROM simulation_results WHERE id = ?
+                """, (result_id,))
+                row = cursor.fetchone()
             
-            self.connection.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading trajectory: {e}")
+            return None
+        
+        if row is None:
+            return None
+        
+        blob, encoding, point_count, trajectory_data = row
+        if blob is not None:
+            return self.decode_trajectory(blob, encoding, point_count)
+        if trajectory_data is None:
+            return None
+        
+        try:
+            columns = self._trajectory_columns(json.loads(trajectory_data))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            self.logger.warning(f"Unreadable trajectory in simulation result {result_id}")
+            return None
+        return dict(zip(self.TRAJECTORY_COLUMNS, columns))
+    
+    def convert_trajectories_to_blob(self, batch_size: int = 500) -> int:
+        """Re-encode legacy JSON trajectories as packed blobs
+        
+        Uses the store's trajectory_compression. Rows are converted in
+        batches of ``batch_size``, one transaction per batch, and the JSON
+        text is cleared once the blob is written. The write lock is only
+        held for each batch's UPDATE, so ingestion can continue meanwhile.
+        Returns the number of rows converted.
+        """
+        converted = 0
+        last_id = 0
+        
+        try:
+            while True:
+                with self.connections.reader() as connection:
+                    rows = connection.execute("""
+                        SELECT id, trajectory_data FROM simulation_results
+                        WHERE id > ? AND trajectory_blob IS NULL AND trajectory_data IS NOT NULL
+                        ORDER BY id LIMIT ?
+                    """, (last_id, batch_size)).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                
+                updates = []
+                for result_id, trajectory_data in rows:
+                    try:
+                        blob, point_count, encoding = self.encode_trajectory(
+                            json.loads(trajectory_data), self.trajectory_compression
+                        )
+                    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                        self.logger.warning(f"Skipping unreadable trajectory in simulation result {result_id}")
+                        continue
+                    updates.append((blob, point_count, encoding, result_id))
+                
+                with self.connections.writer() as connection, connection:
+                    connection.executemany("""
+                        UPDATE simulation_results
+                        SET trajectory_blob = ?, trajectory_points = ?, trajectory_encoding = ?,
+                            trajectory_data = NULL
+                        WHERE id = ?
+                    """, updates)
+                converted += len(updates)
+            
+            self.logger.info(f"Converted {converted} trajectories to blob storage")
+            return converted
+            
+        except sqlite3.Error as e:
+            self.logger.error(f"Error converting trajectories to blob storage: {e}")
+            raise
+    
+    @classmethod
+    def distance_sketch_add(cls, sketch: Optional[bytes], distance: float) -> bytes:
+        """Return the histogram sketch with one more carry distance counted"""
+        counts = bytearray(sketch) if sketch else bytearray(4 * cls.DISTANCE_SKETCH_BINS)
+        index = min(max(int(distance // cls.DISTANCE_SKETCH_BIN_M), 0), cls.DISTANCE_SKETCH_BINS - 1)
+        count, = struct.unpack_from('<I', counts, 4 * index)
+        struct.pack_into('<I', counts, 4 * index, count + 1)
+        return bytes(counts)
+    
+    @classmethod
+    def distance_sketch_quantile(cls, sketch: Optional[bytes], quantile: float) -> Optional[float]:
+        """Approximate carry distance quantile, interpolated within a bin"""
+        if not sketch:
+            return None
+        counts = np.frombuffer(sketch, dtype='<u4')
+        cumulative = np.cumsum(counts, dtype=np.int64)
+        total = int(cumulative[-1])
+        if total == 0:
+            return None
+        
+        rank = quantile * total
+        index = min(int(np.searchsorted(cumulative, rank)), len(counts) - 1)
+        below = int(cumulative[index - 1]) if index else 0
+        fraction = (rank - below) / counts[index] if counts[index] else 0.0
+        return float((index + fraction) * cls.DISTANCE_SKETCH_BIN_M)
+    
+    def update_player_statistics(self, player_name: str, club_name: str, distance: float):
+        """Update player statistics with new swing data (one UPSERT, O(1) per shot)"""
+        try:
+            with self.connections.writer() as connection:
+                connection.execute(self.PLAYER_STATISTICS_UPSERT, {
+                    'player': player_name,
+                    'club': club_name,
+                    'distance': float(distance),
+                    'now': datetime.now().isoformat()
+                })
+                connection.commit()
             
         except sqlite3.Error as e:
             self.logger.error(f"Error updating player statistics: {e}")
             raise
     
     def get_player_statistics(self, player_name: str) -> List[Dict[str, Any]]:
-        """Get statistics for a specific player"""
+        """Get statistics for a specific player
+        
+        std_distance is the sample standard deviation; p50/p90 come from the
+        histogram sketch. For rows created before these columns existed they
+        only cover the shots recorded since (p50/p90 are None until then).
+        """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT club_name, avg_distance, max_distance, total_swings, last_updated
-                FROM player_statistics 
-                WHERE player_name = ?
-                ORDER BY club_name
-            """, (player_name,))
-            
-            results = cursor.fetchall()
-            return [
-                {
-                    'club_name': row[0],
-                    'avg_distance': row[1],
-                    'max_distance': row[2],
-                    'total_swings': row[3],
-                    'last_updated': row[4]
-                }
-                for row in results
-            ]
+            with self.connections.reader() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT club_name, avg_distance, max_distance, total_swings, last_updated,
+                           m2_distance, distance_sketch
+                    FROM player_statistics 
+                    WHERE player_name = ?
+                    ORDER BY club_name
+                """, (player_name,))
+                
+                results = cursor.fetchall()
             
         except sqlite3.Error as e:
             self.logger.error(f"Error retrieving player statistics: {e}")
             return []
+        
+        return [
+            {
+                'club_name': row[0],
+                'avg_distance': row[1],
+                'max_distance': row[2],
+                'total_swings': row[3],
+                'last_updated': row[4],
+                'std_distance': (row[5] / (row[3] - 1)) ** 0.5 if row[5] and row[3] > 1 else 0.0,
+                'p50_distance': self._sketch_quantile(row[6], 0.5, row[2]),
+                'p90_distance': self._sketch_quantile(row[6], 0.9, row[2])
+            }
+            for row in results
+        ]
+    
+    @classmethod
+    def _sketch_quantile(cls, sketch: Optional[bytes], quantile: float,
+                         max_distance: Optional[float]) -> Optional[float]:
+        """Sketch quantile capped at the exact maximum (the bins are coarser)"""
+        value = cls.distance_sketch_quantile(sketch, quantile)
+        if value is None or max_distance is None:
+            return value
+        return min(value, max_distance)
     
     def get_recent_swings(self, player_name: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent swings for a player"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT s.timestamp, s.club_name, s.player_name, sr.carry_distance, sr.max_height
-                FROM swings s
-                LEFT JOIN simulation_results sr ON s.id = sr.swing_id
-                WHERE s.player_name = ?
-                ORDER BY s.created_at DESC
-                LIMIT ?
-            """, (player_name, limit))
-            
-            results = cursor.fetchall()
-            return [
-                {
-                    'timestamp': row[0],
-                    'club_name': row[1],
-                    'player_name': row[2],
-                    'carry_distance': row[3],
-                    'max_height': row[4]
-                }
-                for row in results
-            ]
+            with self.connections.reader() as connection:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT s.timestamp, s.club_name, s.player_name, sr.carry_distance, sr.max_height
+                    FROM swings s
+                    LEFT JOIN simulation_results sr ON s.id = sr.swing_id
+                    WHERE s.player_name = ?
+                    ORDER BY s.created_at DESC
+                    LIMIT ?
+                """, (player_name, limit))
+                
+                results = cursor.fetchall()
+                return [
+                    {
+                        'timestamp': row[0],
+                        'club_name': row[1],
+                        'player_name': row[2],
+                        'carry_distance': row[3],
+                        'max_height': row[4]
+                    }
+                    for row in results
+                ]
             
         except sqlite3.Error as e:
             self.logger.error(f"Error retrieving recent swings: {e}")
             return []
     
-    def export_to_csv(self, output_dir: str = "exports") -> str:
-        """Export all data to CSV files"""
+    @staticmethod
+    def _export_filters(player_name: Optional[str] = None, session_id: Optional[int] = None,
+                        start_date=None, end_date=None) -> tuple:
+        """WHERE conditions on the swings table (alias ``s``) and their parameters
+        
+        start_date is inclusive and end_date exclusive; both compare against
+        created_at and accept a datetime, a date or an ISO string.
+        """
+        def as_text(value):
+            if isinstance(value, datetime):
+                return value.strftime('%Y-%m-%d %H:%M:%S')
+            return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+        
+        conditions, params = [], []
+        if player_name is not None:
+            conditions.append("s.player_name = ?")
+            params.append(player_name)
+        if session_id is not None:
+            conditions.append("s.session_id = ?")
+            params.append(session_id)
+        if start_date is not None:
+            conditions.append("s.created_at >= ?")
+            params.append(as_text(start_date))
+        if end_date is not None:
+            conditions.append("s.created_at < ?")
+            params.append(as_text(end_date))
+        return conditions, params
+    
+    @staticmethod
+    def _where(conditions: List[str]) -> str:
+        return " WHERE " + " AND ".join(conditions) if conditions else ""
+    
+    @staticmethod
+    def _fetch_chunks(cursor: sqlite3.Cursor, chunk_size: int):
+        """Yield lists of at most chunk_size rows until the cursor is exhausted"""
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield rows
+    
+    def export_to_csv(self, output_dir: str = "exports", player_name: Optional[str] = None,
+                      session_id: Optional[int] = None, start_date=None, end_date=None,
+                      chunk_size: int = EXPORT_CHUNK_SIZE) -> str:
+        """Export all data to CSV files
+        
+        Rows are streamed in chunks of ``chunk_size`` so memory stays flat
+        regardless of database size. The filters select swings by player,
+        session and created_at range.
+        """
         try:
             os.makedirs(output_dir, exist_ok=True)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            conditions, params = self._export_filters(player_name, session_id, start_date, end_date)
             
-            # Export swings with simulation results
-            swings_file = os.path.join(output_dir, f"swings_{timestamp}.csv")
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT s.timestamp, s.club_name, s.player_name, 
-                       sr.carry_distance, sr.max_height, sr.flight_time,
-                       sr.ball_speed, sr.launch_angle, sr.spin_rate
-                FROM swings s
-                LEFT JOIN simulation_results sr ON s.id = sr.swing_id
-                ORDER BY s.created_at
-            """)
-            
-            with open(swings_file, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Timestamp', 'Club', 'Player', 'Carry Distance', 
-                               'Max Height', 'Flight Time', 'Ball Speed', 
-                               'Launch Angle', 'Spin Rate'])
-                writer.writerows(cursor.fetchall())
-            
-            # Export player statistics
-            stats_file = os.path.join(output_dir, f"player_stats_{timestamp}.csv")
-            cursor.execute("""
-                SELECT player_name, club_name, avg_distance, max_distance, total_swings
-                FROM player_statistics
-                ORDER BY player_name, club_name
-            """)
-            
-            with open(stats_file, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Player', 'Club', 'Avg Distance', 'Max Distance', 'Total Swings'])
-                writer.writerows(cursor.fetchall())
+            with self.connections.reader() as connection:
+                # Export swings with simulation results
+                swings_file = os.path.join(output_dir, f"swings_{timestamp}.csv")
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT s.timestamp, s.club_name, s.player_name, 
+                           sr.carry_distance, sr.max_height, sr.flight_time,
+                           sr.ball_speed, sr.launch_angle, sr.spin_rate
+                    FROM swings s
+                    LEFT JOIN simulation_results sr ON s.id = sr.swing_id
+                """ + self._where(conditions) + " ORDER BY s.created_at", params)
+                
+                rows = 0
+                with open(swings_file, 'w', newline='') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['Timestamp', 'Club', 'Player', 'Carry Distance', 
+                                   'Max Height', 'Flight Time', 'Ball Speed', 
+                                   'Launch Angle', 'Spin Rate'])
+                    for chunk in self._fetch_chunks(cursor, chunk_size):
+                        writer.writerows(chunk)
+                        rows += len(chunk)
+                
+                # Export player statistics
+                stats_file = os.path.join(output_dir, f"player_stats_{timestamp}.csv")
+                stats_query = """
+                    SELECT player_name, club_name, avg_distance, max_distance, total_swings
+                    FROM player_statistics
+                """
+                stats_params = ()
+                if player_name is not None:
+                    stats_query += " WHERE player_name = ?"
+                    stats_params = (player_name,)
+                cursor.execute(stats_query + " ORDER BY player_name, club_name", stats_params)
+                
+                with open(stats_file, 'w', newline='') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['Player', 'Club', 'Avg Distance', 'Max Distance', 'Total Swings'])
+                    for chunk in self._fetch_chunks(cursor, chunk_size):
+                        writer.writerows(chunk)
             
-            self.logger.info(f"Data exported to {output_dir}")
+            self.logger.info(f"Data exported to {output_dir} ({rows} swing rows)")
             return output_dir
             
         except Exception as e:
             self.logger.error(f"Error exporting data: {e}")
             raise
     
+    def export_columnar(self, output_dir: str = "exports", export_format: str = "parquet",
+                        player_name: Optional[str] = None, session_id: Optional[int] = None,
+                        start_date=None, end_date=None,
+                        chunk_size: int = EXPORT_CHUNK_SIZE) -> Dict[str, Any]:
+        """Export shots and raw IMU samples as Parquet or Arrow IPC files
+        
+        Writes two files, one record batch per chunk:
+            shots_<time>.<ext>    one row per simulation result with its swing
+                                  metadata and the trajectory as float32 lists
+            samples_<time>.<ext>  one row per IMU sample (blob and JSON swings)
+        
+        Requires the optional pyarrow package. Returns the file paths and
+        row counts.
+        """
+        if export_format not in self.EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{export_format}', expected one of {self.EXPORT_FORMATS}")
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc
+            import pyarrow.parquet
+        except ImportError:
+            self.logger.error("Columnar export requires pyarrow (pip install pyarrow)")
+            raise
+        
+        def open_writer(path, schema):
+            if export_format == 'parquet':
+                return pa.parquet.ParquetWriter(path, schema, compression='zstd')
+            return pa.ipc.new_file(path, schema)
+        
+        float_list = pa.list_(pa.float32())
+        shot_schema = pa.schema(
+            [('swing_id', pa.int64()), ('session_id', pa.int64()), ('timestamp', pa.int64()),
+             ('club_name', pa.string()), ('player_name', pa.string()), ('device_id', pa.string()),
+             ('created_at', pa.string()), ('result_id', pa.int64())] +
+            [(name, pa.float64()) for name in self.EXPORT_RESULT_COLUMNS] +
+            [(f"trajectory_{name}", float_list) for name in self.TRAJECTORY_COLUMNS]
+        )
+        sample_schema = pa.schema(
+            [('swing_id', pa.int64()), ('session_id', pa.int64()), ('player_name', pa.string()),
+             ('club_name', pa.string()), ('timestamp', pa.int64())] +
+            [(name, pa.float32()) for name in self.EXPORT_SAMPLE_COLUMNS]
+        )
+        
+        os.makedirs(output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        extension = 'parquet' if export_format == 'parquet' else 'arrow'
+        shots_file = os.path.join(output_dir, f"shots_{timestamp}.{extension}")
+        samples_file = os.path.join(output_dir, f"samples_{timestamp}.{extension}")
+        conditions, params = self._export_filters(player_name, session_id, start_date, end_date)
+        
+        try:
+            with self.connections.reader() as connection:
+                shot_rows = self._export_shots(connection, open_writer(shots_file, shot_schema),
+                                               shot_schema, conditions, params, chunk_size)
+                sample_rows = self._export_samples(connection, open_writer(samples_file, sample_schema),
+                                                   sample_schema, conditions, params, chunk_size)
+            
+        except Exception as e:
+            self.logger.error(f"Error exporting columnar data: {e}")
+            raise
+        
+        self.logger.info(f"Exported {shot_rows} shots and {sample_rows} samples to {output_dir}")
+        return {'shots': shots_file, 'samples': samples_file,
+                'shot_rows': shot_rows, 'sample_rows': sample_rows}
+    
+    def _export_shots(self, connection, writer, schema, conditions, params, chunk_size) -> int:
+        """Stream simulation results joined with their swing into writer"""
+        import pyarrow as pa
+        
+        cursor = connection.execute(f"""
+            SELECT s.id, s.session_id, s.timestamp, s.club_name, s.player_name, s.device_id,
+                   s.created_at, sr.id, {', '.join('sr.' + name for name in self.EXPORT_RESULT_COLUMNS)},
+                   sr.trajectory_blob, sr.trajectory_encoding, sr.trajectory_points, sr.trajectory_data
+            FROM simulation_results sr
+            JOIN swings s ON s.id = sr.swing_id
+        """ + self._where(conditions) + " ORDER BY sr.id", params)
+        
+        scalar_count = 8 + len(self.EXPORT_RESULT_COLUMNS)
+        rows_written = 0
+        with writer:
+            # Each shot carries hundreds of trajectory points, so fetch fewer rows
+            for rows in self._fetch_chunks(cursor, max(1, chunk_size // 100)):
+                columns = [list(column) for column in zip(*(row[:scalar_count] for row in rows))]
+                
+                # Concatenate each trajectory column into one values buffer plus offsets
+                trajectories = [self._export_trajectory(*row[scalar_count:]) for row in rows]
+                offsets = np.zeros(len(rows) + 1, dtype=np.int32)
+                np.cumsum([len(trajectory[0]) for trajectory in trajectories], out=offsets[1:])
+                for index in range(len(self.TRAJECTORY_COLUMNS)):
+                    values = (np.concatenate([trajectory[index] for trajectory in trajectories])
+                              .astype(np.float32, copy=False))
+                    columns.append(pa.ListArray.from_arrays(pa.array(offsets), pa.array(values)))
+                
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+                rows_written += len(rows)
+        return rows_written
+    
+    def _export_trajectory(self, blob, encoding, point_count, trajectory_data) -> np.ndarray:
+        """(5, N) float32 trajectory of one result row, empty if it has none"""
+        if blob is not None:
+            return np.vstack(list(self.decode_trajectory(blob, encoding, point_count).values()))
+        if trajectory_data:
+            try:
+                return self._trajectory_columns(json.loads(trajectory_data)).astype(np.float32)
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                pass
+        return np.zeros((len(self.TRAJECTORY_COLUMNS), 0), dtype=np.float32)
+    
+    def _export_samples(self, connection, writer, schema, conditions, params, chunk_size) -> int:
+        """Stream every IMU sample (packed and JSON swing rows) into writer"""
+        import pyarrow as pa
+        
+        rows_written = 0
+        
+        def write(swing_ids, session_ids, players, clubs, timestamps, samples):
+            nonlocal rows_written
+            columns = [pa.array(swing_ids, pa.int64()), pa.array(session_ids, pa.int64()),
+                       pa.array(players, pa.string()), pa.array(clubs, pa.string()),
+                       pa.array(timestamps, pa.int64())]
+            columns.extend(pa.array(samples[:, index]) for index in range(self.SAMPLE_COLUMNS))
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            rows_written += len(timestamps)
+        
+        with writer:
+            # Packed swings: each row holds a whole swing, so fewer rows per fetch
+            cursor = connection.execute("""
+                SELECT s.id, s.session_id, s.player_name, s.club_name,
+                       s.samples, s.sample_encoding, s.timestamp, s.sample_count
+                FROM swings s
+            """ + self._where(conditions + ["s.samples IS NOT NULL"]) + " ORDER BY s.id", params)
+            for rows in self._fetch_chunks(cursor, max(1, chunk_size // 100)):
+                decoded = [self.decode_swing_samples(row[4], row[5], row[6], row[7]) for row in rows]
+                counts = [row[7] for row in rows]
+                metadata = [np.repeat(np.array(column, dtype=object), counts)
+                            for column in list(zip(*rows))[:4]]
+                write(*metadata,
+                      np.concatenate([timestamps for timestamps, _ in decoded]),
+                      np.concatenate([samples for _, samples in decoded]))
+            
+            # JSON-per-sample rows
+            cursor = connection.execute("""
+                SELECT s.id, s.session_id, s.player_name, s.club_name, s.timestamp, s.raw_data
+                FROM swings s
+            """ + self._where(conditions + ["s.samples IS NULL", "s.raw_data IS NOT NULL"]) +
+                " ORDER BY s.id", params)
+            for rows in self._fetch_chunks(cursor, chunk_size):
+                readable, values = [], []
+                for row in rows:
+                    try:
+                        sample = json.loads(row[5])
+                        values.append([float(sample.get(field, 0.0)) for field in self.EXPORT_SAMPLE_COLUMNS])
+                    except (json.JSONDecodeError, AttributeError, TypeError, ValueError):
+                        continue
+                    readable.append(row)
+                if readable:
+                    swing_ids, session_ids, players, clubs, timestamps, _ = zip(*readable)
+                    write(swing_ids, session_ids, players, clubs, timestamps,
+                          np.array(values, dtype=np.float32))
+        return rows_written
+    
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.logger.info("Database connection closed")
+        """Close database connections"""
+        if self.writer_thread and self.writer_thread.is_alive():
+            # Flush queued rows before shutting down
+            self.write_queue.put(None)
+            self.writer_thread.join()
+            self.logger.info(f"Write-behind stats: {self.get_write_stats()}")
+        
+        if self.connections:
+            self.connections.close()
+            self.connection = None
+            self.logger.info("Database connections closed")
 
 # Example usage
 if __name__ == "__main__":
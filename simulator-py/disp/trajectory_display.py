@@ -7,33 +7,168 @@ and player statistics using Matplotlib and Pygame for Raspberry Pi display outpu
 
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional
 import pygame
+import time
+import queue
 import logging
+import threading
+import multiprocessing
+import concurrent.futures
+from collections import OrderedDict, deque
 from datetime import datetime
 
+def trajectory_xy(trajectory_data) -> tuple:
+    """x and y coordinates of a trajectory as NumPy arrays
+    
+    Accepts a columnar TrajectoryArray (zero-copy), a dict of column
+    arrays (GolfDataStore.load_trajectory), a list of TrajectoryPoint
+    objects or a list of {'x': ..., 'y': ...} dicts.
+    """
+    if hasattr(trajectory_data, 'x') and not isinstance(trajectory_data, list):
+        return np.asarray(trajectory_data.x), np.asarray(trajectory_data.y)
+    
+    if isinstance(trajectory_data, dict):
+        return (np.asarray(trajectory_data['x'], dtype=float),
+                np.asarray(trajectory_data['y'], dtype=float))
+    
+    if trajectory_data and isinstance(trajectory_data[0], dict):
+        return (np.array([point['x'] for point in trajectory_data], dtype=float),
+                np.array([point['y'] for point in trajectory_data], dtype=float))
+    
+    return (np.array([point.x for point in trajectory_data], dtype=float),
+            np.array([point.y for point in trajectory_data], dtype=float))
+
+def trajectory_time(trajectory_data, sample_interval_s: float = 0.01) -> np.ndarray:
+    """Time column of a trajectory in seconds, as a NumPy array
+    
+    Accepts the same inputs as trajectory_xy(); point dicts without a
+    'time' key are assumed to be sample_interval_s apart.
+    """
+    if hasattr(trajectory_data, 'time') and not isinstance(trajectory_data, list):
+        return np.asarray(trajectory_data.time, dtype=float)
+    
+    if isinstance(trajectory_data, dict):
+        if 'time' in trajectory_data:
+            return np.asarray(trajectory_data['time'], dtype=float)
+        return np.arange(len(trajectory_data['x'])) * sample_interval_s
+    
+    if trajectory_data and isinstance(trajectory_data[0], dict):
+        if 'time' in trajectory_data[0]:
+            return np.array([point['time'] for point in trajectory_data], dtype=float)
+        return np.arange(len(trajectory_data)) * sample_interval_s
+    
+    return np.array([point.time for point in trajectory_data], dtype=float)
+
+_worker = threading.local()
+
+def render_png(filename: str, x_coords: np.ndarray, y_coords: np.ndarray,
+               stats_results: Dict[str, Any], figure_size: tuple, dpi: int) -> str:
+    """Draw a shot on the worker's own persistent figure and write it as PNG
+    
+    Runs on the background export thread or process of TrajectoryVisualizer.
+    """
+    visualizer = getattr(_worker, 'visualizer', None)
+    if visualizer is None or visualizer.figure_size != figure_size or visualizer.dpi != dpi:
+        visualizer = _worker.visualizer = TrajectoryVisualizer(figure_size, figure='persistent', dpi=dpi)
+    visualizer.create_trajectory_plot({'x': x_coords, 'y': y_coords}, stats_results)
+    visualizer.fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    return filename
+
 class TrajectoryVisualizer:
-    """Handles 2D trajectory visualization using Matplotlib"""
+    """Handles 2D trajectory visualization using Matplotlib
+    
+    figure selects how shots are drawn:
+        new        - a new pyplot figure per shot (the previous one is closed)
+        persistent - one figure on the Agg canvas, built once; each shot only
+                     updates the line data, markers, limits and texts
+    
+    export selects where save_plot() draws and encodes the PNG:
+        sync    - savefig() on the calling thread
+        thread  - a background thread draws the shot on its own persistent
+                  figure and encodes it; the caller only hands over the
+                  trajectory columns and never draws a figure itself
+        process - as thread, but in a separate process (no GIL contention
+                  with the simulator's threads)
+    At most max_pending_exports shots wait for the worker; save_plot()
+    blocks for a free slot when it falls behind.
+    """
+    
+    FIGURE_MODES = ('new', 'persistent')
+    EXPORT_MODES = ('sync', 'thread', 'process')
+    
+    # Applied only while a figure is built, so the global rcParams (shared
+    # with the export thread and the host application) are left alone
+    STYLE = 'seaborn-v0_8-darkgrid'
     
-    def __init__(self, figure_size: tuple = (12, 8)):
+    def __init__(self, figure_size: tuple = (12, 8), figure: str = 'new', export: str = 'sync',
+                 dpi: int = 150, max_pending_exports: int = 2):
+        if figure not in self.FIGURE_MODES:
+            raise ValueError(f"Unknown figure mode '{figure}', expected one of {self.FIGURE_MODES}")
+        if export not in self.EXPORT_MODES:
+            raise ValueError(f"Unknown export mode '{export}', expected one of {self.EXPORT_MODES}")
+        
         self.figure_size = figure_size
+        self.figure = figure
+        self.export = export
+        self.dpi = dpi
         self.logger = logging.getLogger(__name__)
         
-        # Setup matplotlib for headless operation on Raspberry Pi
-        plt.style.use('seaborn-v0_8-darkgrid')
         self.fig = None
         self.ax = None
+        self._artists = {}
+        self._layout_key = None
+        self._shot = None
+        
+        # Background PNG export
+        self._executor = None
+        self._export_slots = threading.BoundedSemaphore(max_pending_exports)
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self.exports_written = 0
+        self.export_errors = 0
     
-    def create_trajectory_plot(self, trajectory_data: List[Dict], 
-                             simulation_results: Dict[str, Any]) -> plt.Figure:
-        """Create a 2D trajectory plot"""
+    def create_trajectory_plot(self, trajectory_data, 
+                             simulation_results: Dict[str, Any]) -> Optional[plt.Figure]:
+        """Create a 2D trajectory plot
         
-        self.fig, self.ax = plt.subplots(figsize=self.figure_size)
+        With background export only the shot is kept for save_plot() and
+        no figure is drawn here (returns None).
+        """
         
         # Extract trajectory points
-        x_coords = [point['x'] for point in trajectory_data]
-        y_coords = [point['y'] for point in trajectory_data]
+        x_coords, y_coords = trajectory_xy(trajectory_data)
+        
+        # What a background export needs to redraw the shot
+        self._shot = (x_coords, y_coords, {
+            'results': simulation_results.get('results', {}),
+            'launch_conditions': simulation_results.get('launch_conditions', {})
+        })
+        
+        if self.export != 'sync':
+            return None
+        
+        if self.figure == 'persistent':
+            if self.fig is None:
+                with plt.style.context(self.STYLE):
+                    self._build_persistent_figure()
+            self._update_persistent_figure(x_coords, y_coords, simulation_results)
+            return self.fig
+        
+        if self.fig is not None:
+            plt.close(self.fig)
+        with plt.style.context(self.STYLE):
+            self._draw_figure(x_coords, y_coords, simulation_results)
+        return self.fig
+    
+    def _draw_figure(self, x_coords: np.ndarray, y_coords: np.ndarray,
+                     simulation_results: Dict[str, Any]):
+        """Draw a shot on a new pyplot figure"""
+        self.fig, self.ax = plt.subplots(figsize=self.figure_size)
         
         # Plot trajectory
         self.ax.plot(x_coords, y_coords, 'b-', linewidth=2, label='Ball Trajectory')
@@ -49,24 +184,75 @@ class TrajectoryVisualizer:
                     label=f'Landing: {x_coords[-1]:.1f}m')
         
         # Formatting
-        self.ax.set_xlabel('Distance (meters)', fontsize=12)
-        self.ax.set_ylabel('Height (meters)', fontsize=12)
-        self.ax.set_title('Golf Ball Trajectory Analysis', fontsize=14, fontweight='bold')
-        self.ax.grid(True, alpha=0.3)
+        self._format_axes()
         self.ax.legend()
         
         # Add statistics text box
         stats_text = self._create_stats_text(simulation_results)
-        self.ax.text(0.02, 0.98, stats_text, transform=self.ax.transAxes, 
-                    verticalalignment='top', bbox=dict(boxstyle='round', 
-                    facecolor='wheat', alpha=0.8), fontsize=10)
+        self._add_stats_box(stats_text)
         
         # Set equal aspect ratio with some padding
         self.ax.set_xlim(-10, max(x_coords) * 1.1)
         self.ax.set_ylim(-5, max(y_coords) * 1.2)
         
-        plt.tight_layout()
-        return self.fig
+        self.fig.tight_layout()
+    
+    def _format_axes(self):
+        self.ax.set_xlabel('Distance (meters)', fontsize=12)
+        self.ax.set_ylabel('Height (meters)', fontsize=12)
+        self.ax.set_title('Golf Ball Trajectory Analysis', fontsize=14, fontweight='bold')
+        self.ax.grid(True, alpha=0.3)
+    
+    def _add_stats_box(self, stats_text: str):
+        return self.ax.text(0.02, 0.98, stats_text, transform=self.ax.transAxes, 
+                            verticalalignment='top', bbox=dict(boxstyle='round', 
+                            facecolor='wheat', alpha=0.8), fontsize=10)
+    
+    def _build_persistent_figure(self):
+        """Create the Agg figure and its artists once"""
+        # Not registered with pyplot, so it is never shown or kept alive by it
+        self.fig = Figure(figsize=self.figure_size, dpi=self.dpi)
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        
+        self._artists = {
+            'line': self.ax.plot([], [], 'b-', linewidth=2, label='Ball Trajectory')[0],
+            'fill': self.ax.add_patch(Polygon(np.zeros((2, 2)), closed=True,
+                                              alpha=0.3, color='lightblue')),
+            'peak': self.ax.plot([], [], 'ro', markersize=8, label='Peak')[0],
+            'landing': self.ax.plot([], [], 'go', markersize=8, label='Landing')[0],
+            'stats': self._add_stats_box(self._create_stats_text({}))
+        }
+        self._format_axes()
+        self._artists['legend'] = self.ax.legend()
+        self._layout_key = None
+    
+    def _update_persistent_figure(self, x_coords: np.ndarray, y_coords: np.ndarray,
+                                  simulation_results: Dict[str, Any]):
+        """Point the persistent artists at a new shot"""
+        artists = self._artists
+        max_height_idx = np.argmax(y_coords)
+        
+        artists['line'].set_data(x_coords, y_coords)
+        artists['fill'].set_xy(np.column_stack((
+            np.concatenate((x_coords, x_coords[::-1])),
+            np.concatenate((y_coords, np.zeros_like(y_coords))))))
+        artists['peak'].set_data([x_coords[max_height_idx]], [y_coords[max_height_idx]])
+        artists['landing'].set_data([x_coords[-1]], [0])
+        
+        legend_texts = artists['legend'].get_texts()
+        legend_texts[1].set_text(f'Peak: {y_coords[max_height_idx]:.1f}m')
+        legend_texts[2].set_text(f'Landing: {x_coords[-1]:.1f}m')
+        artists['stats'].set_text(self._create_stats_text(simulation_results))
+        
+        self.ax.set_xlim(-10, max(x_coords) * 1.1)
+        self.ax.set_ylim(-5, max(y_coords) * 1.2)
+        
+        # Lay out again only when the y tick labels change width
+        layout_key = max(len(f"{tick:g}") for tick in self.ax.get_yticks())
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self.fig.tight_layout()
     
     def _create_stats_text(self, results: Dict[str, Any]) -> str:
         """Create formatted statistics text"""
@@ -84,30 +270,132 @@ Spin Rate: {launch.get('spin_rate', 0):.0f} rpm"""
         return text
     
     def save_plot(self, filename: str = None) -> str:
-        """Save the current plot to file"""
+        """Save the current plot to file
+        
+        With background export the file is written later; call flush() to
+        wait for it.
+        """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"trajectory_{timestamp}.png"
         
-        if self.fig:
-            self.fig.savefig(filename, dpi=150, bbox_inches='tight')
-            self.logger.info(f"Trajectory plot saved as {filename}")
-            return filename
-        else:
+        if not self._shot:
             self.logger.error("No plot to save")
             return ""
+        
+        if self.export == 'sync':
+            self.fig.savefig(filename, dpi=self.dpi, bbox_inches='tight')
+            self.logger.info(f"Trajectory plot saved as {filename}")
+            return filename
+        
+        x_coords, y_coords, stats_results = self._shot
+        self._export_slots.acquire()
+        try:
+            future = self._export_executor().submit(render_png, filename, x_coords, y_coords,
+                                                    stats_results, self.figure_size, self.dpi)
+        except Exception:
+            self._export_slots.release()
+            raise
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._export_done)
+        return filename
+    
+    def _export_executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            if self.export == 'process':
+                # spawn: the parent runs pygame and worker threads, which fork would copy mid-flight
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="png")
+        return self._executor
+    
+    def _export_done(self, future: concurrent.futures.Future):
+        self._export_slots.release()
+        with self._pending_lock:
+            self._pending.discard(future)
+        try:
+            filename = future.result()
+            self.exports_written += 1
+            self.logger.info(f"Trajectory plot saved as {filename}")
+        except Exception as e:
+            self.export_errors += 1
+            self.logger.error(f"Error writing trajectory plot: {e}")
+    
+    def flush(self, timeout: Optional[float] = None):
+        """Wait for the background exports queued so far"""
+        with self._pending_lock:
+            pending = list(self._pending)
+        concurrent.futures.wait(pending, timeout=timeout)
+    
+    def close(self):
+        """Finish pending exports and release the figure"""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.fig is not None and self.figure == 'new':
+            plt.close(self.fig)
+        self.fig = None
+        self.ax = None
+        self._artists = {}
+        self._shot = None
 
 class LiveDisplayManager:
-    """Manages live display using Pygame for Raspberry Pi"""
+    """Manages live display using Pygame for Raspberry Pi
     
-    def __init__(self, screen_size: tuple = (1024, 768)):
+    With render_cache, text is rendered once per (font, text, color) and
+    each screen's static layer (fill, titles, instructions, headers) is
+    composed once into a background surface. Switching screens blits the
+    background; updating the screen already shown only restores and redraws
+    the areas that changed and passes those to pygame.display.update().
+    Without it every update renders everything and flips the whole screen.
+    
+    pygame is only touched from the thread that calls display_init(): it
+    opens the window, loads the fonts and composes the static backgrounds,
+    and the same thread then pumps events and draws (the event pump must
+    run on the thread that created the window). Other threads do not draw:
+    they post() a screen and the display thread draws it from its frame
+    loop with render_pending(). Every screen
+    replaces the whole display, so when several are waiting only the
+    latest is drawn and the others are counted as coalesced.
+    
+    With flight_animation the results screen plays the ball's flight at
+    playback_speed times real time instead of drawing the whole trajectory
+    at once. Each frame interpolates the ball position at the frame time,
+    extends the trail by one segment (skipped below TRAIL_MIN_STEP_PX) on a
+    cached copy of the screen and updates only the ball and trail areas.
+    The display thread paces these frames at frame_rate with
+    wait_for_frame(); frame_stats() reports the pacing.
+    """
+    
+    TEXT_CACHE_SIZE = 256  # Values change per shot; labels and recent values stay cached
+    SCREENS = ('display_waiting_screen', 'display_swing_detected',
+               'display_simulation_results', 'display_player_statistics')
+    TRAIL_MIN_STEP_PX = 2  # Shorter trail segments wait for the next frame
+    FRAME_HISTORY = 3600   # Animation frame intervals kept for frame_stats() (1 min at 60 FPS)
+    
+    def __init__(self, screen_size: tuple = (1024, 768), render_cache: bool = True,
+                 flight_animation: bool = False, playback_speed: float = 1.0,
+                 frame_rate: float = 60.0):
+        if playback_speed <= 0:
+            raise ValueError("playback_speed must be positive")
+        if frame_rate <= 0:
+            raise ValueError("frame_rate must be positive")
+        
         self.screen_size = screen_size
+        self.render_cache = render_cache
+        self.flight_animation = flight_animation
+        self.playback_speed = playback_speed
+        self.frame_interval = 1.0 / frame_rate
         self.logger = logging.getLogger(__name__)
         
-        # Initialize Pygame
-        pygame.init()
-        self.screen = pygame.display.set_mode(screen_size)
-        pygame.display.set_caption("Golf HILS Live Display")
+        # Window, fonts and clock are created by display_init()
+        self.screen = None
+        self.fonts = {}
+        self.clock = None
         
         # Colors
         self.BLACK = (0, 0, 0)
@@ -117,28 +405,266 @@ class LiveDisplayManager:
         self.BLUE = (0, 0, 255)
         self.YELLOW = (255, 255, 0)
         
+        self.running = True
+        
+        # Render cache
+        self._text_cache = OrderedDict()
+        self._backgrounds = {}
+        self._screen_name = None    # Screen whose background is up
+        self._drawn_rects = []      # Areas drawn over that background
+        
+        # Screen commands posted for the display thread
+        self._commands = queue.SimpleQueue()
+        self._command_posted = threading.Event()
+        self._revert_at = None      # When a shown result returns to the waiting screen
+        self._revert_after_s = None # Revert delay of a result still being animated
+        
+        # Flight playback
+        self._flight = None         # State of the animation in progress
+        self._next_frame = 0.0      # perf_counter() time the next animation frame is due
+        self._last_frame = None     # When the previous animation frame was presented
+        self._frame_intervals = deque(maxlen=self.FRAME_HISTORY)
+        self._frame_draw_times = deque(maxlen=self.FRAME_HISTORY)
+        self.animation_frames = 0
+        self.missed_frames = 0
+        
+        # Counters
+        self.frames = 0
+        self.pixels_updated = 0
+        self.text_cache_hits = 0
+        self.text_cache_misses = 0
+        self.commands_posted = 0
+        self.commands_drawn = 0
+        self.commands_coalesced = 0
+    
+    def display_init(self):
+        """Open the window and load fonts; call on the thread that will draw"""
+        pygame.init()
+        self.screen = pygame.display.set_mode(self.screen_size)
+        pygame.display.set_caption("Golf HILS Live Display")
+        
         # Fonts
         self.title_font = pygame.font.Font(None, 48)
         self.heading_font = pygame.font.Font(None, 36)
         self.text_font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
+        self.fonts = {
+            'title': self.title_font,
+            'heading': self.heading_font,
+            'text': self.text_font,
+            'small': self.small_font
+        }
         
         self.clock = pygame.time.Clock()
-        self.running = True
+        
+        if self.render_cache:
+            # Compose the static layers now rather than on each screen's first use
+            for name, build in (('waiting', self._build_waiting_screen),
+                                ('swing_detected', self._build_swing_detected_screen),
+                                ('results', self._build_results_screen),
+                                ('statistics', self._build_statistics_screen)):
+                self._background(name, build)
     
-    def display_waiting_screen(self):
-        """Display waiting for swing screen"""
-        self.screen.fill(self.BLACK)
+    def post(self, screen: str, *args, on_shown: Optional[Callable[[], None]] = None,
+             revert_after_s: Optional[float] = None):
+        """Ask the display thread to show a screen (safe from any thread)
+        
+        ``screen`` names one of the display_* methods and ``args`` are its
+        arguments. ``on_shown`` is called on the display thread once the
+        screen is up (not if a newer post replaced it first).
+        ``revert_after_s`` returns to the waiting screen after that long
+        unless another screen is posted in between.
+        """
+        if screen not in self.SCREENS:
+            raise ValueError(f"Unknown screen '{screen}', expected one of {self.SCREENS}")
+        self._commands.put((screen, args, on_shown, revert_after_s))
+        self.commands_posted += 1
+        self._command_posted.set()
+    
+    def wait_for_commands(self, timeout: float) -> bool:
+        """Sleep until a screen is posted or ``timeout`` passes"""
+        posted = self._command_posted.wait(timeout)
+        self._command_posted.clear()
+        return posted
+    
+    def wait_for_frame(self):
+        """Sleep until the next animation frame is due or a screen is posted
+        
+        Without an animation in progress this waits one frame interval.
+        """
+        if self._flight is None:
+            self.wait_for_commands(self.frame_interval)
+            return
+        timeout = self._next_frame - time.perf_counter()
+        if timeout > 0:
+            self.wait_for_commands(timeout)
+    
+    def render_pending(self) -> bool:
+        """Draw the latest posted screen or the next animation frame
+        
+        Display thread only. Returns True when something was drawn.
+        """
+        command = None
+        while True:
+            try:
+                latest = self._commands.get_nowait()
+            except queue.Empty:
+                break
+            if command is not None:
+                self.commands_coalesced += 1
+            command = latest
+        
+        if command is None:
+            if self._flight is not None:
+                if time.perf_counter() < self._next_frame:
+                    return False
+                self._advance_flight()
+                if self._flight is None and self._revert_after_s is not None:
+                    # The revert delay starts once the ball has landed
+                    self._revert_at = time.monotonic() + self._revert_after_s
+                return True
+            if self._revert_at is not None and time.monotonic() >= self._revert_at:
+                self._revert_at = None
+                self.display_waiting_screen()
+                return True
+            return False
+        
+        screen, args, on_shown, revert_after_s = command
+        self._flight = None
+        getattr(self, screen)(*args)
+        self.commands_drawn += 1
+        
+        self._revert_at = None
+        self._revert_after_s = None
+        if revert_after_s is not None:
+            if self._flight is not None:
+                self._revert_after_s = revert_after_s
+            else:
+                self._revert_at = time.monotonic() + revert_after_s
+        if on_shown:
+            on_shown()
+        return True
+    
+    def _text(self, font: str, text: str, color: tuple) -> pygame.Surface:
+        """Rendered text surface, from the cache when enabled"""
+        if not self.render_cache:
+            return self.fonts[font].render(text, True, color)
+        
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is not None:
+            self.text_cache_hits += 1
+            self._text_cache.move_to_end(key)
+            return surface
+        
+        self.text_cache_misses += 1
+        surface = self._text_cache[key] = self.fonts[font].render(text, True, color)
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return surface
+    
+    def _blit_text(self, target: pygame.Surface, font: str, text: str, color: tuple,
+                   center: tuple) -> pygame.Rect:
+        surface = self._text(font, text, color)
+        return target.blit(surface, surface.get_rect(center=center))
+    
+    def _draw_text(self, font: str, text: str, color: tuple, center: tuple):
+        """Draw changing text over the current background"""
+        self._drawn_rects.append(self._blit_text(self.screen, font, text, color, center))
+    
+    def _begin_screen(self, name: str, build) -> list:
+        """Show a screen's static layer; returns the areas to update
+        
+        ``build(surface)`` draws the static layer. If the screen is already
+        up, only the areas drawn over it last time are restored.
+        """
+        background = self._background(name, build)
+        
+        if self.render_cache and self._screen_name == name:
+            dirty = self._drawn_rects
+            for rect in dirty:
+                self.screen.blit(background, rect, rect)
+        else:
+            self.screen.blit(background, (0, 0))
+            dirty = [self.screen.get_rect()]
+        
+        self._screen_name = name
+        self._drawn_rects = []
+        return dirty
+    
+    def _background(self, name: str, build) -> pygame.Surface:
+        """A screen's static layer, from the cache when enabled"""
+        background = self._backgrounds.get(name)
+        if background is None:
+            background = pygame.Surface(self.screen_size).convert()
+            build(background)
+            if self.render_cache:
+                self._backgrounds[name] = background
+        return background
+    
+    def _present(self, dirty: list):
+        """Push the changed areas (or the whole screen) to the display"""
+        if not self.render_cache:
+            pygame.display.flip()
+            self.frames += 1
+            self.pixels_updated += self.screen_size[0] * self.screen_size[1]
+            return
+        
+        full_screen = self.screen.get_rect()
+        if full_screen not in dirty:
+            dirty = dirty + self._drawn_rects
+        else:
+            dirty = [full_screen]
+        if not dirty:
+            return
+        pygame.display.update(dirty)
+        self.frames += 1
+        self.pixels_updated += sum(rect.width * rect.height for rect in dirty)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Frame, render cache and command counters"""
+        return {
+            'frames': self.frames,
+            'pixels_updated': self.pixels_updated,
+            'text_cache_size': len(self._text_cache),
+            'text_cache_hits': self.text_cache_hits,
+            'text_cache_misses': self.text_cache_misses,
+            'commands_posted': self.commands_posted,
+            'commands_drawn': self.commands_drawn,
+            'commands_coalesced': self.commands_coalesced,
+            **self.frame_stats()
+        }
+    
+    def frame_stats(self) -> Dict[str, Any]:
+        """Pacing of the flight animation frames
+        
+        Intervals are between presented frames; a frame counts as missed
+        when its interval spans more than 1.5 frame intervals.
+        """
+        stats = {
+            'animation_frames': self.animation_frames,
+            'missed_frames': self.missed_frames
+        }
+        if self._frame_intervals:
+            intervals = np.array(self._frame_intervals) * 1000
+            draw_times = np.array(self._frame_draw_times) * 1000
+            stats.update({
+                'frame_interval_p50_ms': float(np.percentile(intervals, 50)),
+                'frame_interval_p99_ms': float(np.percentile(intervals, 99)),
+                'frame_interval_max_ms': float(intervals.max()),
+                'frame_draw_p99_ms': float(np.percentile(draw_times, 99))
+            })
+        return stats
+    
+    def _build_waiting_screen(self, surface: pygame.Surface):
+        surface.fill(self.BLACK)
+        center_x = self.screen_size[0] // 2
         
         # Title
-        title_text = self.title_font.render("Golf HILS System", True, self.WHITE)
-        title_rect = title_text.get_rect(center=(self.screen_size[0]//2, 100))
-        self.screen.blit(title_text, title_rect)
+        self._blit_text(surface, 'title', "Golf HILS System", self.WHITE, (center_x, 100))
         
         # Status
-        status_text = self.heading_font.render("Waiting for Swing...", True, self.GREEN)
-        status_rect = status_text.get_rect(center=(self.screen_size[0]//2, 200))
-        self.screen.blit(status_text, status_rect)
+        self._blit_text(surface, 'heading', "Waiting for Swing...", self.GREEN, (center_x, 200))
         
         # Instructions
         instructions = [
@@ -148,45 +674,47 @@ class LiveDisplayManager:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = self.text_font.render(instruction, True, self.WHITE)
-            text_rect = text.get_rect(center=(self.screen_size[0]//2, 300 + i*40))
-            self.screen.blit(text, text_rect)
+            self._blit_text(surface, 'text', instruction, self.WHITE, (center_x, 300 + i*40))
+    
+    def display_waiting_screen(self):
+        """Display waiting for swing screen"""
+        # Nothing changes when the waiting screen is already up
+        self._present(self._begin_screen('waiting', self._build_waiting_screen))
+    
+    def _build_swing_detected_screen(self, surface: pygame.Surface):
+        surface.fill(self.RED)
+        center_x = self.screen_size[0] // 2
+        
+        # Big notification
+        self._blit_text(surface, 'title', "SWING DETECTED!", self.WHITE, (center_x, 200))
         
-        pygame.display.flip()
+        # Processing message
+        self._blit_text(surface, 'text', "Processing swing data...", self.YELLOW, (center_x, 450))
     
     def display_swing_detected(self, player_name: str, club_name: str):
         """Display swing detection screen"""
-        self.screen.fill(self.RED)
-        
-        # Big notification
-        swing_text = self.title_font.render("SWING DETECTED!", True, self.WHITE)
-        swing_rect = swing_text.get_rect(center=(self.screen_size[0]//2, 200))
-        self.screen.blit(swing_text, swing_rect)
+        dirty = self._begin_screen('swing_detected', self._build_swing_detected_screen)
+        center_x = self.screen_size[0] // 2
         
         # Player and club info
-        player_text = self.heading_font.render(f"Player: {player_name}", True, self.WHITE)
-        player_rect = player_text.get_rect(center=(self.screen_size[0]//2, 300))
-        self.screen.blit(player_text, player_rect)
+        self._draw_text('heading', f"Player: {player_name}", self.WHITE, (center_x, 300))
+        self._draw_text('heading', f"Club: {club_name}", self.WHITE, (center_x, 350))
         
-        club_text = self.heading_font.render(f"Club: {club_name}", True, self.WHITE)
-        club_rect = club_text.get_rect(center=(self.screen_size[0]//2, 350))
-        self.screen.blit(club_text, club_rect)
+        self._present(dirty)
+    
+    def _build_results_screen(self, surface: pygame.Surface):
+        surface.fill(self.BLACK)
         
-        # Processing message
-        processing_text = self.text_font.render("Processing swing data...", True, self.YELLOW)
-        processing_rect = processing_text.get_rect(center=(self.screen_size[0]//2, 450))
-        self.screen.blit(processing_text, processing_rect)
+        # Title
+        self._blit_text(surface, 'title', "Shot Results", self.WHITE, (self.screen_size[0]//2, 50))
         
-        pygame.display.flip()
+        # Footer
+        self._blit_text(surface, 'small', "Waiting for next swing...", self.GREEN,
+                        (self.screen_size[0]//2, self.screen_size[1]-30))
     
     def display_simulation_results(self, simulation_results: Dict[str, Any]):
         """Display simulation results"""
-        self.screen.fill(self.BLACK)
-        
-        # Title
-        title_text = self.title_font.render("Shot Results", True, self.WHITE)
-        title_rect = title_text.get_rect(center=(self.screen_size[0]//2, 50))
-        self.screen.blit(title_text, title_rect)
+        dirty = self._begin_screen('results', self._build_results_screen)
         
         # Extract data
         results = simulation_results.get('results', {})
@@ -194,9 +722,7 @@ class LiveDisplayManager:
         club_name = simulation_results.get('club_used', 'Unknown')
         
         # Club used
-        club_text = self.heading_font.render(f"Club: {club_name}", True, self.YELLOW)
-        club_rect = club_text.get_rect(center=(self.screen_size[0]//2, 120))
-        self.screen.blit(club_text, club_rect)
+        self._draw_text('heading', f"Club: {club_name}", self.YELLOW, (self.screen_size[0]//2, 120))
         
         # Main results - two columns
         left_x = self.screen_size[0] // 4
@@ -210,9 +736,7 @@ class LiveDisplayManager:
         ]
         
         for i, result in enumerate(left_results):
-            text = self.text_font.render(result, True, self.WHITE)
-            text_rect = text.get_rect(center=(left_x, 200 + i*40))
-            self.screen.blit(text, text_rect)
+            self._draw_text('text', result, self.WHITE, (left_x, 200 + i*40))
         
         # Right column
         right_results = [
@@ -222,77 +746,158 @@ class LiveDisplayManager:
         ]
         
         for i, result in enumerate(right_results):
-            text = self.text_font.render(result, True, self.WHITE)
-            text_rect = text.get_rect(center=(right_x, 200 + i*40))
-            self.screen.blit(text, text_rect)
+            self._draw_text('text', result, self.WHITE, (right_x, 200 + i*40))
         
         # Simple trajectory visualization
-        self._draw_simple_trajectory(simulation_results.get('trajectory', []))
-        
-        # Footer
-        footer_text = self.small_font.render("Waiting for next swing...", True, self.GREEN)
-        footer_rect = footer_text.get_rect(center=(self.screen_size[0]//2, self.screen_size[1]-30))
-        self.screen.blit(footer_text, footer_rect)
+        if self.flight_animation:
+            self._start_flight(simulation_results.get('trajectory', []))
+        else:
+            self._draw_simple_trajectory(simulation_results.get('trajectory', []))
         
-        pygame.display.flip()
+        self._present(dirty)
     
-    def _draw_simple_trajectory(self, trajectory_data: List[Dict]):
+    def _draw_simple_trajectory(self, trajectory_data):
         """Draw a simple trajectory visualization"""
-        if not trajectory_data:
+        if not len(trajectory_data):
             return
         
         # Define drawing area
-        draw_x = 50
-        draw_y = 400
-        draw_width = self.screen_size[0] - 100
-        draw_height = 200
+        draw_x, draw_y, draw_width, draw_height = self._trajectory_area()
         
         # Extract coordinates and normalize
-        x_coords = [point['x'] for point in trajectory_data]
-        y_coords = [point['y'] for point in trajectory_data]
+        x_coords, y_coords = trajectory_xy(trajectory_data)
         
-        if not x_coords or not y_coords:
-            return
-        
-        max_x = max(x_coords)
-        max_y = max(y_coords)
+        max_x = x_coords.max()
+        max_y = y_coords.max()
         
         if max_x == 0 or max_y == 0:
             return
         
+        drawn = self._drawn_rects
+        
         # Draw ground line
-        pygame.draw.line(self.screen, self.GREEN, 
-                        (draw_x, draw_y + draw_height), 
-                        (draw_x + draw_width, draw_y + draw_height), 3)
+        drawn.append(pygame.draw.line(self.screen, self.GREEN, 
+                                      (draw_x, draw_y + draw_height), 
+                                      (draw_x + draw_width, draw_y + draw_height), 3))
         
         # Draw trajectory
-        points = []
-        for i in range(len(x_coords)):
-            screen_x = draw_x + (x_coords[i] / max_x) * draw_width
-            screen_y = draw_y + draw_height - (y_coords[i] / max_y) * draw_height
-            points.append((int(screen_x), int(screen_y)))
+        screen_x = (draw_x + (x_coords / max_x) * draw_width).astype(int)
+        screen_y = (draw_y + draw_height - (y_coords / max_y) * draw_height).astype(int)
+        points = list(zip(screen_x.tolist(), screen_y.tolist()))
         
         if len(points) > 1:
-            pygame.draw.lines(self.screen, self.BLUE, False, points, 3)
+            drawn.append(pygame.draw.lines(self.screen, self.BLUE, False, points, 3))
         
         # Mark peak and landing
         if points:
             # Peak (highest point)
             peak_idx = np.argmax(y_coords)
             if peak_idx < len(points):
-                pygame.draw.circle(self.screen, self.RED, points[peak_idx], 8)
+                drawn.append(pygame.draw.circle(self.screen, self.RED, points[peak_idx], 8))
             
             # Landing
-            pygame.draw.circle(self.screen, self.GREEN, points[-1], 8)
+            drawn.append(pygame.draw.circle(self.screen, self.GREEN, points[-1], 8))
     
-    def display_player_statistics(self, player_stats: List[Dict[str, Any]]):
-        """Display player statistics screen"""
-        self.screen.fill(self.BLACK)
+    def _trajectory_area(self) -> tuple:
+        """(x, y, width, height) of the trajectory drawing area"""
+        return 50, 400, self.screen_size[0] - 100, 200
+    
+    def _start_flight(self, trajectory_data):
+        """Set up the flight animation; frames are drawn by render_pending()"""
+        if not len(trajectory_data):
+            return
+        
+        x_coords, y_coords = trajectory_xy(trajectory_data)
+        times = trajectory_time(trajectory_data)
+        max_x = x_coords.max()
+        max_y = y_coords.max()
+        if max_x == 0 or max_y == 0 or len(times) < 2:
+            return
+        
+        draw_x, draw_y, draw_width, draw_height = self._trajectory_area()
+        
+        # The ball and trail stay inside this area, which later updates restore
+        self._drawn_rects.append(pygame.Rect(draw_x - 10, draw_y - 10, draw_width + 20, draw_height + 20))
+        self._drawn_rects.append(pygame.draw.line(self.screen, self.GREEN, 
+                                                  (draw_x, draw_y + draw_height), 
+                                                  (draw_x + draw_width, draw_y + draw_height), 3))
+        
+        screen_x = draw_x + (x_coords / max_x) * draw_width
+        screen_y = draw_y + draw_height - (y_coords / max_y) * draw_height
+        start = (int(screen_x[0]), int(screen_y[0]))
+        peak_idx = int(np.argmax(y_coords))
+        
+        self._flight = {
+            'times': times - times[0],
+            'screen_x': screen_x,
+            'screen_y': screen_y,
+            'peak': (int(screen_x[peak_idx]), int(screen_y[peak_idx])),
+            'landing': (int(screen_x[-1]), int(screen_y[-1])),
+            'started': time.perf_counter(),
+            'trail_end': start,
+            'trail': self.screen.copy(),    # The screen without the ball, trail drawn in
+            'ball': pygame.draw.circle(self.screen, self.WHITE, start, 6)
+        }
+        self._drawn_rects.append(self._flight['ball'])
+        self._next_frame = self._flight['started'] + self.frame_interval
+        self._last_frame = self._flight['started']
+    
+    def _advance_flight(self):
+        """Draw one animation frame at the current time"""
+        flight = self._flight
+        now = time.perf_counter()
+        
+        # Frame pacing: count frames that came later than 1.5 intervals
+        if self._last_frame is not None:
+            interval = now - self._last_frame
+            self._frame_intervals.append(interval)
+            if interval > 1.5 * self.frame_interval:
+                self.missed_frames += int(round(interval / self.frame_interval)) - 1
+        self._last_frame = now
+        self._next_frame += self.frame_interval
+        if self._next_frame < now:
+            # Fell behind: schedule from now rather than rushing the missed frames
+            self._next_frame = now + self.frame_interval
+        
+        times = flight['times']
+        flight_time = min((now - flight['started']) * self.playback_speed, times[-1])
+        landed = flight_time >= times[-1]
+        point = (int(np.interp(flight_time, times, flight['screen_x'])),
+                 int(np.interp(flight_time, times, flight['screen_y'])))
+        
+        trail = flight['trail']
+        dirty = [flight['ball']]
+        last = flight['trail_end']
+        if landed or abs(point[0] - last[0]) + abs(point[1] - last[1]) >= self.TRAIL_MIN_STEP_PX:
+            dirty.append(pygame.draw.line(trail, self.BLUE, last, point, 3))
+            flight['trail_end'] = point
+        
+        if landed:
+            # Mark peak and landing
+            dirty.append(pygame.draw.circle(trail, self.RED, flight['peak'], 8))
+            dirty.append(pygame.draw.circle(trail, self.GREEN, flight['landing'], 8))
+        
+        # Erase the old ball and bring in the new trail segment from the trail copy
+        for rect in dirty:
+            self.screen.blit(trail, rect, rect)
+        
+        if landed:
+            self._flight = None
+        else:
+            flight['ball'] = pygame.draw.circle(self.screen, self.WHITE, point, 6)
+            dirty.append(flight['ball'])
+        
+        pygame.display.update(dirty)
+        self.frames += 1
+        self.animation_frames += 1
+        self.pixels_updated += sum(rect.width * rect.height for rect in dirty)
+        self._frame_draw_times.append(time.perf_counter() - now)
+    
+    def _build_statistics_screen(self, surface: pygame.Surface):
+        surface.fill(self.BLACK)
         
         # Title
-        title_text = self.title_font.render("Player Statistics", True, self.WHITE)
-        title_rect = title_text.get_rect(center=(self.screen_size[0]//2, 50))
-        self.screen.blit(title_text, title_rect)
+        self._blit_text(surface, 'title', "Player Statistics", self.WHITE, (self.screen_size[0]//2, 50))
         
         # Headers
         headers = ["Club", "Avg Distance", "Max Distance", "Total Swings"]
@@ -300,9 +905,12 @@ class LiveDisplayManager:
         col_width = self.screen_size[0] // len(headers)
         
         for i, header in enumerate(headers):
-            text = self.heading_font.render(header, True, self.YELLOW)
-            text_rect = text.get_rect(center=(col_width//2 + i*col_width, header_y))
-            self.screen.blit(text, text_rect)
+            self._blit_text(surface, 'heading', header, self.YELLOW, (col_width//2 + i*col_width, header_y))
+    
+    def display_player_statistics(self, player_stats: List[Dict[str, Any]]):
+        """Display player statistics screen"""
+        dirty = self._begin_screen('statistics', self._build_statistics_screen)
+        col_width = self.screen_size[0] // 4
         
         # Statistics data
         start_y = 200
@@ -310,26 +918,18 @@ class LiveDisplayManager:
             y_pos = start_y + i * 30
             
             # Club name
-            club_text = self.text_font.render(stat['club_name'], True, self.WHITE)
-            club_rect = club_text.get_rect(center=(col_width//2, y_pos))
-            self.screen.blit(club_text, club_rect)
+            self._draw_text('text', stat['club_name'], self.WHITE, (col_width//2, y_pos))
             
             # Average distance
-            avg_text = self.text_font.render(f"{stat['avg_distance']:.1f}m", True, self.WHITE)
-            avg_rect = avg_text.get_rect(center=(col_width//2 + col_width, y_pos))
-            self.screen.blit(avg_text, avg_rect)
+            self._draw_text('text', f"{stat['avg_distance']:.1f}m", self.WHITE, (col_width//2 + col_width, y_pos))
             
             # Max distance
-            max_text = self.text_font.render(f"{stat['max_distance']:.1f}m", True, self.WHITE)
-            max_rect = max_text.get_rect(center=(col_width//2 + 2*col_width, y_pos))
-            self.screen.blit(max_text, max_rect)
+            self._draw_text('text', f"{stat['max_distance']:.1f}m", self.WHITE, (col_width//2 + 2*col_width, y_pos))
             
             # Total swings
-            total_text = self.text_font.render(str(stat['total_swings']), True, self.WHITE)
-            total_rect = total_text.get_rect(center=(col_width//2 + 3*col_width, y_pos))
-            self.screen.blit(total_text, total_rect)
+            self._draw_text('text', str(stat['total_swings']), self.WHITE, (col_width//2 + 3*col_width, y_pos))
         
-        pygame.display.flip()
+        self._present(dirty)
     
     def handle_events(self) -> bool:
         """Handle Pygame events, return False to quit"""
@@ -378,6 +978,7 @@ if __name__ == "__main__":
     
     # Test live display manager
     display_manager = LiveDisplayManager()
+    display_manager.display_init()
     
     # Show different screens for testing
     display_manager.display_waiting_screen()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Ingestion Pipeline Benchmark
+
+This example writes synthetic swings as JSON packets into a pseudo-terminal
+and runs them through the full simulator (segmentation, simulation,
+storage) with either the threaded listener or the asyncio pipeline. It
+checks that every swing produced a result and reports throughput,
+impact-to-result latency and the peak number of threads.
+
+Usage:
+    python examples/async_pipeline_benchmark.py [swings]
+"""
+
+import os
+import pty
+import sys
+import json
+import time
+import asyncio
+import logging
+import tempfile
+import threading
+import multiprocessing
+from dataclasses import asdict
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.async_ingestion import AsyncIngestionPipeline, open_serial_connection, close_serial_connection
+from comm.serial_data_listener import SerialDataListener
+from main import GolfHILSSimulator, load_default_config
+from swing_latency_benchmark import generate_swing_samples
+
+def emulate_swings(master_fd: int, swings: int, realtime: bool):
+    """Write swings to the pty, paced at 100 Hz or as fast as the pty accepts"""
+    timestamp = 0
+    next_time = time.perf_counter()
+    for swing in range(swings):
+        samples = generate_swing_samples(timestamp, seed=swing)
+        timestamp = samples[-1].timestamp + 10
+        if not realtime:
+            os.write(master_fd, "".join(json.dumps(asdict(sample)) + "\n" for sample in samples).encode())
+            continue
+        for sample in samples:
+            os.write(master_fd, (json.dumps(asdict(sample)) + "\n").encode())
+            next_time += 0.01
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+
+def make_app(directory: str) -> GolfHILSSimulator:
+    """Simulator without display, with a session on a throwaway database"""
+    config = load_default_config()
+    config['display']['mode'] = 'none'
+    config['database']['path'] = str(Path(directory) / "pipeline_benchmark.db")
+    config['simulation']['cache']['persist_path'] = ''
+    app = GolfHILSSimulator(config)
+    if not app.initialize_components() or not app.start_session("BenchPlayer"):
+        raise RuntimeError("Failed to initialize simulator")
+    return app
+
+def start_emulator(master_fd: int, swings: int, realtime: bool):
+    emulator = multiprocessing.get_context('fork').Process(
+        target=emulate_swings, args=(master_fd, swings, realtime)
+    )
+    emulator.start()
+    return emulator
+
+def run_threads(port: str, master_fd: int, app, swings: int, realtime: bool) -> tuple:
+    """Threaded ingestion: select() listener thread feeding the staged pipeline"""
+    listener = SerialDataListener(port, read_mode='select')
+    app.pipeline.start()
+    listener.set_data_callback(app.handle_swing_data)
+    listener.connect()
+    threading.Thread(target=listener.listen_for_data, daemon=True).start()
+
+    start = time.perf_counter()
+    emulator = start_emulator(master_fd, swings, realtime)
+    peak_threads = 0
+    deadline = time.monotonic() + swings * 5.0 + 10.0
+    while app.result_latency.total < swings and time.monotonic() < deadline:
+        peak_threads = max(peak_threads, threading.active_count())
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    emulator.join()
+    listener.disconnect()
+    app.pipeline.join()
+    return elapsed, peak_threads
+
+async def run_asyncio(port: str, master_fd: int, app, swings: int, realtime: bool) -> tuple:
+    """asyncio ingestion reading the pty through open_serial_connection()"""
+    reader, serial_connection = await open_serial_connection(port)
+    pipeline = AsyncIngestionPipeline(app, reader)
+
+    start = time.perf_counter()
+    emulator = start_emulator(master_fd, swings, realtime)
+    run_task = asyncio.create_task(pipeline.run())
+    peak_threads = 0
+    deadline = time.monotonic() + swings * 5.0 + 10.0
+    while pipeline.swings_processed < swings and time.monotonic() < deadline:
+        peak_threads = max(peak_threads, threading.active_count())
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    # Keep reading until the emulator has written its last sample
+    await asyncio.get_running_loop().run_in_executor(None, emulator.join)
+    pipeline.stop()
+    await run_task
+    close_serial_connection(serial_connection)
+    return elapsed, peak_threads
+
+def run_pipeline(mode: str, swings: int, realtime: bool) -> dict:
+    """One benchmark run on a fresh pty and database"""
+    master_fd, slave_fd = pty.openpty()
+    port = os.ttyname(slave_fd)
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = make_app(directory)
+        if mode == 'asyncio':
+            elapsed, peak_threads = asyncio.run(run_asyncio(port, master_fd, app, swings, realtime))
+        else:
+            elapsed, peak_threads = run_threads(port, master_fd, app, swings, realtime)
+        app.data_store.flush()
+        stored = app.data_store.connection.execute("SELECT COUNT(*) FROM simulation_results").fetchone()[0]
+        summary = app.result_latency.summary()
+        app.cleanup()
+
+    os.close(master_fd)
+    os.close(slave_fd)
+    samples = swings * len(generate_swing_samples())
+    return {
+        'results': summary['count'],
+        'stored': stored,
+        'samples_per_s': samples / elapsed,
+        'p50_ms': summary.get('p50_ms', float('nan')),
+        'max_ms': summary.get('max_ms', float('nan')),
+        'peak_threads': peak_threads
+    }
+
+def main():
+    """Compare threaded and asyncio ingestion over a pty"""
+    logging.basicConfig(level=logging.WARNING)
+    swings = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    print(f"Ingestion pipeline over a pty ({swings} swings x {len(generate_swing_samples())} samples)")
+    print("-" * 60)
+    print(f"{'mode':<9} {'feed':<9} {'results':>8} {'stored':>7} {'samples/s':>10} "
+          f"{'p50 ms':>7} {'max ms':>7} {'threads':>8}")
+
+    ok = True
+    for realtime in (False, True):
+        for mode in ('threads', 'asyncio'):
+            result = run_pipeline(mode, swings, realtime)
+            ok &= result['results'] == swings and result['stored'] == swings
+            print(f"{mode:<9} {'100 Hz' if realtime else 'flood':<9} {result['results']:>8} "
+                  f"{result['stored']:>7} {result['samples_per_s']:>10.0f} {result['p50_ms']:>7.1f} "
+                  f"{result['max_ms']:>7.1f} {result['peak_threads']:>8}")
+
+    if not ok:
+        print("FAILED: not every swing produced a stored result")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Sensor Protocol Benchmark
+
+This example encodes the same synthetic swings as one JSON line per sample,
+as batched "swing_batch" JSON packets and as binary COBS frames and
+reports, for each format:
+
+    - bytes on the wire per sample
+    - samples/s the UART link can carry (8N1: 10 bits per byte)
+    - samples/s the host decodes through SerialDataListener.feed()
+    - samples/s decoded into columnar blocks only (batches and frames)
+
+The sustainable rate is the lower of the link and host rates.
+
+Usage:
+    python examples/binary_protocol_benchmark.py [swings] [baud]
+"""
+
+import sys
+import json
+import time
+import logging
+from dataclasses import asdict
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.binary_protocol import (BinaryFrameDecoder, encode_header_frame,
+                                  encode_sample_frame)
+from comm.serial_data_listener import SENSOR_AXES, SerialDataListener
+from swing_latency_benchmark import generate_swing_samples
+
+def build_samples(swings: int) -> list:
+    samples = []
+    timestamp = 0
+    for swing in range(swings):
+        swing_samples = generate_swing_samples(timestamp, seed=swing)
+        timestamp = swing_samples[-1].timestamp + 10
+        samples.extend(swing_samples)
+    return samples
+
+def encode_json(samples: list) -> bytes:
+    return "".join(json.dumps(asdict(sample)) + "\n" for sample in samples).encode()
+
+def encode_json_batches(samples: list, samples_per_packet: int) -> bytes:
+    """swing_batch packets as sent by the firmware (mG and 0.1 dps integers)"""
+    lines = []
+    for index in range(0, len(samples), samples_per_packet):
+        batch = samples[index:index + samples_per_packet]
+        t0 = batch[0].timestamp
+        lines.append(json.dumps({
+            "type": "swing_batch",
+            "device_id": batch[0].device_id,
+            "player": batch[0].player,
+            "club": batch[0].club,
+            "t0": t0,
+            "t": [sample.timestamp - t0 for sample in batch],
+            "scale": {"accel": 0.001, "gyro": 0.1},
+            "sensor_data": {
+                axis: [round(getattr(sample, axis) / (0.001 if axis.startswith("accel") else 0.1))
+                       for sample in batch]
+                for axis in SENSOR_AXES
+            }
+        }, separators=(',', ':')))
+    return ("\n".join(lines) + "\n").encode()
+
+def encode_binary(samples: list, samples_per_frame: int) -> bytes:
+    first = samples[0]
+    frames = [b'\x00', encode_header_frame(first.device_id, first.club, first.player, seq=0)]
+    for seq, index in enumerate(range(0, len(samples), samples_per_frame), start=1):
+        frames.append(encode_sample_frame(samples[index:index + samples_per_frame], seq=seq))
+    return b"".join(frames)
+
+def time_decode(make_feed, count, stream: bytes, read_size: int = 4096, repeats: int = 3) -> tuple:
+    """Best-of-N wall time to decode stream in read_size chunks
+
+    make_feed() returns a fresh feed(bytes) function and count(result)
+    the number of samples in what it returned.
+    """
+    best = float('inf')
+    decoded = 0
+    for _ in range(repeats):
+        feed = make_feed()
+        decoded = 0
+        start = time.perf_counter()
+        for index in range(0, len(stream), read_size):
+            decoded += count(feed(stream[index:index + read_size]))
+        best = min(best, time.perf_counter() - start)
+    return best, decoded
+
+def run_benchmark(swings: int = 50, baud_rate: int = 115200):
+    """Compare the JSON and binary formats"""
+    samples = build_samples(swings)
+    link_bytes_per_s = baud_rate / 10
+
+    print(f"Sensor protocol benchmark ({len(samples)} samples, {baud_rate} baud)")
+    print("-" * 78)
+    print(f"{'format':<18} {'B/sample':>9} {'link/s':>9} {'host/s':>10} {'columnar/s':>11} {'sustainable/s':>14}")
+
+    cases = [("json", encode_json(samples), 'json')]
+    for samples_per_packet in (10, 32):
+        cases.append((f"json batch x{samples_per_packet}", encode_json_batches(samples, samples_per_packet), 'batch'))
+    for samples_per_frame in (1, 10, 32):
+        cases.append((f"binary x{samples_per_frame}", encode_binary(samples, samples_per_frame), 'binary'))
+
+    results = {}
+    for name, stream, protocol in cases:
+        bytes_per_sample = len(stream) / len(samples)
+        link_rate = link_bytes_per_s / bytes_per_sample
+
+        listener_protocol = 'json' if protocol == 'batch' else protocol
+        elapsed, decoded = time_decode(
+            lambda: SerialDataListener(read_mode='select', protocol=listener_protocol).feed,
+            SerialDataListener.count_samples, stream)
+        if decoded != len(samples):
+            raise RuntimeError(f"{name}: decoded {decoded} of {len(samples)} samples")
+        host_rate = decoded / elapsed
+
+        columnar = ""
+        if protocol == 'batch':
+            listener = SerialDataListener()
+            lines = stream.splitlines()
+            start = time.perf_counter()
+            decoded = sum(len(listener.parse_batch(json.loads(line))) for line in lines)
+            columnar = f"{decoded / (time.perf_counter() - start):>11.0f}"
+        elif protocol == 'binary':
+            elapsed, decoded = time_decode(lambda: BinaryFrameDecoder().feed,
+                                           lambda blocks: sum(len(block) for block in blocks), stream)
+            columnar = f"{decoded / elapsed:>11.0f}"
+
+        sustainable = min(link_rate, host_rate)
+        results[name] = sustainable
+        print(f"{name:<18} {bytes_per_sample:>9.1f} {link_rate:>9.0f} {host_rate:>10.0f} "
+              f"{columnar:>11} {sustainable:>14.0f}")
+
+    return results
+
+def main():
+    """Run the protocol benchmark"""
+    logging.basicConfig(level=logging.WARNING)
+    swings = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    baud_rate = int(sys.argv[2]) if len(sys.argv) > 2 else 115200
+    run_benchmark(swings, baud_rate)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Flight Playback Benchmark
+
+This example plays simulated shots on the results screen with the flight
+animation (SDL dummy video driver, 1024x768) from a display thread running
+the simulator's frame loop, and reports the frame pacing from
+LiveDisplayManager.frame_stats(): frames drawn, missed frames, frame
+interval p50/p99/max, p99 draw time per frame and the display thread's CPU
+usage. It runs once with the process idle and once with a second thread
+simulating trajectories in a loop (the simulate stage competing for the
+GIL).
+
+Usage:
+    python examples/flight_playback_benchmark.py [shots] [playback_speed]
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sim.ball_flight_simulator import GolfBallSimulator
+from disp.trajectory_display import LiveDisplayManager
+from simulation_benchmark import create_sample_launches
+from trajectory_plot_benchmark import create_shots
+
+def simulate_in_loop(stop: threading.Event):
+    """Stand-in for the simulate stage: keeps integrating trajectories"""
+    simulator = GolfBallSimulator(integrator="rk4")
+    launches = create_sample_launches(50, seed=1)
+    while not stop.is_set():
+        for launch in launches:
+            simulator.simulate_trajectory(launch)
+            if stop.is_set():
+                break
+
+def run(shots: list, playback_speed: float, load: bool) -> dict:
+    display = LiveDisplayManager(flight_animation=True, playback_speed=playback_speed)
+    done = threading.Event()
+    cpu = [0.0]
+
+    def display_loop():
+        start = time.thread_time()
+        display.display_init()
+        display.display_waiting_screen()
+        while not done.is_set():
+            display.handle_events()
+            display.wait_for_frame()
+            display.render_pending()
+        cpu[0] = time.thread_time() - start
+        display.cleanup()
+
+    stop_load = threading.Event()
+    load_thread = threading.Thread(target=simulate_in_loop, args=(stop_load,))
+    if load:
+        load_thread.start()
+    thread = threading.Thread(target=display_loop, name="display")
+    thread.start()
+
+    start = time.perf_counter()
+    for shot in shots:
+        display.post('display_simulation_results', shot)
+        # Next shot once this one has landed
+        duration = (shot['trajectory'].time[-1] - shot['trajectory'].time[0]) / playback_speed
+        time.sleep(duration + 0.2)
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    thread.join()
+    if load:
+        stop_load.set()
+        load_thread.join()
+
+    stats = display.frame_stats()
+    stats['cpu_percent'] = cpu[0] / elapsed * 100
+    return stats
+
+def main():
+    """Play shots with and without a competing simulation thread"""
+    logging.basicConfig(level=logging.WARNING)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    playback_speed = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    shots = create_shots(count)
+    flight_time = sum(shot['results']['flight_time'] for shot in shots)
+
+    print(f"Flight playback at 60 FPS ({count} shots, {flight_time:.1f} s of flight, "
+          f"speed x{playback_speed:g}, SDL dummy driver)")
+    print("-" * 78)
+    print(f"{'load':<14} {'frames':>7} {'missed':>7} {'interval p50':>13} {'p99':>8} {'max':>8} "
+          f"{'draw p99':>9} {'CPU':>6}")
+    for load in (False, True):
+        stats = run(shots, playback_speed, load)
+        print(f"{'simulating' if load else 'idle':<14} {stats['animation_frames']:>7} "
+              f"{stats['missed_frames']:>7} {stats.get('frame_interval_p50_ms', 0):>10.2f} ms "
+              f"{stats.get('frame_interval_p99_ms', 0):>5.2f} ms {stats.get('frame_interval_max_ms', 0):>5.1f} ms "
+              f"{stats.get('frame_draw_p99_ms', 0):>6.2f} ms {stats['cpu_percent']:>5.1f}%")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
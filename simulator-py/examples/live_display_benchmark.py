@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Live Display Benchmark
+
+This example drives LiveDisplayManager with the SDL dummy video driver
+through a scripted session and compares rendering with and without the
+render cache (cached text surfaces, cached backgrounds, dirty-rect
+updates). Each shot is 60 display frames at 1024x768:
+
+    frame  0   swing detected
+    frame  5   shot results
+    frame 30   back to the waiting screen (twice, as the Timer and the
+               next swing may both ask for it)
+    every 10th shot the player statistics screen follows
+
+The frames are run back to back on one "display thread". It reports the
+time of frames that redraw the screen, the display thread's CPU time
+expressed as CPU usage at 60 FPS, and the pixels pushed per redraw. Every
+redraw in the script switches screens, so it is a full-screen update; a
+second run redraws the results screen in place, shot after shot, where
+only the changed areas are pushed. The dummy driver does not copy pixels
+to a panel, so the pushed-pixel count is the part of the saving the
+timings here do not show.
+
+Finally a producer thread posts the same screens to a display thread
+running the simulator's frame loop, once paced (a shot every 100 ms) and
+once as a flood, and reports what post() costs the producer, how many
+screens were drawn or coalesced and the post-to-drawn latency of results.
+
+Usage:
+    python examples/live_display_benchmark.py [shots]
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from pathlib import Path
+
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from disp.trajectory_display import LiveDisplayManager
+from trajectory_plot_benchmark import create_shots
+
+FRAMES_PER_SHOT = 60
+CLUBS = ["Driver", "3-Wood", "5-Iron", "7-Iron", "9-Iron", "Pitching Wedge"]
+
+def shot_script(index: int, shot: dict, player_stats: list) -> dict:
+    """Screen updates of one shot, keyed by frame"""
+    club = CLUBS[index % len(CLUBS)]
+    shot = dict(shot, club_used=club)
+    script = {
+        0: [('display_swing_detected', "BenchPlayer", club)],
+        5: [('display_simulation_results', shot)],
+        30: [('display_waiting_screen',), ('display_waiting_screen',)]
+    }
+    if index % 10 == 9:
+        script[45] = [('display_player_statistics', player_stats)]
+    return script
+
+def run(render_cache: bool, shots: list, player_stats: list) -> dict:
+    display = LiveDisplayManager(render_cache=render_cache)
+    display.display_init()
+    display.display_waiting_screen()
+
+    redraw_times = []
+    idle_times = []
+    frames = 0
+    cpu_start = time.thread_time()
+    for index, shot in enumerate(shots):
+        script = shot_script(index, shot, player_stats)
+        for frame in range(FRAMES_PER_SHOT):
+            start = time.perf_counter()
+            display.handle_events()
+            for name, *args in script.get(frame, ()):
+                getattr(display, name)(*args)
+            elapsed = time.perf_counter() - start
+            (redraw_times if frame in script else idle_times).append(elapsed)
+            frames += 1
+    cpu = time.thread_time() - cpu_start
+
+    stats = display.stats()
+    display.cleanup()
+    return {
+        'redraw_mean_ms': np.mean(redraw_times) * 1000,
+        'redraw_p99_ms': np.percentile(redraw_times, 99) * 1000,
+        'idle_mean_ms': np.mean(idle_times) * 1000,
+        'cpu_at_60fps': cpu / (frames / 60.0) * 100,
+        'pixels_per_frame': stats['pixels_updated'] / max(stats['frames'], 1),
+        'frames_presented': stats['frames']
+    }
+
+def run_in_place(render_cache: bool, shots: list) -> dict:
+    """Results screen redrawn with each shot while it stays up"""
+    display = LiveDisplayManager(render_cache=render_cache)
+    display.display_init()
+    display.display_simulation_results(shots[0])
+    frames, pixels = display.frames, display.pixels_updated
+
+    times = []
+    for shot in shots[1:]:
+        start = time.perf_counter()
+        display.display_simulation_results(shot)
+        times.append(time.perf_counter() - start)
+
+    presented = display.frames - frames
+    pixels_per_frame = (display.pixels_updated - pixels) / max(presented, 1)
+    display.cleanup()
+    return {
+        'redraw_mean_ms': np.mean(times) * 1000,
+        'redraw_p99_ms': np.percentile(times, 99) * 1000,
+        'pixels_per_frame': pixels_per_frame
+    }
+
+def run_posted(shots: list, interval_s: float) -> dict:
+    """Producer thread posts screens, display thread draws them"""
+    display = LiveDisplayManager()
+    running = [True]
+
+    def display_loop():
+        display.display_init()
+        display.display_waiting_screen()
+        while running[0]:
+            display.handle_events()
+            display.wait_for_commands(1 / 60)
+            display.render_pending()
+        display.cleanup()
+
+    thread = threading.Thread(target=display_loop)
+    thread.start()
+
+    post_times = []
+    result_latency = []
+    for index, shot in enumerate(shots):
+        posted_at = time.perf_counter()
+        shown = lambda posted_at=posted_at: result_latency.append(time.perf_counter() - posted_at)
+        start = time.perf_counter()
+        display.post('display_swing_detected', "BenchPlayer", CLUBS[index % len(CLUBS)])
+        display.post('display_simulation_results', shot, on_shown=shown, revert_after_s=5.0)
+        post_times.append((time.perf_counter() - start) / 2)
+        time.sleep(interval_s)
+
+    time.sleep(0.1)
+    running[0] = False
+    thread.join()
+    stats = display.stats()
+    return {
+        'post_us': np.mean(post_times) * 1e6,
+        'drawn': stats['commands_drawn'],
+        'coalesced': stats['commands_coalesced'],
+        'results_shown': len(result_latency),
+        'latency_p50_ms': np.percentile(result_latency, 50) * 1000 if result_latency else 0.0,
+        'latency_p99_ms': np.percentile(result_latency, 99) * 1000 if result_latency else 0.0
+    }
+
+def main():
+    """Compare the live display with and without the render cache"""
+    logging.basicConfig(level=logging.WARNING)
+    shots = create_shots(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
+    player_stats = [
+        {'club_name': club, 'avg_distance': 150.0 - 15 * i, 'max_distance': 170.0 - 15 * i,
+         'total_swings': 20 + i}
+        for i, club in enumerate(CLUBS)
+    ]
+
+    print(f"Live display, SDL dummy driver ({len(shots)} shots x {FRAMES_PER_SHOT} frames, 1024x768)")
+    print("-" * 78)
+    print(f"{'render cache':<13} {'redraw mean':>11} {'redraw p99':>11} {'idle frame':>11} "
+          f"{'CPU @60 FPS':>11} {'presented':>10} {'px/present':>11}")
+    for render_cache in (False, True):
+        stats = run(render_cache, shots, player_stats)
+        print(f"{'on' if render_cache else 'off':<13} {stats['redraw_mean_ms']:>8.2f} ms "
+              f"{stats['redraw_p99_ms']:>8.2f} ms {stats['idle_mean_ms']:>8.3f} ms "
+              f"{stats['cpu_at_60fps']:>10.1f}% {stats['frames_presented']:>10} "
+              f"{stats['pixels_per_frame']:>11.0f}")
+
+    print(f"\nResults screen updated in place ({len(shots) - 1} updates)")
+    print("-" * 78)
+    print(f"{'render cache':<13} {'redraw mean':>11} {'redraw p99':>11} {'px/present':>11}")
+    for render_cache in (False, True):
+        stats = run_in_place(render_cache, shots)
+        print(f"{'on' if render_cache else 'off':<13} {stats['redraw_mean_ms']:>8.2f} ms "
+              f"{stats['redraw_p99_ms']:>8.2f} ms {stats['pixels_per_frame']:>11.0f}")
+
+    print(f"\nScreens posted to the display thread ({len(shots)} shots, swing detected + result)")
+    print("-" * 78)
+    print(f"{'producer':<16} {'post()':>8} {'drawn':>6} {'coalesced':>10} {'results shown':>14} "
+          f"{'post->drawn p50':>16} {'p99':>8}")
+    for label, interval_s in (("1 shot / 100 ms", 0.1), ("flood", 0.0)):
+        stats = run_posted(shots, interval_s)
+        print(f"{label:<16} {stats['post_us']:>5.1f} us {stats['drawn']:>6} {stats['coalesced']:>10} "
+              f"{stats['results_shown']:>14} {stats['latency_p50_ms']:>13.2f} ms "
+              f"{stats['latency_p99_ms']:>5.2f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
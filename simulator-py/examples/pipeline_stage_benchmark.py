@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Staged Pipeline Benchmark
+
+This example replays synthetic 100 Hz swings with the live display (SDL
+dummy driver) and PNG export enabled, and compares:
+
+    sequential - simulate, store, display, export the PNG, one after the
+                 other on one thread (the pre-stage processing order)
+    staged     - the simulator's pipeline: the live result is posted to the
+                 display thread while storage and PNG export run on their
+                 own stages
+
+It reports impact-to-live-result and impact-to-stored latency, plus the
+per-stage queue depth and wait/service times.
+
+Usage:
+    python examples/pipeline_stage_benchmark.py [swings]
+"""
+
+import os
+import sys
+import time
+import logging
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from main import GolfHILSSimulator, load_default_config
+from sim.swing_segmenter import LatencyHistogram
+from swing_latency_benchmark import generate_swing_samples
+
+def make_app(directory: str) -> GolfHILSSimulator:
+    config = load_default_config()
+    config['display']['mode'] = 'both'
+    config['database']['path'] = str(Path(directory) / "pipeline_stage_benchmark.db")
+    config['simulation']['cache']['persist_path'] = ''
+    app = GolfHILSSimulator(config)
+    if not app.initialize_components() or not app.start_session("BenchPlayer"):
+        raise RuntimeError("Failed to initialize simulator")
+    return app
+
+def replay(feed, swings: int):
+    """Feed swings at 100 Hz"""
+    timestamp = 0
+    next_time = time.perf_counter()
+    for swing in range(swings):
+        samples = generate_swing_samples(timestamp, seed=swing)
+        timestamp = samples[-1].timestamp + 10
+        for sample in samples:
+            feed(sample)
+            next_time += 0.01
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+
+def run_sequential(app, swings: int) -> tuple:
+    """Everything on the feeding thread, result shown after storage"""
+    result_latency = LatencyHistogram("impact_to_result")
+    stored_latency = LatencyHistogram("impact_to_stored")
+
+    def feed(sample):
+        _, swing_closed = app.segment_sample(sample)
+        if not swing_closed:
+            return
+        swing_samples, swing_analysis, impact_time = app.take_swing()
+        results = app.simulate_swing(swing_samples, swing_analysis)
+        app.persist_swing(swing_samples, results)
+        stored_latency.record(time.perf_counter() - impact_time)
+        app.display_results(results)
+        result_latency.record(time.perf_counter() - impact_time)
+
+    replay(feed, swings)
+    return result_latency, stored_latency
+
+def run_staged(app, swings: int) -> tuple:
+    """The simulator's staged pipeline"""
+    app.start_display_thread()
+    app.pipeline.start()
+    replay(app.handle_swing_data, swings)
+    app.pipeline.join()
+    deadline = time.monotonic() + 5.0
+    while app.result_latency.total < swings and time.monotonic() < deadline:
+        time.sleep(0.01)    # Results still waiting for the display thread
+    return app.result_latency, app.stored_latency
+
+def main():
+    """Compare sequential and staged processing"""
+    logging.basicConfig(level=logging.WARNING)
+    swings = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
+    print(f"Sequential vs staged processing ({swings} swings at 100 Hz, live display + PNG export)")
+    print("-" * 78)
+    cwd = os.getcwd()
+    for name, run in (("sequential", run_sequential), ("staged", run_staged)):
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)    # Trajectory PNGs are written relative to the working directory
+            os.makedirs("trajectories")
+            try:
+                app = make_app(directory)
+                result_latency, stored_latency = run(app, swings)
+                result, stored = result_latency.summary(), stored_latency.summary()
+                print(f"{name:<11} live result p50 {result['p50_ms']:7.1f} ms  max {result['max_ms']:7.1f} ms   "
+                      f"stored p50 {stored['p50_ms']:7.1f} ms")
+                if name == "staged":
+                    print(app.pipeline.format())
+                app.cleanup()
+            finally:
+                os.chdir(cwd)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
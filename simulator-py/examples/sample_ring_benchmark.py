@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Sample Ring Buffer Benchmark
+
+This example pushes synthetic swings through SampleRingBuffer from a
+producer thread (one swing per millisecond, far above the sensor's rate) to
+a consumer thread that either keeps up or takes 5 ms per swing, and reports
+the delivered rate, drops and the high-water mark for each overflow policy.
+It then compares the memory held by a list of SwingData objects and by the
+ring for one swing that never ends (e.g. a sensor stuck above the swing
+threshold).
+
+Usage:
+    python examples/sample_ring_benchmark.py [swings]
+"""
+
+import sys
+import time
+import logging
+import threading
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.sample_ring_buffer import SampleRingBuffer
+from swing_latency_benchmark import generate_swing_samples
+
+def run_spsc(overflow: str, swings: int, capacity: int, consumer_delay_s: float,
+             swing_interval_s: float = 0.001) -> dict:
+    """Producer thread commits swings, consumer thread reads them"""
+    ring = SampleRingBuffer(capacity=capacity, overflow=overflow)
+    swing = generate_swing_samples()
+    received = [0]
+    done = threading.Event()
+
+    def consume():
+        while not done.is_set() or ring.blocks_read < ring.blocks_committed:
+            entry = ring.read_block()
+            if entry is None:
+                time.sleep(0.0005)
+                continue
+            received[0] += len(entry[0])
+            time.sleep(consumer_delay_s)    # Stand-in for simulation work
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+
+    start = time.perf_counter()
+    next_swing = start
+    for index in range(swings):
+        for sample in swing:
+            ring.push(sample)
+        ring.commit(index)
+        next_swing += swing_interval_s
+        time.sleep(max(0.0, next_swing - time.perf_counter()))
+    elapsed = time.perf_counter() - start
+    done.set()
+    consumer.join()
+
+    stats = ring.stats()
+    stats['samples_per_s'] = received[0] / elapsed
+    stats['received'] = received[0]
+    return stats
+
+def endless_swing_memory(samples: int, capacity: int) -> tuple:
+    """Peak traced bytes holding one swing of `samples` in a list vs the ring"""
+    swing = generate_swing_samples()
+
+    tracemalloc.start()
+    buffer = []
+    for index in range(samples):
+        buffer.append(swing[index % len(swing)])
+    # The listener creates a new SwingData per packet; count those too
+    buffer = [type(sample)(**vars(sample)) for sample in buffer]
+    list_peak = tracemalloc.get_traced_memory()[1]
+    del buffer
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    ring = SampleRingBuffer(capacity=capacity)
+    for index in range(samples):
+        ring.push(swing[index % len(swing)])
+    ring_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return list_peak, ring_peak, ring.dropped
+
+def main():
+    """Run the ring buffer benchmarks"""
+    logging.basicConfig(level=logging.ERROR)
+    swings = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    capacity = 4096
+
+    print(f"SPSC hand-off ({swings} swings x {len(generate_swing_samples())} samples, "
+          f"one swing per ms, capacity {capacity})")
+    print("-" * 78)
+    print(f"{'policy':<12} {'consumer':>9} {'delivered/s':>11} {'received':>9} {'dropped':>8} {'high water':>11}")
+    for overflow in SampleRingBuffer.OVERFLOW_POLICIES:
+        for delay in (0.0, 0.005):
+            stats = run_spsc(overflow, swings, capacity, delay)
+            print(f"{overflow:<12} {delay * 1000:>6.0f} ms {stats['samples_per_s']:>11.0f} "
+                  f"{stats['received']:>9} {stats['dropped']:>8} {stats['high_water']:>11}")
+
+    print(f"\nOne swing that never closes (capacity {capacity})")
+    print("-" * 78)
+    for samples in (10_000, 100_000):
+        list_peak, ring_peak, dropped = endless_swing_memory(samples, capacity)
+        print(f"{samples:>7} samples: list {list_peak / 1024:>8.0f} KiB   "
+              f"ring {ring_peak / 1024:>5.0f} KiB   ({dropped} oldest dropped)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Serial Listener Benchmark
+
+This example feeds JSON packets through a pseudo-terminal into
+SerialDataListener and reports the listener's CPU usage and delivery
+latency at idle and at the sensor's 100 Hz rate, for each read mode.
+
+Usage:
+    python examples/serial_listener_benchmark.py [seconds]
+"""
+
+import os
+import pty
+import sys
+import json
+import time
+import logging
+import threading
+import multiprocessing
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.serial_data_listener import SerialDataListener
+
+def emulate_sensor(master_fd: int, rate_hz: float, duration: float):
+    """Write JSON packets to the pty at rate_hz; timestamp is the send time in us"""
+    interval = 1.0 / rate_hz
+    next_time = time.perf_counter()
+    end_time = next_time + duration
+    while next_time < end_time:
+        packet = {
+            'timestamp': time.time_ns() // 1000,
+            'accel_x': 0.3, 'accel_y': 0.3, 'accel_z': 0.9,
+            'gyro_x': 40.0, 'gyro_y': 190.0, 'gyro_z': 40.0,
+            'club': '7-Iron', 'player': 'BenchPlayer', 'device_id': 'M5StickCPlus2_BENCH'
+        }
+        os.write(master_fd, (json.dumps(packet) + "\n").encode())
+        next_time += interval
+        time.sleep(max(0.0, next_time - time.perf_counter()))
+
+def measure_cpu(seconds: float, emulator=None) -> float:
+    """CPU percent of this process (the listener thread) over a wall-clock window"""
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    if emulator:
+        emulator.start()
+    time.sleep(seconds)
+    if emulator:
+        emulator.join()
+    return (time.process_time() - cpu_start) / (time.perf_counter() - wall_start) * 100.0
+
+def benchmark_read_mode(read_mode: str, seconds: float = 5.0, rate_hz: float = 100.0) -> dict:
+    """Idle and loaded CPU plus latency for one read mode"""
+    master_fd, slave_fd = pty.openpty()
+    listener = SerialDataListener(os.ttyname(slave_fd), read_mode=read_mode)
+    latencies = []
+    listener.set_data_callback(
+        lambda swing_data: latencies.append(time.time_ns() // 1000 - swing_data.timestamp)
+    )
+    if not listener.connect():
+        raise RuntimeError("Failed to open the pseudo-terminal")
+    
+    thread = threading.Thread(target=listener.listen_for_data, daemon=True)
+    thread.start()
+    time.sleep(0.2)
+    
+    idle_cpu = measure_cpu(seconds)
+    
+    # The emulator runs in its own process so its CPU is not counted
+    emulator = multiprocessing.get_context('fork').Process(
+        target=emulate_sensor, args=(master_fd, rate_hz, seconds)
+    )
+    loaded_cpu = measure_cpu(seconds, emulator)
+    time.sleep(0.2)
+    
+    listener.disconnect()
+    thread.join(timeout=2.0)
+    os.close(master_fd)
+    os.close(slave_fd)
+    
+    latencies.sort()
+    return {
+        'idle_cpu': idle_cpu,
+        'loaded_cpu': loaded_cpu,
+        'packets': len(latencies),
+        'p50_latency_ms': latencies[len(latencies) // 2] / 1000.0 if latencies else float('nan'),
+        'max_latency_ms': latencies[-1] / 1000.0 if latencies else float('nan')
+    }
+
+def main():
+    """Compare the polling and select() listener loops"""
+    logging.basicConfig(level=logging.WARNING)
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    
+    print(f"Serial listener over a pty ({seconds:.0f} s idle, {seconds:.0f} s at 100 Hz)")
+    print("-" * 60)
+    print(f"{'mode':<8} {'idle CPU %':>11} {'100 Hz CPU %':>13} {'packets':>8} "
+          f"{'p50 ms':>7} {'max ms':>7}")
+    for read_mode in SerialDataListener.READ_MODES:
+        result = benchmark_read_mode(read_mode, seconds)
+        print(f"{read_mode:<8} {result['idle_cpu']:>11.2f} {result['loaded_cpu']:>13.2f} "
+              f"{result['packets']:>8} {result['p50_latency_ms']:>7.2f} {result['max_latency_ms']:>7.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Simulation Benchmark
+
+This example times the ball flight simulator so performance changes can be
+compared on the development machine and on the Raspberry Pi.
+
+Usage:
+    python examples/simulation_benchmark.py
+"""
+
+import sys
+import math
+import time
+import logging
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sim.ball_flight_simulator import (
+    GolfBallSimulator, LaunchConditions, TrajectoryLookupTable, SWING_FIELDS
+)
+from comm.serial_data_listener import SwingData
+
+def create_sample_launches(count: int, seed: int = 0):
+    """Create a reproducible spread of launch conditions"""
+    rng = np.random.default_rng(seed)
+    return [
+        LaunchConditions(
+            ball_speed=float(rng.uniform(20.0, 80.0)),
+            launch_angle=float(rng.uniform(5.0, 40.0)),
+            spin_rate=float(rng.uniform(0.0, 3000.0)),
+            carry_distance=0,
+            total_distance=0,
+            max_height=0,
+            flight_time=0
+        )
+        for _ in range(count)
+    ]
+
+def benchmark_batch_engine(sizes=(1, 100, 10000)):
+    """Compare simulate_trajectories_batch against the scalar path"""
+    simulator = GolfBallSimulator()
+
+    print("Batch trajectory engine")
+    print("-" * 60)
+    print(f"{'N':>8} {'scalar (s)':>12} {'batch (s)':>12} {'speedup':>10} {'max err':>10}")
+
+    for size in sizes:
+        launches = create_sample_launches(size)
+
+        start = time.perf_counter()
+        scalar_results = [
+            simulator.analyze_trajectory(simulator.simulate_trajectory(launch))
+            for launch in launches
+        ]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_results = simulator.simulate_trajectories_batch(launches)
+        batch_time = time.perf_counter() - start
+
+        max_error = max(
+            abs(scalar[key] - batch[key])
+            for scalar, batch in zip(scalar_results, batch_results)
+            for key in scalar
+        )
+
+        print(f"{size:>8} {scalar_time:>12.4f} {batch_time:>12.4f} "
+              f"{scalar_time / batch_time:>9.1f}x {max_error:>10.2e}")
+
+def benchmark_integrators(shots: int = 50):
+    """Compare step counts, time and accuracy of the available integrators"""
+    reference = GolfBallSimulator(integrator="rk45", timestep=0.001, tolerance=1e-12)
+
+    # Low-spin launches so every shot comes back down before the flight time cap
+    launches = [
+        LaunchConditions(
+            ball_speed=launch.ball_speed,
+            launch_angle=launch.launch_angle,
+            spin_rate=launch.spin_rate / 100,
+            carry_distance=0,
+            total_distance=0,
+            max_height=0,
+            flight_time=0
+        )
+        for launch in create_sample_launches(shots, seed=1)
+    ]
+    reference_results = [
+        reference.analyze_trajectory(reference.simulate_trajectory(launch))
+        for launch in launches
+    ]
+
+    print("Integrators (errors vs. rk45 @ tol 1e-12)")
+    print("-" * 60)
+    print(f"{'integrator':<18} {'steps/shot':>10} {'ms/shot':>10} {'carry err':>10} {'time err':>10}")
+
+    for integrator, timestep, tolerance in [
+        ("euler", 0.01, 1e-6),
+        ("rk4", 0.01, 1e-6),
+        ("rk4", 0.05, 1e-6),
+        ("rk45", 0.01, 1e-6),
+    ]:
+        simulator = GolfBallSimulator(integrator=integrator, timestep=timestep, tolerance=tolerance)
+
+        start = time.perf_counter()
+        trajectories = [simulator.simulate_trajectory(launch) for launch in launches]
+        elapsed = time.perf_counter() - start
+
+        results = [simulator.analyze_trajectory(trajectory) for trajectory in trajectories]
+        carry_error = max(
+            abs(result["carry_distance"] - ref["carry_distance"])
+            for result, ref in zip(results, reference_results)
+        )
+        time_error = max(
+            abs(result["flight_time"] - ref["flight_time"])
+            for result, ref in zip(results, reference_results)
+        )
+        steps = sum(len(trajectory) for trajectory in trajectories) / shots
+
+        label = f"{integrator} ({timestep:g}s)"
+        print(f"{label:<18} {steps:>10.0f} {elapsed / shots * 1000:>10.3f} "
+              f"{carry_error:>10.2e} {time_error:>10.2e}")
+
+def benchmark_lookup_table(resolution=(30, 25, 30), lookups: int = 10000):
+    """Time table build/lookup and report its error against the integrator"""
+    simulator = GolfBallSimulator(integrator="rk4", timestep=0.05)
+
+    start = time.perf_counter()
+    lookup_table = TrajectoryLookupTable.build(simulator, resolution)
+    build_time = time.perf_counter() - start
+
+    launches = create_sample_launches(lookups, seed=2)
+
+    start = time.perf_counter()
+    for launch in launches:
+        lookup_table.lookup(launch.ball_speed, launch.launch_angle, launch.spin_rate)
+    lookup_time = (time.perf_counter() - start) / lookups
+
+    start = time.perf_counter()
+    for launch in launches[:100]:
+        simulator.analyze_trajectory(simulator.simulate_trajectory(launch))
+    full_time = (time.perf_counter() - start) / 100
+
+    print(f"Lookup table {resolution}")
+    print("-" * 60)
+    print(f"Build: {build_time:.2f} s, {lookup_table.results.nbytes / 1024:.0f} KiB")
+    print(f"Lookup: {lookup_time * 1e6:.1f} us/shot vs. full integration "
+          f"{full_time * 1e6:.0f} us/shot")
+    print(f"Served cells: {lookup_table.coverage():.1%} "
+          f"(all corners landed, error <= {lookup_table.max_cell_error:g} m)")
+    if not lookup_table.coverage():
+        return
+    print(f"{'metric':<18} {'max err':>10} {'p95 err':>10} {'mean err':>10}")
+    for metric, errors in lookup_table.error_report().items():
+        print(f"{metric:<18} {errors['max_error']:>10.3g} {errors['p95_error']:>10.3g} "
+              f"{errors['mean_error']:>10.3g}")
+
+def measure_allocations(func, repeat: int = 20):
+    """Peak traced memory (bytes) and allocated blocks per call of func"""
+    tracemalloc.start()
+    start_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.reset_peak()
+
+    kept = [func() for _ in range(repeat)]
+
+    _, peak = tracemalloc.get_traced_memory()
+    end_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    del kept
+    return peak / repeat, (end_blocks - start_blocks) / repeat
+
+def benchmark_trajectory_memory():
+    """Per-shot allocations of List[TrajectoryPoint] + consumer copies vs TrajectoryArray views"""
+    simulator = GolfBallSimulator(integrator="euler", timestep=0.01)
+    launch = LaunchConditions(ball_speed=60.0, launch_angle=12.0, spin_rate=20.0,
+                              carry_distance=0, total_distance=0, max_height=0, flight_time=0)
+
+    def legacy_shot():
+        # Old layout: dataclass list plus the copies main, the data store and the display made
+        points = list(simulator.simulate_trajectory(launch))
+        plot_data = [{'x': p.x, 'y': p.y, 'time': p.time} for p in points]
+        stored = [{'time': p.time, 'x': p.x, 'y': p.y, 'vx': p.velocity_x, 'vy': p.velocity_y}
+                  for p in points]
+        x_coords = [p['x'] for p in plot_data]
+        y_coords = [p['y'] for p in plot_data]
+        return points, plot_data, stored, x_coords, y_coords
+
+    def columnar_shot():
+        trajectory = simulator.simulate_trajectory(launch)
+        return trajectory, trajectory.x, trajectory.y
+
+    points = len(simulator.simulate_trajectory(launch))
+    print(f"Trajectory memory per shot ({points} points)")
+    print("-" * 60)
+    print(f"{'layout':<24} {'peak KiB':>10} {'blocks kept':>12}")
+    for label, func in [("List[TrajectoryPoint]", legacy_shot), ("TrajectoryArray", columnar_shot)]:
+        peak, blocks = measure_allocations(func)
+        print(f"{label:<24} {peak / 1024:>10.1f} {blocks:>12.0f}")
+
+def legacy_analyze_swing_data(swing_data_points):
+    """Per-sample Python loop the simulator used before vectorization"""
+    max_angular_velocity = 0
+    for point in swing_data_points:
+        angular_vel = math.sqrt(point.gyro_x**2 + point.gyro_y**2 + point.gyro_z**2)
+        max_angular_velocity = max(max_angular_velocity, angular_vel)
+
+    max_acceleration = 0
+    for point in swing_data_points:
+        accel_magnitude = math.sqrt(point.accel_x**2 + point.accel_y**2 + point.accel_z**2)
+        max_acceleration = max(max_acceleration, accel_magnitude)
+
+    return max_angular_velocity, max_acceleration
+
+def benchmark_swing_analysis(sizes=(100, 1000, 10000, 100000)):
+    """Compare the legacy loop, object-list input and columnar input"""
+    simulator = GolfBallSimulator()
+    rng = np.random.default_rng(3)
+
+    print("Swing analysis")
+    print("-" * 60)
+    print(f"{'samples':>8} {'loop (ms)':>10} {'list (ms)':>10} {'array (ms)':>11} {'speedup':>9}")
+
+    for size in sizes:
+        timestamps = np.arange(size) * 10
+        samples = rng.normal(0.0, 50.0, (size, len(SWING_FIELDS)))
+        points = [
+            SwingData(int(timestamps[i]), *samples[i].tolist(), "7-Iron", "Bench", "bench")
+            for i in range(size)
+        ]
+
+        start = time.perf_counter()
+        legacy_analyze_swing_data(points)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        simulator.analyze_swing_data(points)
+        list_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        simulator.analyze_swing_data(samples, timestamps)
+        array_time = time.perf_counter() - start
+
+        print(f"{size:>8} {loop_time * 1000:>10.2f} {list_time * 1000:>10.2f} "
+              f"{array_time * 1000:>11.3f} {loop_time / array_time:>8.0f}x")
+
+def main():
+    """Run all simulation benchmarks"""
+    logging.basicConfig(level=logging.WARNING)
+    benchmark_batch_engine()
+    print()
+    benchmark_integrators()
+    print()
+    benchmark_lookup_table()
+    print()
+    benchmark_trajectory_memory()
+    print()
+    benchmark_swing_analysis()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
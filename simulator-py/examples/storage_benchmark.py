@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Storage Benchmark
+
+This example times GolfDataStore operations on a throwaway database so
+storage changes can be compared on the development machine and on the
+Raspberry Pi's SD card.
+
+Usage:
+    python examples/storage_benchmark.py [directory]
+"""
+
+import sys
+import csv
+import json
+import time
+import logging
+import resource
+import tempfile
+import threading
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.golf_data_store import GolfDataStore
+from sim.ball_flight_simulator import GolfBallSimulator, LaunchConditions
+
+SAMPLE_FIELDS = ('accel_x', 'accel_y', 'accel_z', 'gyro_x', 'gyro_y', 'gyro_z')
+
+def make_sample(timestamp: int) -> dict:
+    """One per-sample swing dict as main.handle_swing_data builds it"""
+    return {
+        'timestamp': timestamp,
+        'club': '7-Iron',
+        'player': 'BenchPlayer',
+        'device_id': 'M5StickCPlus2_BENCH',
+        'accel_x': 0.3,
+        'accel_y': 0.3,
+        'accel_z': 0.9,
+        'gyro_x': 40.0,
+        'gyro_y': 190.0,
+        'gyro_z': 40.0
+    }
+
+def benchmark_write_behind(directory: str, samples: int = 2000):
+    """Time per-sample ingestion with synchronous commits vs. the write-behind queue"""
+    print(f"Per-sample inserts ({samples} samples)")
+    print("-" * 60)
+    print(f"{'mode':<14} {'ingest us/sample':>17} {'max ingest ms':>14} {'total s':>9}")
+
+    for label, write_behind in [("synchronous", False), ("write-behind", True)]:
+        data_store = GolfDataStore(str(Path(directory) / f"write_{label}.db"),
+                                   write_behind=write_behind)
+        session_id = data_store.create_session("BenchPlayer")
+
+        start = time.perf_counter()
+        worst = 0.0
+        for i in range(samples):
+            call_start = time.perf_counter()
+            data_store.enqueue_swing_data(session_id, make_sample(i * 10))
+            worst = max(worst, time.perf_counter() - call_start)
+        ingest_time = time.perf_counter() - start
+
+        data_store.flush()
+        total_time = time.perf_counter() - start
+        stats = data_store.get_write_stats()
+        data_store.close()
+
+        print(f"{label:<14} {ingest_time / samples * 1e6:>17.1f} {worst * 1000:>14.2f} "
+              f"{total_time:>9.2f}")
+        if write_behind:
+            print(f"  batches: {stats['batches_committed']}, "
+                  f"avg commit: {stats['avg_commit_ms']:.2f} ms, "
+                  f"max commit: {stats['max_commit_ms']:.2f} ms")
+
+def benchmark_sample_storage(directory: str, swings: int = 200, samples_per_swing: int = 200):
+    """Database size and insert/read throughput: JSON rows vs. packed blobs"""
+    rng = np.random.default_rng(0)
+    swing_data = [
+        (np.arange(samples_per_swing, dtype=np.int64) * 10 + 1_700_000_000_000 + i * 10_000,
+         rng.normal(0.0, 50.0, (samples_per_swing, 6)))
+        for i in range(swings)
+    ]
+    total_samples = swings * samples_per_swing
+
+    print(f"Sample storage ({swings} swings x {samples_per_swing} samples)")
+    print("-" * 60)
+    print(f"{'layout':<12} {'size KiB':>10} {'insert samp/s':>14} {'read samp/s':>13}")
+
+    for label, storage, compress in [("json rows", "json", False),
+                                     ("blob", "blob", False),
+                                     ("blob+zlib", "blob", True)]:
+        path = Path(directory) / f"samples_{label.replace('+', '_').replace(' ', '_')}.db"
+        data_store = GolfDataStore(str(path), sample_storage=storage, compress_samples=compress)
+        session_id = data_store.create_session("BenchPlayer")
+
+        start = time.perf_counter()
+        if storage == "json":
+            # One transaction per swing so the comparison is not dominated by fsyncs
+            with data_store.connection:
+                for timestamps, samples in swing_data:
+                    data_store.connection.executemany(data_store.SWING_INSERT, [
+                        data_store._swing_row(session_id, {
+                            **make_sample(int(t)),
+                            **dict(zip(SAMPLE_FIELDS, row.tolist()))
+                        })
+                        for t, row in zip(timestamps, samples)
+                    ])
+        else:
+            for timestamps, samples in swing_data:
+                data_store.store_swing_samples(session_id, timestamps, samples,
+                                               '7-Iron', 'BenchPlayer', 'M5StickCPlus2_BENCH')
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read_samples = 0
+        if storage == "json":
+            cursor = data_store.connection.execute("SELECT timestamp, raw_data FROM swings")
+            rows = [(timestamp, json.loads(raw_data)) for timestamp, raw_data in cursor]
+            timestamps = np.array([timestamp for timestamp, _ in rows])
+            samples = np.array([[sample[field] for field in SAMPLE_FIELDS] for _, sample in rows])
+            read_samples = len(samples)
+        else:
+            for _, timestamps, samples in data_store.iter_swing_samples(session_id):
+                read_samples += len(samples)
+        read_time = time.perf_counter() - start
+
+        data_store.close()
+        assert read_samples == total_samples
+
+        print(f"{label:<12} {path.stat().st_size / 1024:>10.0f} "
+              f"{total_samples / insert_time:>14.0f} {total_samples / read_time:>13.0f}")
+
+def benchmark_trajectory_storage(directory: str, shots: int = 200):
+    """Size, store and load time of simulation_results trajectories per encoding"""
+    simulator = GolfBallSimulator(integrator="euler", timestep=0.01)
+    rng = np.random.default_rng(0)
+    trajectories = [
+        simulator.simulate_trajectory(LaunchConditions(
+            ball_speed=float(rng.uniform(30.0, 75.0)),
+            launch_angle=float(rng.uniform(8.0, 30.0)),
+            spin_rate=float(rng.uniform(0.0, 40.0)),
+            carry_distance=0, total_distance=0, max_height=0, flight_time=0
+        ))
+        for _ in range(shots)
+    ]
+    points = sum(len(trajectory) for trajectory in trajectories)
+    
+    print(f"Trajectory storage ({shots} shots, {points / shots:.0f} points/shot)")
+    print("-" * 60)
+    print(f"{'encoding':<18} {'bytes/shot':>10} {'store ms':>9} {'load ms':>8} {'max error':>10}")
+    
+    for storage, compression in [("json", "none"), ("blob", "none"),
+                                 ("blob", "zlib"), ("blob", "delta-zlib")]:
+        label = "json" if storage == "json" else GolfDataStore.TRAJECTORY_COMPRESSION[compression]
+        path = Path(directory) / f"trajectories_{label}.db"
+        data_store = GolfDataStore(str(path), trajectory_storage=storage,
+                                   trajectory_compression=compression)
+        
+        start = time.perf_counter()
+        result_ids = [
+            data_store.store_simulation_result(0, {'results': {}, 'launch_conditions': {},
+                                                   'trajectory': trajectory})
+            for trajectory in trajectories
+        ]
+        store_time = time.perf_counter() - start
+        
+        size = data_store.connection.execute(
+            "SELECT SUM(LENGTH(COALESCE(trajectory_blob, trajectory_data))) FROM simulation_results"
+        ).fetchone()[0]
+        
+        start = time.perf_counter()
+        loaded = [data_store.load_trajectory(result_id) for result_id in result_ids]
+        load_time = time.perf_counter() - start
+        data_store.close()
+        
+        error = max(np.max(np.abs(columns['y'] - trajectory.y))
+                    for columns, trajectory in zip(loaded, trajectories))
+        print(f"{label:<18} {size / shots:>10.0f} {store_time / shots * 1000:>9.3f} "
+              f"{load_time / shots * 1000:>8.3f} {error:>10.1e}")
+
+def build_synthetic_database(path: str, samples: int = 1_000_000, players: int = 10,
+                             samples_per_swing: int = 200, trajectory=None):
+    """JSON-per-sample database with one simulation result per swing
+    
+    If a trajectory is given, every result stores it as a packed blob.
+    """
+    data_store = GolfDataStore(path)
+    connection = data_store.connection
+    swings = samples // samples_per_swing
+    sessions = {}
+    trajectory_blob = (GolfDataStore.encode_trajectory(trajectory) if trajectory is not None
+                       else (None, None, None))
+    
+    with connection:
+        for swing in range(swings):
+            player = f"Player{swing % players}"
+            session_key = (player, swing // (players * 50))
+            if session_key not in sessions:
+                cursor = connection.execute(
+                    "INSERT INTO sessions (session_date, player_name) VALUES (?, ?)",
+                    (f"2025-01-{1 + session_key[1] % 28:02d}", player)
+                )
+                sessions[session_key] = cursor.lastrowid
+            session_id = sessions[session_key]
+            
+            base = 1_700_000_000_000 + swing * 10_000
+            created_at = f"2025-01-01 00:{(swing // 60) % 60:02d}:{swing % 60:02d}.{swing:07d}"
+            sample = json.dumps({**make_sample(base), 'player': player})
+            cursor = connection.executemany("""
+                INSERT INTO swings (session_id, timestamp, club_name, player_name, device_id,
+                                    raw_data, created_at)
+                VALUES (?, ?, '7-Iron', ?, 'M5StickCPlus2_BENCH', ?, ?)
+            """, [(session_id, base + i * 10, player, sample, created_at)
+                  for i in range(samples_per_swing)])
+            connection.execute("""
+                INSERT INTO simulation_results (swing_id, carry_distance, max_height,
+                                                trajectory_blob, trajectory_points, trajectory_encoding)
+                VALUES ((SELECT MAX(id) FROM swings), ?, ?, ?, ?, ?)
+            """, (120.0 + swing % 40, 25.0) + trajectory_blob)
+    
+    data_store.close()
+    return swings, len(sessions)
+
+def time_query(function, repeats: int = 5) -> float:
+    """Median wall time of function() in milliseconds"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return sorted(times)[len(times) // 2]
+
+def benchmark_performance_profile(directory: str, samples: int = 1_000_000):
+    """Query and commit timings on a large database without and with the performance profile"""
+    path = str(Path(directory) / "profile.db")
+    start = time.perf_counter()
+    swings, sessions = build_synthetic_database(path, samples)
+    print(f"Performance profile ({samples} samples, {swings} swings, {sessions} sessions, "
+          f"built in {time.perf_counter() - start:.1f} s)")
+    print("-" * 60)
+    
+    queries = {
+        'recent swings': lambda store: store.get_recent_swings("Player3", 10),
+        'session swings': lambda store: store.connection.execute(
+            "SELECT COUNT(*), MIN(timestamp) FROM swings WHERE session_id = ?", (sessions // 2,)
+        ).fetchall(),
+        'result by swing': lambda store: store.connection.execute(
+            "SELECT carry_distance FROM simulation_results WHERE swing_id = ?", (samples // 2,)
+        ).fetchall(),
+    }
+    
+    print(f"{'profile':<10} {'open ms':>8} " + " ".join(f"{name:>16}" for name in queries) +
+          f" {'commit ms':>10}")
+    for profile in (False, True):
+        start = time.perf_counter()
+        data_store = GolfDataStore(path, performance_profile=profile)
+        open_time = (time.perf_counter() - start) * 1000.0  # Includes index creation on first use
+        
+        timings = [time_query(lambda: query(data_store)) for query in queries.values()]
+        commit_time = time_query(
+            lambda: data_store.store_swing_data(1, make_sample(0)), repeats=50
+        )
+        data_store.close()
+        
+        print(f"{'on' if profile else 'off':<10} {open_time:>8.0f} " +
+              " ".join(f"{timing:>16.2f}" for timing in timings) + f" {commit_time:>10.2f}")
+
+def benchmark_concurrent_reads(directory: str, samples: int = 3000, readers: int = 3):
+    """Stats queries from reader threads while samples are ingested as fast as possible"""
+    print(f"Concurrent reads ({samples} samples, {readers} reader threads)")
+    print("-" * 60)
+    print(f"{'profile':<10} {'max ingest ms':>14} {'queries':>8} {'p50 query ms':>13} {'max query ms':>13}")
+    
+    for profile in (False, True):
+        data_store = GolfDataStore(str(Path(directory) / f"concurrent_{profile}.db"),
+                                   write_behind=True, performance_profile=profile)
+        session_id = data_store.create_session("BenchPlayer")
+        stop = threading.Event()
+        query_times = []
+        
+        def run_queries():
+            while not stop.is_set():
+                start = time.perf_counter()
+                data_store.get_recent_swings("BenchPlayer", 10)
+                data_store.get_player_statistics("BenchPlayer")
+                query_times.append((time.perf_counter() - start) * 1000.0)
+        
+        threads = [threading.Thread(target=run_queries) for _ in range(readers)]
+        for thread in threads:
+            thread.start()
+        
+        worst = 0.0
+        for i in range(samples):
+            start = time.perf_counter()
+            data_store.enqueue_swing_data(session_id, make_sample(i * 10))
+            if i % 100 == 0:
+                # A finished swing: result and statistics written from this thread
+                swing_id = data_store.store_swing_data(session_id, make_sample(i * 10))
+                data_store.store_simulation_result(swing_id, {'results': {'carry_distance': 120.0}})
+                data_store.update_player_statistics("BenchPlayer", "7-Iron", 120.0)
+            worst = max(worst, time.perf_counter() - start)
+        
+        data_store.flush()
+        stop.set()
+        for thread in threads:
+            thread.join()
+        data_store.close()
+        
+        query_times.sort()
+        print(f"{'on' if profile else 'off':<10} {worst * 1000:>14.2f} {len(query_times):>8} "
+              f"{query_times[len(query_times) // 2]:>13.2f} {query_times[-1]:>13.2f}")
+
+def legacy_export_to_csv(data_store: GolfDataStore, output_dir: str) -> int:
+    """Previous export_to_csv: fetchall() of the whole swings/results join"""
+    cursor = data_store.connection.cursor()
+    cursor.execute("""
+        SELECT s.timestamp, s.club_name, s.player_name, 
+               sr.carry_distance, sr.max_height, sr.flight_time,
+               sr.ball_speed, sr.launch_angle, sr.spin_rate
+        FROM swings s
+        LEFT JOIN simulation_results sr ON s.id = sr.swing_id
+        ORDER BY s.created_at
+    """)
+    rows = cursor.fetchall()
+    with open(Path(output_dir) / "swings_legacy.csv", 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerows(rows)
+    return len(rows)
+
+def export_worker(path: str, output_dir: str, export_format: str, results):
+    """Run one export in a fresh process; report rows, seconds and RSS in KiB"""
+    data_store = GolfDataStore(path)
+    if export_format in GolfDataStore.EXPORT_FORMATS:
+        import pyarrow.parquet  # Keep the library itself out of the measured growth
+    rows = data_store.connection.execute(
+        "SELECT COUNT(*) FROM swings s LEFT JOIN simulation_results sr ON s.id = sr.swing_id"
+    ).fetchone()[0]
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    
+    start = time.perf_counter()
+    if export_format == 'csv-fetchall':
+        legacy_export_to_csv(data_store, output_dir)
+    elif export_format == 'csv':
+        data_store.export_to_csv(output_dir)
+    else:
+        exported = data_store.export_columnar(output_dir, export_format)
+        rows = exported['shot_rows'] + exported['sample_rows']
+    elapsed = time.perf_counter() - start
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    data_store.close()
+    results.put((rows, elapsed, baseline, peak))
+
+def benchmark_export(directory: str, samples: int = 1_000_000):
+    """Rows/sec and peak RSS of each export format, one fresh process per run"""
+    path = str(Path(directory) / "export.db")
+    simulator = GolfBallSimulator(integrator="euler", timestep=0.01)
+    trajectory = simulator.simulate_trajectory(LaunchConditions(
+        ball_speed=60.0, launch_angle=15.0, spin_rate=20.0,
+        carry_distance=0, total_distance=0, max_height=0, flight_time=0
+    ))
+    swings, _ = build_synthetic_database(path, samples, trajectory=trajectory)
+    
+    print(f"Export ({samples} JSON samples, {swings} shots with {len(trajectory)}-point trajectories)")
+    print("-" * 60)
+    print(f"{'format':<14} {'rows':>9} {'rows/s':>10} {'peak RSS MiB':>13} {'growth MiB':>11} {'size MiB':>9}")
+    
+    context = multiprocessing.get_context('spawn')
+    for export_format in ('csv-fetchall', 'csv', 'parquet', 'arrow'):
+        output_dir = Path(directory) / f"export_{export_format}"
+        output_dir.mkdir(exist_ok=True)
+        results = context.Queue()
+        process = context.Process(target=export_worker,
+                                  args=(path, str(output_dir), export_format, results))
+        process.start()
+        rows, elapsed, baseline, peak = results.get()
+        process.join()
+        
+        size = sum(file.stat().st_size for file in output_dir.iterdir())
+        print(f"{export_format:<14} {rows:>9} {rows / elapsed:>10.0f} {peak / 1024:>13.1f} "
+              f"{(peak - baseline) / 1024:>11.1f} {size / 2**20:>9.1f}")
+
+def run_benchmarks(directory: str):
+    """Run every storage benchmark in one directory"""
+    benchmark_write_behind(directory)
+    print()
+    benchmark_sample_storage(directory)
+    print()
+    benchmark_trajectory_storage(directory)
+    print()
+    benchmark_performance_profile(directory)
+    print()
+    benchmark_concurrent_reads(directory)
+    print()
+    benchmark_export(directory)
+
+def main():
+    """Run all storage benchmarks"""
+    logging.basicConfig(level=logging.WARNING)
+
+    if len(sys.argv) > 1:
+        run_benchmarks(sys.argv[1])
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            run_benchmarks(directory)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
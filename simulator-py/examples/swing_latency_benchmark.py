@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Swing Latency Benchmark
+
+This example replays a synthetic 100 Hz IMU stream through the simulator's
+handle_swing_data() and reports the impact-to-result latency histogram.
+
+Usage:
+    python examples/swing_latency_benchmark.py [swings]
+"""
+
+import sys
+import time
+import logging
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.serial_data_listener import SwingData
+from main import GolfHILSSimulator, load_default_config
+
+def generate_swing_samples(start_timestamp: int = 0, seed: int = 0, club: str = "7-Iron",
+                           player: str = "BenchPlayer"):
+    """One swing at 100 Hz: address, backswing, downswing, impact, follow-through, rest"""
+    rng = np.random.default_rng(seed)
+
+    # (samples, gyro dps start, gyro dps end, accel G)
+    phases = [
+        (50, 5.0, 5.0, 1.0),        # Address
+        (60, 20.0, 300.0, 1.2),     # Backswing
+        (25, 300.0, 1200.0, 2.0),   # Downswing
+        (1, 1200.0, 1200.0, 8.0),   # Impact
+        (40, 1000.0, 50.0, 1.5),    # Follow-through
+        (50, 10.0, 5.0, 1.0),       # Finish / rest
+    ]
+
+    samples = []
+    timestamp = start_timestamp
+    for count, gyro_start, gyro_end, accel in phases:
+        for gyro in np.linspace(gyro_start, gyro_end, count):
+            noise = rng.normal(0.0, 0.02, 6)
+            samples.append(SwingData(
+                timestamp=timestamp,
+                accel_x=accel * 0.3 + noise[0],
+                accel_y=accel * 0.3 + noise[1],
+                accel_z=accel * 0.9 + noise[2],
+                gyro_x=gyro * 0.2 + noise[3],
+                gyro_y=gyro * 0.95 + noise[4],
+                gyro_z=gyro * 0.2 + noise[5],
+                club=club,
+                player=player,
+                device_id="M5StickCPlus2_BENCH"
+            ))
+            timestamp += 10
+    return samples
+
+def run_latency_benchmark(swings: int = 20, realtime: bool = True):
+    """Replay swings through GolfHILSSimulator and print the latency histogram"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = load_default_config()
+        config['display']['mode'] = 'none'
+        config['database']['path'] = str(Path(tmpdir) / "latency_benchmark.db")
+        config['simulation']['cache']['persist_path'] = ''
+
+        app = GolfHILSSimulator(config)
+        if not app.initialize_components():
+            print("Failed to initialize simulator")
+            return None
+        
+        # Samples are stored from this thread, results from the swing workers
+        if not app.start_session("BenchPlayer"):
+            print("Failed to start session")
+            return None
+        app.pipeline.start()
+
+        timestamp = 0
+        for swing in range(swings):
+            samples = generate_swing_samples(timestamp, seed=swing)
+            timestamp = samples[-1].timestamp + 10
+            next_time = time.perf_counter()
+            for sample in samples:
+                app.handle_swing_data(sample)
+                if realtime:
+                    next_time += 0.01
+                    time.sleep(max(0.0, next_time - time.perf_counter()))
+
+        # Let the last worker finish
+        time.sleep(0.5)
+        print(app.result_latency.format())
+        app.cleanup()
+        return app.result_latency.summary()
+
+def main():
+    """Run the latency benchmark"""
+    logging.basicConfig(level=logging.WARNING)
+    swings = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    run_latency_benchmark(swings)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,7 +15,7 @@ from pathlib import Path
 # Add parent directory to path to import modules
 sys.path.append(str(Path(__file__).parent.parent))
 
-from sim.ball_flight_simulator import GolfBallSimulator
+from sim.ball_flight_simulator import GolfBallSimulator, TrajectoryCache
 from disp.trajectory_display import TrajectoryVisualizer
 from data.golf_data_store import GolfDataStore
 
@@ -95,6 +95,7 @@ def analyze_multiple_clubs():
     
     # Create simulator and visualizer
     simulator = GolfBallSimulator()
+    simulator.use_trajectory_cache(TrajectoryCache())
     visualizer = TrajectoryVisualizer()
     
     # Create sample swing data
@@ -124,15 +125,9 @@ def analyze_multiple_clubs():
         print(f"  Spin Rate: {launch_conditions.get('spin_rate', 0):.0f} rpm")
         
         # Create trajectory visualization
-        trajectory_data = []
-        for point in simulation_result.get('trajectory', []):
-            trajectory_data.append({
-                'x': point.x,
-                'y': point.y,
-                'time': point.time
-            })
+        trajectory_data = simulation_result.get('trajectory', [])
         
-        if trajectory_data:
+        if len(trajectory_data):
             fig = visualizer.create_trajectory_plot(trajectory_data, simulation_result)
             filename = f"trajectory_analysis_{club.lower().replace('-', '_')}.png"
             visualizer.save_plot(filename)
@@ -150,6 +145,14 @@ def analyze_multiple_clubs():
               f"{sim_results.get('max_height', 0):<10.1f} "
               f"{sim_results.get('flight_time', 0):<8.1f}")
     
+    # Re-running a comparison hits the trajectory cache instead of re-simulating
+    for club in clubs:
+        simulator.simulate_complete_shot(swing_data, club)
+    
+    cache_stats = simulator.trajectory_cache.stats()
+    print(f"\nTrajectory cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+          f"{cache_stats['entries']} entries")
+    
     return results
 
 def store_analysis_results(results):
@@ -196,8 +199,10 @@ def store_analysis_results(results):
     stats = data_store.get_player_statistics('ExamplePlayer')
     print("\nStored Player Statistics:")
     for stat in stats:
-        print(f"  {stat['club_name']}: Avg {stat['avg_distance']:.1f}m, "
-              f"Max {stat['max_distance']:.1f}m, Swings: {stat['total_swings']}")
+        print(f"  {stat['club_name']}: Avg {stat['avg_distance']:.1f}m "
+              f"(+/- {stat['std_distance']:.1f}m), P50 {stat['p50_distance']:.1f}m, "
+              f"P90 {stat['p90_distance']:.1f}m, Max {stat['max_distance']:.1f}m, "
+              f"Swings: {stat['total_swings']}")
     
     # Export to CSV
     export_dir = data_store.export_to_csv("analysis_export")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Golf HILS System - Trajectory Plot Benchmark
+
+This example renders and saves a trajectory PNG for a series of simulated
+shots with each TrajectoryVisualizer mode and reports, per shot, the time
+the caller (the render_export stage) is busy and the time until the PNG is
+on disk, plus the RSS before and after the run. Each mode runs in a fresh
+process so leaked memory does not carry over; the RSS of the export process
+itself is not included. The leaked mode is capped at 100 shots (about 10 MiB
+per figure).
+
+    leaked       - a new pyplot figure per shot that is never closed
+                   (the visualizer's behaviour before figures were closed)
+    new          - a new pyplot figure per shot, previous one closed
+    persistent   - one Agg figure updated per shot, with sync, thread or
+                   process PNG export
+
+Usage:
+    python examples/trajectory_plot_benchmark.py [shots]
+"""
+
+import os
+import sys
+import time
+import logging
+import resource
+import tempfile
+import multiprocessing
+import concurrent.futures
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sim.ball_flight_simulator import GolfBallSimulator
+from disp.trajectory_display import TrajectoryVisualizer
+from simulation_benchmark import create_sample_launches
+
+MODES = (
+    ('leaked', 'new', 'sync'),
+    ('new', 'new', 'sync'),
+    ('persistent', 'persistent', 'sync'),
+    ('persistent', 'persistent', 'thread'),
+    ('persistent', 'persistent', 'process'),
+)
+
+LEAKED_SHOTS_MAX = 100
+
+def rss_mib() -> float:
+    """Current resident set size (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def create_shots(count: int) -> list:
+    """Simulation results for a spread of launches"""
+    simulator = GolfBallSimulator()
+    shots = []
+    for launch in create_sample_launches(count):
+        trajectory = simulator.simulate_trajectory(launch)
+        shots.append({
+            'launch_conditions': launch.__dict__,
+            'trajectory': trajectory,
+            'results': simulator.analyze_trajectory(trajectory),
+            'club_used': '7-Iron'
+        })
+    return shots
+
+def run(label: str, figure: str, export: str, count: int) -> dict:
+    """Plot and save `count` shots in one mode"""
+    shots = create_shots(count)
+    directory = tempfile.mkdtemp()
+    visualizer = TrajectoryVisualizer(figure=figure, export=export)
+
+    # Warm up (starts the export worker) before taking the baseline
+    visualizer.create_trajectory_plot(shots[0]['trajectory'], shots[0])
+    visualizer.save_plot(os.path.join(directory, "warmup.png"))
+    visualizer.flush()
+    rss_before = rss_mib()
+
+    busy = ready = 0.0
+    for index, shot in enumerate(shots):
+        if label == 'leaked':
+            visualizer.fig = None    # Forget the figure instead of closing it
+        start = time.perf_counter()
+        visualizer.create_trajectory_plot(shot['trajectory'], shot)
+        visualizer.save_plot(os.path.join(directory, f"{label}_{export}_{index}.png"))
+        busy += time.perf_counter() - start
+        # Shots are seconds apart in practice: let the export finish first
+        visualizer.flush()
+        ready += time.perf_counter() - start
+
+    rss_after = rss_mib()
+    visualizer.close()
+    for filename in os.listdir(directory):
+        os.remove(os.path.join(directory, filename))
+    os.rmdir(directory)
+    return {
+        'shots': len(shots),
+        'busy_s': busy / len(shots),
+        'ready_s': ready / len(shots),
+        'rss_before': rss_before,
+        'rss_after': rss_after
+    }
+
+def main():
+    """Compare the visualizer modes"""
+    logging.basicConfig(level=logging.WARNING)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print(f"Trajectory PNG export ({count} shots, 12x8 in at 150 dpi)")
+    print("-" * 78)
+    print(f"{'figure':<11} {'export':<8} {'shots':>6} {'busy s/plot':>12} {'PNG ready s':>12} "
+          f"{'RSS before':>11} {'RSS after':>10}")
+    for label, figure, export in MODES:
+        shots = min(count, LEAKED_SHOTS_MAX) if label == 'leaked' else count
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            stats = executor.submit(run, label, figure, export, shots).result()
+        print(f"{label:<11} {export:<8} {stats['shots']:>6} {stats['busy_s']:>12.3f} {stats['ready_s']:>12.3f} "
+              f"{stats['rss_before']:>7.0f} MiB {stats['rss_after']:>6.0f} MiB")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
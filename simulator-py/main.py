@@ -14,19 +14,35 @@ Options:
     --display MODE      Display mode: live, headless, or both (default: live)
     --config CONFIG     Configuration file path (default: config/simulator_config.yaml)
     --log-level LEVEL   Logging level: DEBUG, INFO, WARNING, ERROR (default: INFO)
+    --migrate-samples   Convert JSON per-sample swing rows to packed blobs and exit
+    --migrate-trajectories  Convert JSON trajectories in simulation_results to packed blobs and exit
+    --export FORMAT     Export the database as csv, parquet or arrow and exit
+                        (filters: --player, --session-id, --start-date, --end-date)
 """
 
 import argparse
+import asyncio
 import logging
+import os
 import time
 import threading
 import signal
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import numpy as np
+import yaml
 
 # Import local modules
-from comm.serial_data_listener import SerialDataListener, SwingData
-from sim.ball_flight_simulator import GolfBallSimulator
+from comm.serial_data_listener import SerialDataListener, SwingData, SampleBlock
+from comm.sample_ring_buffer import SampleRingBuffer
+from comm.async_ingestion import AsyncIngestionPipeline, open_serial_connection, close_serial_connection
+from sim.ball_flight_simulator import (
+    GolfBallSimulator, SwingAccumulator, TrajectoryCache, TrajectoryLookupTable,
+    swing_data_to_columns
+)
+from sim.swing_segmenter import SwingSegmenter, LatencyHistogram
+from sim.processing_pipeline import PipelineStage, StagedPipeline
 from data.golf_data_store import GolfDataStore
 from disp.trajectory_display import TrajectoryVisualizer, LiveDisplayManager
 
@@ -46,13 +62,31 @@ class GolfHILSSimulator:
         
         # State management
         self.current_session_id = None
-        self.swing_data_buffer = []
+        
+        # Samples of each swing, written by the segment stage and read by the simulate stage
+        buffer_config = config.get('sample_buffer', {})
+        self.sample_ring = SampleRingBuffer(
+            capacity=buffer_config.get('capacity', 4096),
+            overflow=buffer_config.get('overflow', 'drop_oldest'),
+            block_timeout_s=buffer_config.get('block_timeout_s', 1.0)
+        )
+        self.swing_accumulator = SwingAccumulator()
+        self.swing_segmenter = SwingSegmenter(**config.get('segmentation', {}))
         self.is_running = True
         self.swing_in_progress = False
+        self.impact_time = None
+        
+        # Impact-to-result (live display) and impact-to-stored latency
+        self.result_latency = LatencyHistogram("impact_to_result")
+        self.stored_latency = LatencyHistogram("impact_to_stored")
         
         # Threading
         self.display_thread = None
+        self.display_ready = threading.Event()  # Set once the display thread has opened the window
+        self.display_ok = False
         self.data_thread = None
+        self.pipeline = self.build_pipeline()
+        self.take_lock = threading.Lock()  # sample_ring has one consumer side
         
         self.logger.info("Golf HILS Simulator initialized")
     
@@ -62,25 +96,66 @@ class GolfHILSSimulator:
             # Initialize data listener
             self.data_listener = SerialDataListener(
                 port=self.config['serial']['port'],
-                baud_rate=self.config['serial']['baud_rate']
+                baud_rate=self.config['serial']['baud_rate'],
+                read_mode=self.config['serial'].get('read_mode', 'poll'),
+                protocol=self.config['serial'].get('protocol', 'auto')
             )
             self.data_listener.set_data_callback(self.handle_swing_data)
+            self.data_listener.set_block_callback(self.handle_sample_block)
             
             # Initialize simulator
-            self.simulator = GolfBallSimulator()
+            simulation_config = self.config.get('simulation', {})
+            self.simulator = GolfBallSimulator(
+                integrator=simulation_config.get('integrator', 'euler'),
+                timestep=simulation_config.get('physics_timestep', 0.01),
+                tolerance=simulation_config.get('tolerance', 1e-6)
+            )
+            
+            lookup_config = simulation_config.get('lookup_table', {})
+            if lookup_config.get('enabled', False):
+                lookup_table = self.load_lookup_table(lookup_config)
+                if lookup_table.coverage() > 0:
+                    self.simulator.use_lookup_table(lookup_table)
+                else:
+                    self.logger.warning("Trajectory lookup table serves no cells within "
+                                        f"{lookup_table.max_cell_error:g} m, simulating every shot")
+            
+            cache_config = simulation_config.get('cache', {})
+            if cache_config.get('enabled', False):
+                self.simulator.use_trajectory_cache(self.load_trajectory_cache(cache_config))
             
             # Initialize data store
-            self.data_store = GolfDataStore(self.config['database']['path'])
+            database_config = self.config['database']
+            self.data_store = GolfDataStore(
+                database_config['path'],
+                write_behind=database_config.get('write_behind', False),
+                batch_size=database_config.get('batch_size', 100),
+                flush_interval_ms=database_config.get('flush_interval_ms', 200),
+                sample_storage=database_config.get('sample_storage', 'json'),
+                compress_samples=database_config.get('compress_samples', False),
+                trajectory_storage=database_config.get('trajectory_storage', 'json'),
+                trajectory_compression=database_config.get('trajectory_compression', 'none'),
+                performance_profile=database_config.get('performance_profile', False),
+                read_pool_size=database_config.get('read_pool_size', 4)
+            )
             
             # Initialize display components
-            if self.config['display']['mode'] in ['live', 'both']:
+            display_config = self.config['display']
+            if display_config['mode'] in ['live', 'both']:
                 self.display_manager = LiveDisplayManager(
-                    screen_size=tuple(self.config['display']['screen_size'])
+                    screen_size=tuple(display_config['screen_size']),
+                    render_cache=display_config.get('render_cache', True),
+                    flight_animation=display_config.get('flight_animation', False),
+                    playback_speed=display_config.get('playback_speed', 1.0),
+                    frame_rate=display_config.get('frame_rate', 60.0)
                 )
             
-            if self.config['display']['mode'] in ['headless', 'both']:
+            if display_config['mode'] in ['headless', 'both']:
                 self.trajectory_visualizer = TrajectoryVisualizer(
-                    figure_size=tuple(self.config['display']['figure_size'])
+                    figure_size=tuple(display_config['figure_size']),
+                    figure=display_config.get('plot_figure', 'new'),
+                    export=display_config.get('plot_export', 'sync'),
+                    dpi=display_config.get('plot_dpi', 150)
                 )
             
             self.logger.info("All components initialized successfully")
@@ -90,6 +165,57 @@ class GolfHILSSimulator:
             self.logger.error(f"Failed to initialize components: {e}")
             return False
     
+    def load_lookup_table(self, lookup_config: Dict[str, Any]) -> TrajectoryLookupTable:
+        """Load the trajectory lookup table, building and saving it if missing
+        
+        A saved table built with other integrator settings, or by an older
+        version, is rebuilt.
+        """
+        path = lookup_config.get('path', 'trajectory_lookup.npz')
+        max_cell_error = lookup_config.get('max_cell_error_m', 1.0)
+        settings = (self.simulator.integrator, self.simulator.timestep, self.simulator.tolerance)
+        
+        if os.path.exists(path):
+            self.logger.info(f"Loading trajectory lookup table from {path}")
+            try:
+                lookup_table = TrajectoryLookupTable.load(path, max_cell_error)
+            except ValueError as e:
+                self.logger.warning(f"Rebuilding trajectory lookup table: {e}")
+            else:
+                if (lookup_table.integrator, lookup_table.timestep, lookup_table.tolerance) == settings:
+                    return self._log_lookup_coverage(lookup_table)
+                self.logger.warning(f"Lookup table {path} was built for other integrator settings, rebuilding")
+        
+        resolution = tuple(lookup_config.get('resolution', [30, 25, 30]))
+        self.logger.info(f"Building trajectory lookup table {resolution}")
+        lookup_table = TrajectoryLookupTable.build(self.simulator, resolution,
+                                                   max_cell_error=max_cell_error)
+        lookup_table.save(path)
+        return self._log_lookup_coverage(lookup_table)
+    
+    def _log_lookup_coverage(self, lookup_table: TrajectoryLookupTable) -> TrajectoryLookupTable:
+        """Log how much of the table is served and pass it through"""
+        self.logger.info(f"Lookup table serves {lookup_table.coverage():.1%} of its cells "
+                         f"(all corners landed, error <= {lookup_table.max_cell_error:g} m)")
+        return lookup_table
+    
+    def load_trajectory_cache(self, cache_config: Dict[str, Any]) -> TrajectoryCache:
+        """Create the trajectory cache, warming it from disk if persisted"""
+        trajectory_cache = TrajectoryCache(
+            max_entries=cache_config.get('max_entries', 1000),
+            max_memory_mb=cache_config.get('max_memory_mb', 64),
+            resolution=tuple(cache_config.get('resolution', [0.1, 0.1, 10]))
+        )
+        
+        persist_path = cache_config.get('persist_path')
+        if persist_path and os.path.exists(persist_path):
+            try:
+                trajectory_cache.load(persist_path)
+            except Exception as e:
+                self.logger.warning(f"Could not load trajectory cache: {e}")
+        
+        return trajectory_cache
+    
     def start_session(self, player_name: str = "Unknown") -> bool:
         """Start a new practice session"""
         try:
@@ -107,127 +233,316 @@ class GolfHILSSimulator:
             self.logger.error(f"Failed to start session: {e}")
             return False
     
+    def build_pipeline(self) -> StagedPipeline:
+        """Stages behind the listener thread (ingest), upstream first
+        
+        segment and render_export keep one worker: the segmenter and
+        sample_ring producer are single-threaded and so is matplotlib.
+        simulate and persist take a configurable worker count. The live
+        display is not a stage: screens are posted to the display thread.
+        """
+        pipeline_config = self.config.get('pipeline', {})
+        
+        def stage(name, handler, queue_size, when_full='block', scalable=False):
+            stage_config = pipeline_config.get(name, {})
+            return PipelineStage(
+                name, handler,
+                workers=stage_config.get('workers', 1) if scalable else 1,
+                queue_size=stage_config.get('queue_size', queue_size),
+                when_full=stage_config.get('when_full', when_full)
+            )
+        
+        pipeline = StagedPipeline()
+        pipeline.add_stage(stage('segment', self.segment_stage, 1024))
+        pipeline.add_stage(stage('simulate', self.simulate_stage, 8, scalable=True))
+        pipeline.add_stage(stage('persist', self.persist_stage, 32, scalable=True))
+        pipeline.add_stage(stage('render_export', self.render_export_stage, 4, when_full='drop'))
+        return pipeline
+    
     def handle_swing_data(self, swing_data: SwingData):
-        """Handle incoming swing data from sensor unit"""
-        try:
-            self.logger.info(f"Received swing data: {swing_data.player} - {swing_data.club}")
-            
-            # Add to buffer for swing analysis
-            self.swing_data_buffer.append(swing_data)
-            
-            # Detect start of new swing (simple time-based detection)
-            if not self.swing_in_progress:
-                self.swing_in_progress = True
-                self.swing_start_time = time.time()
-                
+        """Ingest: queue a sample from the sensor unit for the segment stage
+        
+        Blocks while the segment queue is full, which leaves the backlog in
+        the serial driver's buffer.
+        """
+        self.logger.debug(f"Received swing data: {swing_data.player} - {swing_data.club}")
+        self.pipeline['segment'].submit(swing_data)
+    
+    def handle_sample_block(self, block: SampleBlock):
+        """Ingest: queue a whole SampleBlock (swing_batch packet or binary frame) for the segment stage"""
+        self.logger.debug(f"Received {len(block)} samples: {block.player} - {block.club}")
+        self.pipeline['segment'].submit(block)
+    
+    def segment_stage(self, item):
+        """Segment a sample or SampleBlock and hand closed swings to the simulate stage"""
+        if isinstance(item, SampleBlock):
+            events = self.segment_block(item)
+        else:
+            events = [self.segment_sample(item)]
+        
+        for event, swing_closed in events:
+            if event == SwingSegmenter.SWING_START:
                 # Show swing detection on display
                 if self.display_manager:
-                    self.display_manager.display_swing_detected(
-                        swing_data.player, swing_data.club
-                    )
-                
-                # Start swing collection timer
-                threading.Timer(2.0, self.process_swing).start()
-            
-            # Store individual swing data point
-            if self.current_session_id:
-                swing_dict = {
-                    'timestamp': swing_data.timestamp,
-                    'club': swing_data.club,
-                    'player': swing_data.player,
-                    'device_id': swing_data.device_id,
-                    'accel_x': swing_data.accel_x,
-                    'accel_y': swing_data.accel_y,
-                    'accel_z': swing_data.accel_z,
-                    'gyro_x': swing_data.gyro_x,
-                    'gyro_y': swing_data.gyro_y,
-                    'gyro_z': swing_data.gyro_z
-                }
-                self.data_store.store_swing_data(self.current_session_id, swing_dict)
-            
-        except Exception as e:
-            self.logger.error(f"Error handling swing data: {e}")
+                    self.display_manager.post('display_swing_detected', item.player, item.club)
+            elif swing_closed:
+                self.pipeline['simulate'].submit(swing_closed)
+            elif event == SwingSegmenter.SWING_ABORT:
+                self.return_to_waiting()
     
-    def process_swing(self):
-        """Process complete swing data and run simulation"""
-        try:
-            if not self.swing_data_buffer:
-                self.logger.warning("No swing data to process")
-                return
-            
-            self.logger.info(f"Processing swing with {len(self.swing_data_buffer)} data points")
-            
-            # Get club name from latest data point
-            club_name = self.swing_data_buffer[-1].club
-            player_name = self.swing_data_buffer[-1].player
-            
-            # Run simulation
-            simulation_results = self.simulator.simulate_complete_shot(
-                self.swing_data_buffer, club_name
-            )
-            
-            # Store simulation results
-            if self.current_session_id and self.swing_data_buffer:
-                # Find the swing ID for the first data point in this swing
-                swing_dict = {
-                    'timestamp': self.swing_data_buffer[0].timestamp,
-                    'club': club_name,
-                    'player': player_name,
-                    'device_id': self.swing_data_buffer[0].device_id,
-                    'accel_x': self.swing_data_buffer[0].accel_x,
-                    'accel_y': self.swing_data_buffer[0].accel_y,
-                    'accel_z': self.swing_data_buffer[0].accel_z,
-                    'gyro_x': self.swing_data_buffer[0].gyro_x,
-                    'gyro_y': self.swing_data_buffer[0].gyro_y,
-                    'gyro_z': self.swing_data_buffer[0].gyro_z
-                }
-                swing_id = self.data_store.store_swing_data(self.current_session_id, swing_dict)
-                self.data_store.store_simulation_result(swing_id, simulation_results)
-                
-                # Update player statistics
-                carry_distance = simulation_results['results'].get('carry_distance', 0)
-                self.data_store.update_player_statistics(player_name, club_name, carry_distance)
-            
-            # Display results
-            self.display_results(simulation_results)
-            
-            # Log results
-            results = simulation_results['results']
-            self.logger.info(f"Simulation complete - Distance: {results.get('carry_distance', 0):.1f}m, "
-                           f"Height: {results.get('max_height', 0):.1f}m")
-            
-            # Clear buffer and reset swing state
-            self.swing_data_buffer = []
+    def segment_sample(self, swing_data: SwingData) -> tuple:
+        """Segment, buffer and store one sample
+        
+        Returns (event, swing_closed). When the sample closed a swing, its
+        samples and analysis are committed to sample_ring as one block for
+        take_swing(). Display updates are left to the caller.
+        """
+        event = self.swing_segmenter.update(swing_data)
+        swing_closed = False
+        
+        if event == SwingSegmenter.SWING_START:
+            self.swing_in_progress = True
+            self.swing_start_time = time.time()
+            self.impact_time = None
+            self.sample_ring.rollback()
+            self.swing_accumulator.reset()
+        
+        if self.swing_in_progress:
+            # Add to the ring for storage and fold into the running swing analysis
+            self.sample_ring.push(swing_data)
+            self.swing_accumulator.add_sample(swing_data)
+        
+        if event == SwingSegmenter.IMPACT_DETECTED:
+            self.impact_time = time.perf_counter()
+        elif event == SwingSegmenter.SWING_END:
+            # Publish the whole swing to the consumer at once
+            self.sample_ring.commit((swing_data.device_id, swing_data.club, swing_data.player,
+                                     self.swing_accumulator.close(), self.impact_time))
+            swing_closed = True
+            self.swing_in_progress = False
+        elif event == SwingSegmenter.SWING_ABORT:
+            self.logger.info("Swing aborted before impact")
+            self.sample_ring.rollback()
+            self.swing_accumulator.reset()
             self.swing_in_progress = False
+        
+        # Store individual swing data point (blob storage writes whole swings instead)
+        if self.current_session_id and self.data_store.sample_storage == 'json':
+            swing_dict = {
+                'timestamp': swing_data.timestamp,
+                'club': swing_data.club,
+                'player': swing_data.player,
+                'device_id': swing_data.device_id,
+                'accel_x': swing_data.accel_x,
+                'accel_y': swing_data.accel_y,
+                'accel_z': swing_data.accel_z,
+                'gyro_x': swing_data.gyro_x,
+                'gyro_y': swing_data.gyro_y,
+                'gyro_z': swing_data.gyro_z
+            }
+            self.data_store.enqueue_swing_data(self.current_session_id, swing_dict)
+        
+        return event, swing_closed
+    
+    def segment_block(self, block: SampleBlock) -> list:
+        """segment_sample() for a whole SampleBlock
+        
+        The segmenter scans the block's magnitude columns for transitions,
+        and the samples between them go into sample_ring and the swing
+        accumulator as array slices. Returns (event, swing_closed) for every
+        sample that produced an event, in order.
+        """
+        samples = block.samples
+        timestamps, columns = swing_data_to_columns(samples)
+        accel = np.sqrt(np.einsum('ij,ij->i', columns[:, 0:3], columns[:, 0:3]))
+        gyro = np.sqrt(np.einsum('ij,ij->i', columns[:, 3:6], columns[:, 3:6]))
+        
+        def buffer(start, end):
+            self.sample_ring.push_block(samples[start:end])
+            self.swing_accumulator.add_block(samples[start:end])
+        
+        results = []
+        position = 0
+        for index, event in self.swing_segmenter.scan(timestamps, gyro, accel):
+            swing_closed = False
+            if self.swing_in_progress:
+                buffer(position, index)
             
-            # Return to waiting state after displaying results
-            if self.display_manager:
-                threading.Timer(5.0, self.return_to_waiting).start()
+            if event == SwingSegmenter.SWING_START:
+                self.swing_in_progress = True
+                self.swing_start_time = time.time()
+                self.impact_time = None
+                self.sample_ring.rollback()
+                self.swing_accumulator.reset()
+                buffer(index, index + 1)
+            elif event == SwingSegmenter.IMPACT_DETECTED:
+                buffer(index, index + 1)
+                self.impact_time = time.perf_counter()
+            elif event == SwingSegmenter.SWING_END:
+                buffer(index, index + 1)
+                self.sample_ring.commit((block.device_id, block.club, block.player,
+                                         self.swing_accumulator.close(), self.impact_time))
+                swing_closed = True
+                self.swing_in_progress = False
+            elif event == SwingSegmenter.SWING_ABORT:
+                self.logger.info("Swing aborted before impact")
+                self.sample_ring.rollback()
+                self.swing_accumulator.reset()
+                self.swing_in_progress = False
             
-        except Exception as e:
-            self.logger.error(f"Error processing swing: {e}")
-            self.swing_data_buffer = []
-            self.swing_in_progress = False
+            results.append((event, swing_closed))
+            position = index + 1
+        
+        if self.swing_in_progress:
+            buffer(position, len(samples))
+        
+        # JSON sample storage is per sample; blob storage writes whole swings instead
+        if self.current_session_id and self.data_store.sample_storage == 'json':
+            for swing_data in block.to_swing_data():
+                self.data_store.enqueue_swing_data(self.current_session_id, vars(swing_data))
+        
+        return results
+    
+    def take_swing(self) -> Optional[tuple]:
+        """Read the oldest committed swing from sample_ring
+        
+        Returns (SampleBlock, swing_analysis, impact_time), or None.
+        """
+        with self.take_lock:
+            entry = self.sample_ring.read_block()
+        if entry is None:
+            return None
+        samples, (device_id, club, player, swing_analysis, impact_time) = entry
+        return SampleBlock(device_id, club, player, samples), swing_analysis, impact_time
+    
+    def simulate_stage(self, swing_closed: bool):
+        """Simulate the next closed swing and fan the result out
+        
+        The live display is queued first; persistence and PNG export run
+        on their own stages and never delay it.
+        """
+        swing = self.take_swing()
+        if swing is None or not len(swing[0]):
+            self.logger.warning("No swing data to process")
+            return
+        
+        swing_samples, swing_analysis, impact_time = swing
+        simulation_results = self.simulate_swing(swing_samples, swing_analysis)
+        
+        self.show_live_result(simulation_results, impact_time)
+        self.pipeline['persist'].submit((swing_samples, simulation_results, impact_time))
+        if self.trajectory_visualizer:
+            self.pipeline['render_export'].submit(simulation_results)
+    
+    def show_live_result(self, simulation_results: Dict[str, Any], impact_time: float = None):
+        """Post a result to the live display
+        
+        Impact-to-result latency is recorded once the display thread has
+        drawn it (straight away without a live display).
+        """
+        def shown():
+            if impact_time is not None:
+                self.result_latency.record(time.perf_counter() - impact_time)
+        
+        if not self.display_manager:
+            shown()
+            return
+        
+        # Return to waiting state after 5 s, unless the next swing starts first
+        self.display_manager.post('display_simulation_results', simulation_results,
+                                  on_shown=shown, revert_after_s=5.0)
+    
+    def persist_stage(self, shot: tuple):
+        """Store a simulated swing and record impact-to-stored latency"""
+        swing_samples, simulation_results, impact_time = shot
+        self.persist_swing(swing_samples, simulation_results)
+        if impact_time is not None:
+            self.stored_latency.record(time.perf_counter() - impact_time)
+    
+    def render_export_stage(self, simulation_results: Dict[str, Any]):
+        """Render and save the trajectory PNG"""
+        self.export_trajectory_plot(simulation_results)
+    
+    def simulate_swing(self, swing_samples: SampleBlock, swing_analysis: Dict[str, float]) -> Dict[str, Any]:
+        """Run the ball flight simulation for a closed swing"""
+        self.logger.info(f"Processing swing with {len(swing_samples)} data points")
+        
+        # Club as reported by the swing's last data point
+        club_name = swing_samples.club
+        
+        # Run simulation from the analysis accumulated while samples arrived
+        simulation_results = self.simulator.simulate_shot(swing_analysis, club_name)
+        
+        # Log results
+        results = simulation_results['results']
+        self.logger.info(f"Simulation complete - Distance: {results.get('carry_distance', 0):.1f}m, "
+                       f"Height: {results.get('max_height', 0):.1f}m")
+        return simulation_results
+    
+    def persist_swing(self, swing_samples: SampleBlock, simulation_results: Dict[str, Any]):
+        """Store the swing, its simulation result and the player statistics"""
+        if not self.current_session_id:
+            return
+        
+        club_name = swing_samples.club
+        player_name = swing_samples.player
+        
+        if self.data_store.sample_storage == 'blob':
+            # One row holding every packed sample of this swing
+            timestamps, samples = swing_data_to_columns(swing_samples.samples)
+            swing_id = self.data_store.store_swing_samples(
+                self.current_session_id, timestamps, samples,
+                club_name, player_name, swing_samples.device_id
+            )
+        else:
+            # Find the swing ID for the first data point in this swing
+            first = swing_samples.samples[0]
+            swing_dict = {
+                'timestamp': int(first['timestamp']),
+                'club': club_name,
+                'player': player_name,
+                'device_id': swing_samples.device_id,
+                'accel_x': float(first['accel_x']),
+                'accel_y': float(first['accel_y']),
+                'accel_z': float(first['accel_z']),
+                'gyro_x': float(first['gyro_x']),
+                'gyro_y': float(first['gyro_y']),
+                'gyro_z': float(first['gyro_z'])
+            }
+            swing_id = self.data_store.store_swing_data(self.current_session_id, swing_dict)
+        
+        self.data_store.store_simulation_result(swing_id, simulation_results)
+        
+        # Update player statistics
+        carry_distance = simulation_results['results'].get('carry_distance', 0)
+        self.data_store.update_player_statistics(player_name, club_name, carry_distance)
     
     def display_results(self, simulation_results: Dict[str, Any]):
-        """Display simulation results"""
+        """Display simulation results live and export the trajectory plot"""
+        self.display_live_results(simulation_results)
+        self.export_trajectory_plot(simulation_results)
+    
+    def display_live_results(self, simulation_results: Dict[str, Any]):
+        """Draw simulation results on the live display from the calling thread
+        
+        Only for callers that own the display (no display thread running);
+        everything else goes through show_live_result().
+        """
         try:
-            # Live display
             if self.display_manager:
                 self.display_manager.display_simulation_results(simulation_results)
-            
+        except Exception as e:
+            self.logger.error(f"Error displaying results: {e}")
+    
+    def export_trajectory_plot(self, simulation_results: Dict[str, Any]):
+        """Render the trajectory plot and save it as a PNG"""
+        try:
             # Generate and save trajectory plot
             if self.trajectory_visualizer:
-                # Convert trajectory data for visualization
-                trajectory_data = []
-                for point in simulation_results.get('trajectory', []):
-                    trajectory_data.append({
-                        'x': point.x,
-                        'y': point.y,
-                        'time': point.time
-                    })
+                # The visualizer reads the trajectory's column views directly
+                trajectory_data = simulation_results.get('trajectory', [])
                 
-                if trajectory_data:
+                if len(trajectory_data):
                     fig = self.trajectory_visualizer.create_trajectory_plot(
                         trajectory_data, simulation_results
                     )
@@ -238,18 +553,55 @@ class GolfHILSSimulator:
                     self.trajectory_visualizer.save_plot(filename)
             
         except Exception as e:
-            self.logger.error(f"Error displaying results: {e}")
+            self.logger.error(f"Error exporting trajectory plot: {e}")
     
     def return_to_waiting(self):
         """Return display to waiting state"""
         if self.display_manager:
-            self.display_manager.display_waiting_screen()
+            self.display_manager.post('display_waiting_screen')
+    
+    def start_display_thread(self, timeout: float = 10.0) -> bool:
+        """Start the display thread, the only thread that touches pygame
+        
+        Waits until the thread has opened the window; returns False if
+        that failed or did not finish within ``timeout`` seconds.
+        """
+        if not self.display_manager:
+            return True
+        
+        if not self.display_thread:
+            self.display_thread = threading.Thread(target=self.run_display_loop,
+                                                   name="display", daemon=True)
+            self.display_thread.start()
+        
+        if not self.display_ready.wait(timeout):
+            self.logger.error("Live display did not initialize in time")
+            return False
+        return self.display_ok
     
     def run_display_loop(self):
-        """Run the display event loop in a separate thread"""
+        """Run the display event loop in a separate thread
+        
+        Each frame pumps pygame events and draws the latest posted screen
+        or the next flight animation frame. The wait ends early when a
+        screen is posted, so a result is drawn without waiting for the
+        next frame.
+        """
         if not self.display_manager:
             return
         
+        # Window, fonts and backgrounds are created on this thread, which
+        # then pumps the events for that window
+        try:
+            self.display_manager.display_init()
+            self.display_ok = True
+        except Exception as e:
+            self.logger.error(f"Failed to initialize live display: {e}")
+            self.display_manager.cleanup()
+            return
+        finally:
+            self.display_ready.set()
+        
         self.display_manager.display_waiting_screen()
         
         while self.is_running:
@@ -257,7 +609,8 @@ class GolfHILSSimulator:
                 self.is_running = False
                 break
             
-            time.sleep(0.016)  # ~60 FPS
+            self.display_manager.wait_for_frame()  # frame_rate, 60 FPS by default
+            self.display_manager.render_pending()
         
         self.display_manager.cleanup()
     
@@ -269,6 +622,36 @@ class GolfHILSSimulator:
         if self.data_listener.connect():
             self.data_listener.listen_for_data()
     
+    async def run_async(self, reader=None):
+        """Run ingestion on an asyncio event loop until the stream ends or the app stops
+        
+        Reads from the configured serial port unless a StreamReader-compatible
+        ``reader`` is given.
+        """
+        serial_connection = None
+        if reader is None:
+            reader, serial_connection = await open_serial_connection(
+                self.config['serial']['port'], self.config['serial']['baud_rate']
+            )
+        
+        pipeline = AsyncIngestionPipeline(self, reader,
+                                          protocol=self.config['serial'].get('protocol', 'auto'))
+        
+        async def watch_running():
+            # The display loop clears is_running when the window is closed
+            while self.is_running:
+                await asyncio.sleep(0.1)
+            pipeline.stop()
+        
+        watcher = asyncio.create_task(watch_running())
+        try:
+            await pipeline.run()
+        finally:
+            watcher.cancel()
+            if serial_connection:
+                close_serial_connection(serial_connection)
+        return pipeline.stats()
+    
     def start(self):
         """Start the main application"""
         try:
@@ -280,9 +663,16 @@ class GolfHILSSimulator:
                 return False
             
             # Start display thread
-            if self.display_manager:
-                self.display_thread = threading.Thread(target=self.run_display_loop, daemon=True)
-                self.display_thread.start()
+            if not self.start_display_thread():
+                return False
+            
+            if self.config['serial'].get('ingestion', 'threads') == 'asyncio':
+                # One event loop replaces the listener thread and the main loop below
+                asyncio.run(self.run_async())
+                return True
+            
+            # Start the stage workers before the listener feeds the segment stage
+            self.pipeline.start()
             
             # Start data listener thread
             self.data_thread = threading.Thread(target=self.run_data_listener_loop, daemon=True)
@@ -314,11 +704,40 @@ class GolfHILSSimulator:
         if self.data_listener:
             self.data_listener.disconnect()
         
+        if self.pipeline.started:
+            # Let the stages finish the samples and swings already queued
+            self.pipeline.stop()
+            self.logger.info(f"Pipeline stages:\n{self.pipeline.format()}")
+            self.logger.info(f"Sample ring buffer: {self.sample_ring.stats()}")
+        
         if self.data_store:
             self.data_store.close()
         
         if self.display_manager:
-            self.display_manager.cleanup()
+            if self.display_thread:
+                # is_running is cleared: the display thread finishes its frame
+                # and quits pygame itself, so pygame is never called from here
+                self.display_thread.join(timeout=1.0)
+                if self.display_thread.is_alive():
+                    self.logger.warning("Display thread did not stop within 1 s")
+            self.logger.info(f"Live display: {self.display_manager.stats()}")
+        
+        if self.trajectory_visualizer:
+            # Write out the PNGs still queued for the background encoder
+            self.trajectory_visualizer.close()
+        
+        if self.result_latency.total:
+            self.logger.info(self.result_latency.format())
+            self.logger.info(self.stored_latency.format())
+        
+        if self.simulator and self.simulator.trajectory_cache:
+            self.logger.info(f"Trajectory cache: {self.simulator.trajectory_cache.stats()}")
+            persist_path = self.config['simulation'].get('cache', {}).get('persist_path')
+            if persist_path:
+                try:
+                    self.simulator.trajectory_cache.save(persist_path)
+                except Exception as e:
+                    self.logger.error(f"Could not save trajectory cache: {e}")
         
         self.logger.info("Cleanup complete")
 
@@ -327,22 +746,95 @@ def load_default_config() -> Dict[str, Any]:
     return {
         'serial': {
             'port': '/dev/ttyUSB0',
-            'baud_rate': 115200
+            'baud_rate': 115200,
+            'read_mode': 'select',  # select: block on the fd and read in bulk, poll: 1 ms readline loop
+            'ingestion': 'threads',  # threads: listener thread + staged pipeline workers, asyncio: one event loop
+            'protocol': 'auto'  # auto-detect JSON lines or binary frames
         },
         'display': {
             'mode': 'live',  # live, headless, both
             'screen_size': [1024, 768],
-            'figure_size': [12, 8]
+            'figure_size': [12, 8],
+            'render_cache': True,           # Cached text/backgrounds and dirty-rect updates
+            'flight_animation': True,       # Play the ball flight on the results screen
+            'playback_speed': 1.0,          # 1.0 = real time
+            'frame_rate': 60,
+            'plot_figure': 'persistent',    # new: pyplot figure per shot, persistent: one reused Agg figure
+            'plot_export': 'thread',        # sync, thread or process: where trajectory PNGs are encoded
+            'plot_dpi': 150
         },
         'database': {
-            'path': 'golf_hils_data.db'
+            'path': 'golf_hils_data.db',
+            'write_behind': True,       # Per-sample rows go through a writer thread
+            'batch_size': 100,          # Rows per transaction
+            'flush_interval_ms': 200,   # Max time a row waits for its batch
+            'sample_storage': 'json',   # json: row per sample, blob: packed row per swing
+            'compress_samples': False,  # zlib-compress packed samples
+            'trajectory_storage': 'json',       # json: point dicts, blob: packed float32 columns
+            'trajectory_compression': 'none',   # none, zlib or delta-zlib for packed trajectories
+            'performance_profile': False,       # WAL, synchronous=NORMAL, mmap/cache and indexes
+            'read_pool_size': 4                 # Read-only connections for stats/dashboard queries
         },
         'session': {
             'location': 'Practice Range',
             'weather': 'Unknown'
+        },
+        'segmentation': {
+            'start_gyro': 150.0,        # dps, rest -> swing
+            'rest_gyro': 30.0,          # dps, swing/finish -> rest (hysteresis)
+            'impact_accel': 4.0,        # G
+            'post_impact_samples': 5,   # Samples collected after impact before closing
+            'max_swing_ms': 3000.0      # Close a swing without a detected impact
+        },
+        'pipeline': {                   # Bounded queue per stage; workers only for simulate/persist
+            'segment': {'queue_size': 1024},
+            'simulate': {'workers': 1, 'queue_size': 8},
+            'persist': {'workers': 1, 'queue_size': 32},
+            'render_export': {'queue_size': 4, 'when_full': 'drop'}  # Skip PNGs rather than stall
+        },
+        'sample_buffer': {
+            'capacity': 4096,           # Samples preallocated for swings in flight (~40 s at 100 Hz)
+            'overflow': 'drop_oldest',  # drop_oldest or block (backpressure on the listener)
+            'block_timeout_s': 1.0      # How long 'block' waits before dropping a sample
+        },
+        'simulation': {
+            'integrator': 'rk4',  # euler, rk4, rk45
+            'physics_timestep': 0.05,
+            'tolerance': 1e-6,
+            'lookup_table': {
+                'enabled': False,
+                'path': 'trajectory_lookup.npz',
+                'resolution': [30, 25, 30],
+                'max_cell_error_m': 1.0  # Cells less accurate than this are simulated
+            },
+            'cache': {
+                'enabled': False,
+                'max_entries': 1000,
+                'max_memory_mb': 64,
+                'resolution': [0.1, 0.1, 10],
+                'persist_path': 'trajectory_cache.npz'
+            }
         }
     }
 
+def load_config(config_path: str) -> Dict[str, Any]:
+    """Load configuration file on top of the defaults"""
+    config = load_default_config()
+    
+    if not config_path or not os.path.exists(config_path):
+        return config
+    
+    with open(config_path) as f:
+        file_config = yaml.safe_load(f) or {}
+    
+    for section, values in file_config.items():
+        if isinstance(values, dict) and isinstance(config.get(section), dict):
+            config[section].update(values)
+        else:
+            config[section] = values
+    
+    return config
+
 def signal_handler(signum, frame):
     """Handle shutdown signals"""
     logging.getLogger(__name__).info("Received shutdown signal")
@@ -356,8 +848,21 @@ def main():
     parser.add_argument('--baud', type=int, default=115200, help='Baud rate')
     parser.add_argument('--display', choices=['live', 'headless', 'both'], 
                        default='live', help='Display mode')
+    parser.add_argument('--config', default='config/simulator_config.yaml',
+                       help='Configuration file path')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        default='INFO', help='Logging level')
+    parser.add_argument('--migrate-samples', action='store_true',
+                       help='Convert JSON per-sample swing rows to packed blobs and exit')
+    parser.add_argument('--migrate-trajectories', action='store_true',
+                       help='Convert JSON trajectories to packed blobs and exit')
+    parser.add_argument('--export', choices=['csv', 'parquet', 'arrow'],
+                       help='Export the database and exit')
+    parser.add_argument('--export-dir', default='exports', help='Export output directory')
+    parser.add_argument('--player', help='Export only this player')
+    parser.add_argument('--session-id', type=int, help='Export only this session')
+    parser.add_argument('--start-date', help='Export swings created on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--end-date', help='Export swings created before this date (YYYY-MM-DD)')
     
     args = parser.parse_args()
     
@@ -378,11 +883,42 @@ def main():
     signal.signal(signal.SIGTERM, signal_handler)
     
     # Load configuration
-    config = load_default_config()
+    config = load_config(args.config)
     config['serial']['port'] = args.port
     config['serial']['baud_rate'] = args.baud
     config['display']['mode'] = args.display
     
+    if args.migrate_samples:
+        data_store = GolfDataStore(config['database']['path'],
+                                   compress_samples=config['database'].get('compress_samples', False))
+        swings = data_store.migrate_to_blob_storage()
+        data_store.close()
+        logger.info(f"Migrated {swings} swings to blob storage")
+        return 0
+    
+    if args.migrate_trajectories:
+        data_store = GolfDataStore(config['database']['path'],
+                                   trajectory_compression=config['database'].get('trajectory_compression', 'none'))
+        trajectories = data_store.convert_trajectories_to_blob()
+        data_store.close()
+        logger.info(f"Converted {trajectories} trajectories to blob storage")
+        return 0
+    
+    if args.export:
+        data_store = GolfDataStore(config['database']['path'])
+        filters = {
+            'player_name': args.player,
+            'session_id': args.session_id,
+            'start_date': args.start_date,
+            'end_date': args.end_date
+        }
+        if args.export == 'csv':
+            data_store.export_to_csv(args.export_dir, **filters)
+        else:
+            data_store.export_columnar(args.export_dir, args.export, **filters)
+        data_store.close()
+        return 0
+    
     # Create and run simulator
     simulator = GolfHILSSimulator(config)
     
@@ -7,8 +7,11 @@ based on initial swing data from the sensor unit.
 """
 
 import math
+import threading
 import numpy as np
-from typing import Tuple, List, Dict, Any
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Tuple, List, Dict, Any, Optional
 from dataclasses import dataclass
 import logging
 
@@ -32,10 +35,623 @@ class TrajectoryPoint:
     velocity_x: float # horizontal velocity (m/s)
     velocity_y: float # vertical velocity (m/s)
 
+# Column order of the (N, 6) swing sample arrays
+SWING_FIELDS = ("accel_x", "accel_y", "accel_z", "gyro_x", "gyro_y", "gyro_z")
+
+def swing_data_to_columns(swing_data_points, timestamps=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert swing samples to (timestamps_ms, (N, 6) float64 samples)
+    
+    Accepts a list of objects with SWING_FIELDS attributes (e.g. SwingData),
+    a structured array with those fields, or a plain (N, 6) array.
+    """
+    if isinstance(swing_data_points, np.ndarray) and swing_data_points.dtype.names:
+        names = swing_data_points.dtype.names
+        samples = np.column_stack([swing_data_points[field] for field in SWING_FIELDS]).astype(np.float64)
+        if timestamps is None and "timestamp" in names:
+            timestamps = swing_data_points["timestamp"]
+    elif isinstance(swing_data_points, np.ndarray):
+        samples = np.asarray(swing_data_points, dtype=np.float64).reshape(-1, len(SWING_FIELDS))
+    else:
+        samples = np.array(
+            list(map(attrgetter(*SWING_FIELDS), swing_data_points)), dtype=np.float64
+        ).reshape(-1, len(SWING_FIELDS))
+        if timestamps is None and swing_data_points and hasattr(swing_data_points[0], "timestamp"):
+            timestamps = [point.timestamp for point in swing_data_points]
+    
+    if timestamps is None:
+        timestamps = np.arange(len(samples)) * 10.0  # 100 Hz sensor rate
+    
+    return np.asarray(timestamps, dtype=np.float64), samples
+
+def swing_characteristics(max_angular_velocity: float, max_acceleration: float,
+                          peak_angular_velocity_time: float, peak_acceleration_time: float,
+                          impulse: float, sample_count: int) -> Dict[str, float]:
+    """Swing analysis dict shared by batch and streaming analysis"""
+    # Convert to swing characteristics
+    # These are simplified conversions - real implementation would use calibration data
+    club_head_speed = max_angular_velocity * 0.5  # Simplified conversion
+    impact_force = max_acceleration * 10  # Simplified conversion
+    
+    return {
+        "club_head_speed": club_head_speed,
+        "impact_force": impact_force,
+        "max_angular_velocity": max_angular_velocity,
+        "max_acceleration": max_acceleration,
+        "peak_angular_velocity_time": peak_angular_velocity_time,
+        "peak_acceleration_time": peak_acceleration_time,
+        "impulse": impulse,
+        "sample_count": sample_count
+    }
+
+class SwingAccumulator:
+    """Incremental swing analysis, updated in O(1) per sample
+    
+    Produces the same result as GolfBallSimulator.analyze_swing_data() over
+    all samples seen since the last reset, without keeping or rescanning
+    them. Safe to feed from one thread and close from another.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+    
+    def _reset(self):
+        self.sample_count = 0
+        self.max_angular_velocity = 0.0
+        self.max_acceleration = 0.0
+        self.peak_angular_velocity_time = 0.0
+        self.peak_acceleration_time = 0.0
+        self.impulse = 0.0
+        self._last_timestamp = None
+        self._last_acceleration = 0.0
+    
+    def reset(self):
+        """Start a new swing"""
+        with self._lock:
+            self._reset()
+    
+    def add(self, timestamp: Optional[float], accel_x: float, accel_y: float, accel_z: float,
+            gyro_x: float, gyro_y: float, gyro_z: float):
+        """Fold one IMU sample into the running statistics"""
+        angular_velocity = math.sqrt(gyro_x * gyro_x + gyro_y * gyro_y + gyro_z * gyro_z)
+        acceleration = math.sqrt(accel_x * accel_x + accel_y * accel_y + accel_z * accel_z)
+        
+        with self._lock:
+            if timestamp is None:  # Assume the 100 Hz sensor rate
+                timestamp = self.sample_count * 10.0
+            
+            # First sample of a swing always sets the peaks (strict > keeps the earliest peak)
+            if self.sample_count == 0 or angular_velocity > self.max_angular_velocity:
+                self.max_angular_velocity = angular_velocity
+                self.peak_angular_velocity_time = float(timestamp)
+            if self.sample_count == 0 or acceleration > self.max_acceleration:
+                self.max_acceleration = acceleration
+                self.peak_acceleration_time = float(timestamp)
+            
+            if self._last_timestamp is not None:
+                dt = (timestamp - self._last_timestamp) / 1000.0
+                self.impulse += dt * (acceleration + self._last_acceleration) * 0.5
+            
+            self._last_timestamp = timestamp
+            self._last_acceleration = acceleration
+            self.sample_count += 1
+    
+    def add_sample(self, sample):
+        """Fold in a SwingData-like object"""
+        self.add(getattr(sample, 'timestamp', None), sample.accel_x, sample.accel_y, sample.accel_z,
+                 sample.gyro_x, sample.gyro_y, sample.gyro_z)
+    
+    def add_block(self, samples: np.ndarray):
+        """Fold in a structured array of samples (SWING_FIELDS plus timestamp) at once"""
+        if not len(samples):
+            return
+        timestamps, columns = swing_data_to_columns(samples)
+        acceleration = np.sqrt(np.einsum('ij,ij->i', columns[:, 0:3], columns[:, 0:3]))
+        angular_velocity = np.sqrt(np.einsum('ij,ij->i', columns[:, 3:6], columns[:, 3:6]))
+        peak_gyro = int(np.argmax(angular_velocity))
+        peak_accel = int(np.argmax(acceleration))
+        
+        with self._lock:
+            # argmax returns the first maximum, and strict > keeps an earlier equal peak
+            if self.sample_count == 0 or angular_velocity[peak_gyro] > self.max_angular_velocity:
+                self.max_angular_velocity = float(angular_velocity[peak_gyro])
+                self.peak_angular_velocity_time = float(timestamps[peak_gyro])
+            if self.sample_count == 0 or acceleration[peak_accel] > self.max_acceleration:
+                self.max_acceleration = float(acceleration[peak_accel])
+                self.peak_acceleration_time = float(timestamps[peak_accel])
+            
+            if self._last_timestamp is not None:
+                dt = (timestamps[0] - self._last_timestamp) / 1000.0
+                self.impulse += dt * (acceleration[0] + self._last_acceleration) * 0.5
+            dt = np.diff(timestamps) / 1000.0
+            self.impulse += float(np.sum(dt * (acceleration[1:] + acceleration[:-1]) * 0.5))
+            
+            self._last_timestamp = float(timestamps[-1])
+            self._last_acceleration = float(acceleration[-1])
+            self.sample_count += len(samples)
+    
+    def _analysis(self) -> Dict[str, float]:
+        if self.sample_count == 0:
+            return {}
+        return swing_characteristics(
+            self.max_angular_velocity, self.max_acceleration,
+            self.peak_angular_velocity_time, self.peak_acceleration_time,
+            self.impulse, self.sample_count
+        )
+    
+    def analysis(self) -> Dict[str, float]:
+        """Swing analysis of the samples seen so far"""
+        with self._lock:
+            return self._analysis()
+    
+    def close(self) -> Dict[str, float]:
+        """Return the analysis of the current swing and start a new one"""
+        with self._lock:
+            analysis = self._analysis()
+            self._reset()
+            return analysis
+
+class TrajectoryArray:
+    """Columnar trajectory backed by one contiguous (5, N) float64 array
+    
+    The columns (time, x, y, velocity_x, velocity_y) are zero-copy views,
+    so consumers can plot or serialize them without rebuilding lists.
+    Indexing and iteration still yield TrajectoryPoint objects, so code
+    written against the old List[TrajectoryPoint] keeps working.
+    """
+    
+    FIELDS = ("time", "x", "y", "velocity_x", "velocity_y")
+    
+    def __init__(self, data: np.ndarray):
+        self.data = np.ascontiguousarray(data, dtype=np.float64).reshape(len(self.FIELDS), -1)
+    
+    @classmethod
+    def from_rows(cls, rows: List[float]) -> 'TrajectoryArray':
+        """Build from a flat [t, x, y, vx, vy, t, x, ...] list"""
+        return cls(np.array(rows, dtype=np.float64).reshape(-1, len(cls.FIELDS)).T)
+    
+    @classmethod
+    def from_points(cls, points) -> 'TrajectoryArray':
+        """Build from any iterable of TrajectoryPoint"""
+        if isinstance(points, cls):
+            return points
+        return cls.from_rows([
+            value for p in points
+            for value in (p.time, p.x, p.y, p.velocity_x, p.velocity_y)
+        ])
+    
+    @property
+    def time(self) -> np.ndarray:
+        return self.data[0]
+    
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[1]
+    
+    @property
+    def y(self) -> np.ndarray:
+        return self.data[2]
+    
+    @property
+    def velocity_x(self) -> np.ndarray:
+        return self.data[3]
+    
+    @property
+    def velocity_y(self) -> np.ndarray:
+        return self.data[4]
+    
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+    
+    def __len__(self):
+        return self.data.shape[1]
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TrajectoryArray(self.data[:, index])
+        return TrajectoryPoint(*self.data[:, index].tolist())
+    
+    def __iter__(self):
+        for row in self.data.T.tolist():
+            yield TrajectoryPoint(*row)
+    
+    def __repr__(self):
+        return f"TrajectoryArray({len(self)} points)"
+
+class LazyTrajectory:
+    """Trajectory that is only integrated the first time it is read
+    
+    Used by the lookup table mode: the headline numbers come from the
+    table, and the full point list is computed only when a display or
+    the data store actually iterates over it.
+    """
+    
+    def __init__(self, simulator: 'GolfBallSimulator', launch_conditions: LaunchConditions):
+        self._simulator = simulator
+        self._launch_conditions = launch_conditions
+        self._points = None
+    
+    @property
+    def points(self) -> TrajectoryArray:
+        if self._points is None:
+            self._points = self._simulator.simulate_trajectory(self._launch_conditions)
+        return self._points
+    
+    def __getattr__(self, name):
+        # Column views (x, y, time, ...) of the underlying TrajectoryArray
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.points, name)
+    
+    def __len__(self):
+        return len(self.points)
+    
+    def __iter__(self):
+        return iter(self.points)
+    
+    def __getitem__(self, index):
+        return self.points[index]
+    
+
+class TrajectoryLookupTable:
+    """Precomputed launch -> result grid answered by trilinear interpolation
+    
+    The grid spans ball speed (m/s), launch angle (deg) and spin rate (rpm)
+    and stores the analyze_trajectory() metrics for every node. A cell is
+    only served (see covers()) when all eight corner shots landed before
+    the flight time cap and the interpolation error measured at the cell
+    centre is within ``max_cell_error`` metres of carry and height.
+    """
+    
+    METRICS = ("carry_distance", "max_height", "flight_time",
+               "landing_velocity", "landing_angle", "apex_time")
+    
+    DEFAULT_RANGES = {
+        "ball_speed": (5.0, 150.0),
+        "launch_angle": (0.0, 60.0),
+        "spin_rate": (0.0, 15000.0)
+    }
+    
+    def __init__(self, speeds: np.ndarray, angles: np.ndarray, spins: np.ndarray,
+                 results: np.ndarray, landed: np.ndarray, cell_error: np.ndarray,
+                 integrator: str = "euler", timestep: float = 0.01, tolerance: float = 1e-6,
+                 max_cell_error: float = 1.0):
+        if min(len(speeds), len(angles), len(spins)) < 2:
+            raise ValueError("Lookup table needs at least 2 nodes per axis")
+        
+        self.speeds = speeds
+        self.angles = angles
+        self.spins = spins
+        self.results = results        # (len(speeds), len(angles), len(spins), len(METRICS))
+        self.landed = landed          # Per node: False if the shot hit the flight time cap
+        self.cell_error = cell_error  # Per cell: interpolation error at the centre (m)
+        self.integrator = integrator  # Settings of the simulator the table stands in for
+        self.timestep = timestep
+        self.tolerance = tolerance
+        self.max_cell_error = max_cell_error
+        self.logger = logging.getLogger(__name__)
+        
+        # Cells with every corner landed, and of those the ones accurate enough to serve
+        self.cell_landed = np.ones(cell_error.shape, dtype=bool)
+        for di in (0, 1):
+            for dj in (0, 1):
+                for dk in (0, 1):
+                    self.cell_landed &= landed[di:len(speeds) - 1 + di,
+                                               dj:len(angles) - 1 + dj,
+                                               dk:len(spins) - 1 + dk]
+        self.servable = self.cell_landed & (cell_error <= max_cell_error)
+        
+        # Plain floats keep lookup() free of NumPy scalar overhead
+        self._axes = [
+            (float(axis[0]), float(axis[-1]), len(axis) - 1)
+            for axis in (speeds, angles, spins)
+        ]
+    
+    @classmethod
+    def build(cls, simulator: 'GolfBallSimulator', resolution: Tuple[int, int, int] = (30, 25, 30),
+              ranges: Dict[str, Tuple[float, float]] = None,
+              max_cell_error: float = 1.0) -> 'TrajectoryLookupTable':
+        """Run the batch engine over every grid node and cell centre"""
+        if min(resolution) < 2:
+            raise ValueError(f"Lookup table resolution {tuple(resolution)} needs at least 2 nodes per axis")
+        
+        ranges = {**cls.DEFAULT_RANGES, **(ranges or {})}
+        speeds = np.linspace(*ranges["ball_speed"], resolution[0])
+        angles = np.linspace(*ranges["launch_angle"], resolution[1])
+        spins = np.linspace(*ranges["spin_rate"], resolution[2])
+        
+        grid = np.stack(np.meshgrid(speeds, angles, spins, indexing="ij"), axis=-1)
+        results, landed = cls._simulate_grid(simulator, grid)
+        
+        # Interpolation error where it is largest: halfway between the nodes
+        centres = (grid[:-1, :-1, :-1] + grid[1:, 1:, 1:]) / 2
+        centre_results, centre_landed = cls._simulate_grid(simulator, centres)
+        interpolated = sum(
+            results[di:di + centres.shape[0], dj:dj + centres.shape[1], dk:dk + centres.shape[2]]
+            for di in (0, 1) for dj in (0, 1) for dk in (0, 1)
+        ) / 8
+        distance_metrics = [cls.METRICS.index("carry_distance"), cls.METRICS.index("max_height")]
+        cell_error = np.abs(interpolated - centre_results)[..., distance_metrics].max(axis=-1)
+        cell_error[~centre_landed] = np.inf
+        
+        return cls(speeds, angles, spins, results, landed, cell_error,
+                   simulator.integrator, simulator.timestep, simulator.tolerance, max_cell_error)
+    
+    @classmethod
+    def _simulate_grid(cls, simulator: 'GolfBallSimulator', grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(metrics, landed) arrays shaped like a grid of launches"""
+        batch_results = simulator.simulate_trajectories_batch(grid.reshape(-1, 3))
+        results = np.array([
+            [result[metric] for metric in cls.METRICS] for result in batch_results
+        ], dtype=np.float32).reshape(*grid.shape[:3], len(cls.METRICS))
+        landed = np.array([result["landed"] for result in batch_results]).reshape(grid.shape[:3])
+        return results, landed
+    
+    def save(self, path: str):
+        """Save table as a compact binary .npz file"""
+        np.savez(path, speeds=self.speeds, angles=self.angles, spins=self.spins,
+                 results=self.results, metrics=np.array(self.METRICS), landed=self.landed,
+                 cell_error=self.cell_error, integrator=np.array(self.integrator),
+                 timestep=self.timestep, tolerance=self.tolerance)
+        self.logger.info(f"Lookup table saved to {path}")
+    
+    @classmethod
+    def load(cls, path: str, max_cell_error: float = 1.0) -> 'TrajectoryLookupTable':
+        """Load a table written by save()"""
+        with np.load(path) as data:
+            if tuple(data["metrics"]) != cls.METRICS:
+                raise ValueError(f"Lookup table {path} has unexpected metrics {tuple(data['metrics'])}")
+            if "cell_error" not in data.files:
+                raise ValueError(f"Lookup table {path} predates landed/error tracking, rebuild it")
+            return cls(data["speeds"], data["angles"], data["spins"], data["results"],
+                       data["landed"], data["cell_error"], str(data["integrator"]),
+                       float(data["timestep"]), float(data["tolerance"]), max_cell_error)
+    
+    def _cell(self, ball_speed: float, launch_angle: float, spin_rate: float) -> list:
+        """(index, fraction) of the cell containing a launch, per axis"""
+        cell = []
+        for value, (low, high, cells) in zip((ball_speed, launch_angle, spin_rate), self._axes):
+            position = (value - low) / (high - low) * cells
+            index = min(max(int(position), 0), cells - 1)
+            cell.append((index, min(max(position - index, 0.0), 1.0)))
+        return cell
+    
+    def coverage(self) -> float:
+        """Fraction of the grid cells that are served"""
+        return float(self.servable.mean())
+    
+    def covers(self, ball_speed: float, launch_angle: float, spin_rate: float) -> bool:
+        """True if the launch lies inside the grid in a cell that is served"""
+        if not all(
+            low <= value <= high
+            for value, (low, high, _) in zip((ball_speed, launch_angle, spin_rate), self._axes)
+        ):
+            return False
+        (i, _), (j, _), (k, _) = self._cell(ball_speed, launch_angle, spin_rate)
+        return bool(self.servable[i, j, k])
+    
+    def lookup(self, ball_speed: float, launch_angle: float, spin_rate: float) -> Dict[str, float]:
+        """Trilinear interpolation of the result metrics at one launch"""
+        (i, fi), (j, fj), (k, fk) = self._cell(ball_speed, launch_angle, spin_rate)
+        corners = self.results[i:i + 2, j:j + 2, k:k + 2]
+        
+        # Collapse one axis at a time
+        c = corners[0] * (1 - fi) + corners[1] * fi
+        c = c[0] * (1 - fj) + c[1] * fj
+        c = c[0] * (1 - fk) + c[1] * fk
+        
+        results = dict(zip(self.METRICS, c.tolist()))
+        results["landed"] = bool(self.cell_landed[i, j, k])
+        return results
+    
+    def error_report(self, samples: int = 200, seed: int = 0) -> Dict[str, Dict[str, float]]:
+        """Compare the table against the scalar integrator it stands in for
+        
+        Launches are drawn at random from the served cells and simulated
+        with simulate_trajectory() using the table's integrator settings,
+        i.e. what simulate_shot() would return without the table.
+        """
+        if not self.servable.any():
+            raise ValueError("Lookup table serves no cells")
+        
+        rng = np.random.default_rng(seed)
+        cells = np.argwhere(self.servable)[rng.integers(int(self.servable.sum()), size=samples)]
+        launches = [
+            [float(axis[index] + rng.uniform() * (axis[index + 1] - axis[index]))
+             for axis, index in zip((self.speeds, self.angles, self.spins), cell)]
+            for cell in cells
+        ]
+        
+        simulator = GolfBallSimulator(integrator=self.integrator, timestep=self.timestep,
+                                      tolerance=self.tolerance)
+        reference = [
+            simulator.analyze_trajectory(simulator.simulate_trajectory(
+                LaunchConditions(*launch, carry_distance=0, total_distance=0, max_height=0, flight_time=0)))
+            for launch in launches
+        ]
+        
+        report = {}
+        for metric in self.METRICS:
+            errors = np.array([
+                abs(self.lookup(*launch)[metric] - ref[metric])
+                for launch, ref in zip(launches, reference)
+            ])
+            report[metric] = {
+                "max_error": float(errors.max()),
+                "mean_error": float(errors.mean()),
+                "p95_error": float(np.percentile(errors, 95))
+            }
+        return report
+
+class TrajectoryCache:
+    """Bounded LRU cache of simulated shots keyed on quantized launch conditions
+    
+    Launches are snapped to a grid of ``resolution`` (ball speed m/s, launch
+    angle deg, spin rpm) and the snapped launch is what gets simulated, so a
+    cached answer does not depend on which nearby swing came first. The
+    snapped launch is returned alongside the result so callers report the
+    conditions that were actually simulated.
+    Entries are evicted least-recently-used once either the entry count or
+    the estimated memory size is exceeded.
+    """
+    
+    RESULT_KEYS = TrajectoryLookupTable.METRICS
+    
+    def __init__(self, max_entries: int = 1000, max_memory_mb: float = 64.0,
+                 resolution: Tuple[float, float, float] = (0.1, 0.1, 10.0)):
+        self.max_entries = max_entries
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.resolution = tuple(resolution)
+        
+        self._entries = OrderedDict()  # key -> (trajectory, results, size)
+        self._lock = threading.Lock()
+        self.memory_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        self.logger = logging.getLogger(__name__)
+    
+    def quantize(self, launch_conditions: LaunchConditions) -> Tuple[int, int, int]:
+        """Grid cell of a launch"""
+        return tuple(
+            round(value / step) for value, step in zip(
+                (launch_conditions.ball_speed, launch_conditions.launch_angle,
+                 launch_conditions.spin_rate),
+                self.resolution
+            )
+        )
+    
+    def snap(self, launch_conditions: LaunchConditions) -> LaunchConditions:
+        """The launch at the centre of the launch's grid cell"""
+        cell = self.quantize(launch_conditions)
+        return LaunchConditions(
+            ball_speed=cell[0] * self.resolution[0],
+            launch_angle=cell[1] * self.resolution[1],
+            spin_rate=cell[2] * self.resolution[2],
+            carry_distance=0,
+            total_distance=0,
+            max_height=0,
+            flight_time=0
+        )
+    
+    def get_or_simulate(self, simulator: 'GolfBallSimulator', launch_conditions: LaunchConditions
+                        ) -> Tuple[TrajectoryArray, Dict[str, float], LaunchConditions]:
+        """Return (trajectory, results, snapped launch) for a launch, simulating on a miss"""
+        cell = self.quantize(launch_conditions)
+        key = (simulator.integrator, simulator.timestep, simulator.tolerance) + cell
+        snapped = self.snap(launch_conditions)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], dict(entry[1]), snapped
+            self.misses += 1
+        
+        trajectory = simulator.simulate_trajectory(snapped)
+        results = simulator.analyze_trajectory(trajectory)
+        
+        with self._lock:
+            self._insert(key, trajectory, results)
+        return trajectory, dict(results), snapped
+    
+    def _insert(self, key, trajectory, results):
+        """Add an entry and evict from the LRU end until within limits"""
+        if key in self._entries:
+            self.memory_bytes -= self._entries.pop(key)[2]
+        
+        size = trajectory.nbytes
+        self._entries[key] = (trajectory, results, size)
+        self.memory_bytes += size
+        
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self.memory_bytes > self.max_memory_bytes):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.memory_bytes -= evicted_size
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.memory_bytes = 0
+    
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss/eviction counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self.memory_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+    
+    def save(self, path: str):
+        """Persist entries (oldest first) to an .npz file so a restart begins warm
+        
+        Plain arrays only: load() never unpickles anything.
+        """
+        with self._lock:
+            entries = [(key, trajectory, results)
+                       for key, (trajectory, results, _) in self._entries.items()]
+        
+        with open(path, "wb") as f:  # File object: np.savez would otherwise append .npz
+            np.savez(
+                f,
+                resolution=np.array(self.resolution, dtype=np.float64),
+                result_keys=np.array(self.RESULT_KEYS),
+                integrators=np.array([key[0] for key, _, _ in entries], dtype=str),
+                settings=np.array([key[1:3] for key, _, _ in entries], dtype=np.float64).reshape(-1, 2),
+                cells=np.array([key[3:] for key, _, _ in entries], dtype=np.int64).reshape(-1, 3),
+                results=np.array([[results[k] for k in self.RESULT_KEYS] for _, _, results in entries],
+                                 dtype=np.float64).reshape(-1, len(self.RESULT_KEYS)),
+                landed=np.array([results.get("landed", True) for _, _, results in entries], dtype=bool),
+                lengths=np.array([len(trajectory) for _, trajectory, _ in entries], dtype=np.int64),
+                trajectories=np.concatenate([trajectory.data for _, trajectory, _ in entries], axis=1)
+                if entries else np.empty((len(TrajectoryArray.FIELDS), 0))
+            )
+        self.logger.info(f"Saved {len(entries)} cached trajectories to {path}")
+    
+    def load(self, path: str) -> int:
+        """Load entries written by save(); returns the number loaded"""
+        with np.load(path) as data:
+            if tuple(data["resolution"]) != self.resolution:
+                self.logger.warning(f"Ignoring trajectory cache {path}: resolution "
+                                    f"{tuple(data['resolution'])} != {self.resolution}")
+                return 0
+            if tuple(data["result_keys"]) != self.RESULT_KEYS:
+                raise ValueError(f"Trajectory cache {path} has unexpected results {tuple(data['result_keys'])}")
+            
+            offsets = np.concatenate(([0], np.cumsum(data["lengths"])))
+            trajectories = data["trajectories"]
+            with self._lock:
+                for i, (integrator, (timestep, tolerance), cell, values, landed) in enumerate(zip(
+                        data["integrators"].tolist(), data["settings"].tolist(), data["cells"].tolist(),
+                        data["results"].tolist(), data["landed"].tolist())):
+                    results = dict(zip(self.RESULT_KEYS, values), landed=landed)
+                    trajectory = TrajectoryArray(trajectories[:, offsets[i]:offsets[i + 1]])
+                    self._insert((integrator, timestep, tolerance) + tuple(cell), trajectory, results)
+                loaded = len(self._entries)
+        
+        self.logger.info(f"Loaded {loaded} cached trajectories from {path}")
+        return loaded
+
 class GolfBallSimulator:
     """Physics-based golf ball flight simulator"""
     
-    def __init__(self):
+    INTEGRATORS = ("euler", "rk4", "rk45")
+    
+    def __init__(self, integrator: str = "euler", timestep: float = 0.01,
+                 tolerance: float = 1e-6):
+        if integrator not in self.INTEGRATORS:
+            raise ValueError(f"Unknown integrator '{integrator}', expected one of {self.INTEGRATORS}")
+        
         # Physical constants
         self.GRAVITY = 9.81  # m/s^2
         self.AIR_DENSITY = 1.225  # kg/m^3 at sea level
@@ -47,6 +663,21 @@ class GolfBallSimulator:
         self.DRAG_COEFFICIENT = 0.47  # Typical for golf ball
         self.MAGNUS_COEFFICIENT = 0.25  # For spin effects
         
+        # Integration settings
+        self.integrator = integrator  # euler, rk4 or rk45 (adaptive)
+        self.timestep = timestep      # Fixed step, or initial step for rk45 (s)
+        self.tolerance = tolerance    # rk45 local error tolerance
+        self.MAX_ADAPTIVE_STEP = 0.1  # seconds, keeps rk45 trajectories plottable
+        
+        # Integration safety cap - stops shots that never come back down
+        self.MAX_FLIGHT_TIME = 20.0  # seconds
+        
+        # Optional surrogate for the player-facing numbers (see use_lookup_table)
+        self.lookup_table = None
+        
+        # Optional memoization of repeated launches (see use_trajectory_cache)
+        self.trajectory_cache = None
+        
         # Club specifications
         self.club_specs = {
             "Driver": {"loft": 10.5, "max_distance": 250},
@@ -61,34 +692,48 @@ class GolfBallSimulator:
         
         self.logger = logging.getLogger(__name__)
     
-    def analyze_swing_data(self, swing_data_points: List) -> Dict[str, float]:
-        """Analyze swing data to extract swing characteristics"""
-        if not swing_data_points:
+    def use_lookup_table(self, lookup_table: Optional[TrajectoryLookupTable]):
+        """Answer simulate_complete_shot() from a lookup table when the launch is in range"""
+        self.lookup_table = lookup_table
+    
+    def use_trajectory_cache(self, trajectory_cache: Optional[TrajectoryCache]):
+        """Serve simulate_complete_shot() through an LRU cache of quantized launches"""
+        self.trajectory_cache = trajectory_cache
+    
+    def analyze_swing_data(self, swing_data_points, timestamps=None) -> Dict[str, float]:
+        """Analyze swing data to extract swing characteristics
+        
+        ``swing_data_points`` may be a list of SwingData-like objects, an
+        (N, 6) float array with columns SWING_FIELDS, or a structured array
+        with those field names (plus an optional ``timestamp`` field).
+        ``timestamps`` are in milliseconds; samples are assumed 10 ms apart
+        when none are available.
+        """
+        timestamps, samples = swing_data_to_columns(swing_data_points, timestamps)
+        if not len(samples):
             return {}
         
+        # Magnitudes of acceleration (columns 0-2) and angular velocity (3-5)
+        accel_magnitude = np.sqrt(np.einsum('ij,ij->i', samples[:, 0:3], samples[:, 0:3]))
+        gyro_magnitude = np.sqrt(np.einsum('ij,ij->i', samples[:, 3:6], samples[:, 3:6]))
+        
         # Calculate swing speed from gyroscope data
-        max_angular_velocity = 0
-        for point in swing_data_points:
-            angular_vel = math.sqrt(point.gyro_x**2 + point.gyro_y**2 + point.gyro_z**2)
-            max_angular_velocity = max(max_angular_velocity, angular_vel)
+        peak_gyro_index = int(np.argmax(gyro_magnitude))
+        max_angular_velocity = float(gyro_magnitude[peak_gyro_index])
         
         # Calculate impact acceleration
-        max_acceleration = 0
-        for point in swing_data_points:
-            accel_magnitude = math.sqrt(point.accel_x**2 + point.accel_y**2 + point.accel_z**2)
-            max_acceleration = max(max_acceleration, accel_magnitude)
+        peak_accel_index = int(np.argmax(accel_magnitude))
+        max_acceleration = float(accel_magnitude[peak_accel_index])
         
-        # Convert to swing characteristics
-        # These are simplified conversions - real implementation would use calibration data
-        club_head_speed = max_angular_velocity * 0.5  # Simplified conversion
-        impact_force = max_acceleration * 10  # Simplified conversion
+        # Impulse: time integral of acceleration magnitude (trapezoidal, seconds)
+        dt = np.diff(timestamps) / 1000.0
+        impulse = float(np.sum(dt * (accel_magnitude[1:] + accel_magnitude[:-1]) * 0.5))
         
-        return {
-            "club_head_speed": club_head_speed,
-            "impact_force": impact_force,
-            "max_angular_velocity": max_angular_velocity,
-            "max_acceleration": max_acceleration
-        }
+        return swing_characteristics(
+            max_angular_velocity, max_acceleration,
+            float(timestamps[peak_gyro_index]), float(timestamps[peak_accel_index]),
+            impulse, len(samples)
+        )
     
     def calculate_initial_conditions(self, swing_analysis: Dict[str, float], 
                                    club_name: str) -> LaunchConditions:
@@ -119,82 +764,303 @@ class GolfBallSimulator:
             flight_time=0      # Will be calculated
         )
     
-    def simulate_trajectory(self, launch_conditions: LaunchConditions) -> List[TrajectoryPoint]:
-        """Simulate complete ball trajectory with physics"""
+    def _acceleration(self, vx, vy, spin_rate):
+        """Drag + Magnus + gravity acceleration (works on floats and NumPy arrays)"""
+        velocity_magnitude = (vx * vx + vy * vy) ** 0.5
+        
+        # Drag opposes velocity: |F|/m * v/|v| == k * |v| * v
+        drag_factor = 0.5 * self.AIR_DENSITY * self.DRAG_COEFFICIENT * self.BALL_AREA / self.BALL_MASS
+        ax = -drag_factor * velocity_magnitude * vx
+        ay = -drag_factor * velocity_magnitude * vy
+        
+        # Magnus force (spin effect) - simplified upward lift for backspin
+        ay = ay + self.MAGNUS_COEFFICIENT * spin_rate * velocity_magnitude / 1000 / self.BALL_MASS
+        
+        return ax, ay - self.GRAVITY
+    
+    def _euler_step(self, x, y, vx, vy, spin_rate, h):
+        """Semi-implicit Euler step (velocity first, then position)"""
+        ax, ay = self._acceleration(vx, vy, spin_rate)
+        vx = vx + ax * h
+        vy = vy + ay * h
+        return x + vx * h, y + vy * h, vx, vy
+    
+    def _rk4_step(self, x, y, vx, vy, spin_rate, h):
+        """Classic fourth-order Runge-Kutta step"""
+        ax1, ay1 = self._acceleration(vx, vy, spin_rate)
         
-        trajectory = []
-        dt = 0.01  # 10ms time step
+        vx2, vy2 = vx + 0.5 * h * ax1, vy + 0.5 * h * ay1
+        ax2, ay2 = self._acceleration(vx2, vy2, spin_rate)
+        
+        vx3, vy3 = vx + 0.5 * h * ax2, vy + 0.5 * h * ay2
+        ax3, ay3 = self._acceleration(vx3, vy3, spin_rate)
+        
+        vx4, vy4 = vx + h * ax3, vy + h * ay3
+        ax4, ay4 = self._acceleration(vx4, vy4, spin_rate)
+        
+        return (
+            x + h / 6 * (vx + 2 * vx2 + 2 * vx3 + vx4),
+            y + h / 6 * (vy + 2 * vy2 + 2 * vy3 + vy4),
+            vx + h / 6 * (ax1 + 2 * ax2 + 2 * ax3 + ax4),
+            vy + h / 6 * (ay1 + 2 * ay2 + 2 * ay3 + ay4)
+        )
+    
+    def _dopri_step(self, x, y, vx, vy, spin_rate, h):
+        """Dormand-Prince RK5(4) step, returns (new_state, scaled_error)"""
+        state = (x, y, vx, vy)
+        
+        def derivative(s):
+            ax, ay = self._acceleration(s[2], s[3], spin_rate)
+            return (s[2], s[3], ax, ay)
+        
+        def advance(*terms):
+            return tuple(
+                state[i] + h * sum(a * k[i] for a, k in terms)
+                for i in range(4)
+            )
+        
+        k1 = derivative(state)
+        k2 = derivative(advance((1/5, k1)))
+        k3 = derivative(advance((3/40, k1), (9/40, k2)))
+        k4 = derivative(advance((44/45, k1), (-56/15, k2), (32/9, k3)))
+        k5 = derivative(advance((19372/6561, k1), (-25360/2187, k2),
+                                (64448/6561, k3), (-212/729, k4)))
+        k6 = derivative(advance((9017/3168, k1), (-355/33, k2), (46732/5247, k3),
+                                (49/176, k4), (-5103/18656, k5)))
+        new_state = advance((35/384, k1), (500/1113, k3), (125/192, k4),
+                            (-2187/6784, k5), (11/84, k6))
+        k7 = derivative(new_state)
+        
+        # Difference between the 5th and embedded 4th order solutions
+        error_weights = ((71/57600, k1), (-71/16695, k3), (71/1920, k4),
+                         (-17253/339200, k5), (22/525, k6), (-1/40, k7))
+        error = 0.0
+        for i in range(4):
+            component_error = abs(h * sum(a * k[i] for a, k in error_weights))
+            scale = self.tolerance * (1 + max(abs(state[i]), abs(new_state[i])))
+            error = max(error, component_error / scale)
+        
+        return new_state, error
+    
+    @staticmethod
+    def _landing_fraction(y0, vy0, y1, vy1, h):
+        """Fraction of a step where the cubic Hermite through both ends crosses y = 0"""
+        s = y0 / (y0 - y1)  # Linear guess, refined with Newton
+        for _ in range(4):
+            s2, s3 = s * s, s * s * s
+            p = ((2*s3 - 3*s2 + 1) * y0 + (s3 - 2*s2 + s) * h * vy0
+                 + (3*s2 - 2*s3) * y1 + (s3 - s2) * h * vy1)
+            dp = ((6*s2 - 6*s) * y0 + (3*s2 - 4*s + 1) * h * vy0
+                  + (6*s - 6*s2) * y1 + (3*s2 - 2*s) * h * vy1)
+            s = s - p / np.where(dp == 0, -1.0, dp)  # dp == 0 only for a ball launched flat
+        return np.clip(s, 0.0, 1.0)
+    
+    @staticmethod
+    def _hermite(s, p0, v0, p1, v1, h):
+        """Cubic Hermite interpolation of position over a step at fraction s"""
+        s2, s3 = s * s, s * s * s
+        return ((2*s3 - 3*s2 + 1) * p0 + (s3 - 2*s2 + s) * h * v0
+                + (3*s2 - 2*s3) * p1 + (s3 - s2) * h * v1)
+    
+    def _interpolate_landing(self, t, h, before, after):
+        """Ground-crossing state between two integrator samples"""
+        x0, y0, vx0, vy0 = before
+        x1, y1, vx1, vy1 = after
+        s = self._landing_fraction(y0, vy0, y1, vy1, h)
+        return (
+            t + s * h,
+            self._hermite(s, x0, vx0, x1, vx1, h),
+            vx0 + s * (vx1 - vx0),
+            vy0 + s * (vy1 - vy0)
+        )
+    
+    def simulate_trajectory(self, launch_conditions: LaunchConditions) -> TrajectoryArray:
+        """Simulate complete ball trajectory with physics
+        
+        The final point is placed exactly on the ground (y = 0) by
+        interpolating between the last airborne sample and the first one
+        below ground, so carry and flight time are not quantized to the step.
+        """
+        
+        rows = []  # Flat t, x, y, vx, vy samples, packed into columns at the end
+        spin_rate = launch_conditions.spin_rate
         
         # Initial conditions
         v0 = launch_conditions.ball_speed
         angle_rad = math.radians(launch_conditions.launch_angle)
-        
-        # Initial velocity components
-        vx = v0 * math.cos(angle_rad)
-        vy = v0 * math.sin(angle_rad)
-        
-        # Initial position
-        x, y = 0.0, 0.0
+        state = (0.0, 0.0, v0 * math.cos(angle_rad), v0 * math.sin(angle_rad))
         t = 0.0
+        h = self.timestep
         
-        while y >= 0:  # Continue until ball hits ground
-            # Calculate drag force
-            velocity_magnitude = math.sqrt(vx**2 + vy**2)
-            drag_force = 0.5 * self.AIR_DENSITY * self.DRAG_COEFFICIENT * self.BALL_AREA * velocity_magnitude**2
-            
-            # Drag acceleration components
-            if velocity_magnitude > 0:
-                drag_ax = -(drag_force / self.BALL_MASS) * (vx / velocity_magnitude)
-                drag_ay = -(drag_force / self.BALL_MASS) * (vy / velocity_magnitude)
+        while t < self.MAX_FLIGHT_TIME:
+            if self.integrator == "rk45":
+                h = min(h, self.MAX_FLIGHT_TIME - t)
+                new_state, error = self._dopri_step(*state, spin_rate, h)
+                # Standard step size controller, clamped to [0.2x, 5x]
+                factor = 5.0 if error == 0 else min(5.0, max(0.2, 0.9 * error ** -0.2))
+                if error > 1.0:
+                    h *= factor
+                    continue
+                step, h = h, min(h * factor, self.MAX_ADAPTIVE_STEP)
+            elif self.integrator == "rk4":
+                new_state = self._rk4_step(*state, spin_rate, h)
+                step = h
             else:
-                drag_ax = drag_ay = 0
-            
-            # Magnus force (spin effect) - simplified
-            magnus_force = self.MAGNUS_COEFFICIENT * launch_conditions.spin_rate * velocity_magnitude / 1000
-            magnus_ay = magnus_force / self.BALL_MASS  # Upward lift for backspin
+                new_state = self._euler_step(*state, spin_rate, h)
+                step = h
             
-            # Total acceleration
-            ax = drag_ax
-            ay = drag_ay + magnus_ay - self.GRAVITY
+            if new_state[1] < 0:  # Ball hits ground during this step
+                t_land, x_land, vx_land, vy_land = self._interpolate_landing(t, step, state, new_state)
+                rows.extend((t_land, x_land, 0.0, vx_land, vy_land))
+                break
             
-            # Update velocity
-            vx += ax * dt
-            vy += ay * dt
-            
-            # Update position
-            x += vx * dt
-            y += vy * dt
-            t += dt
+            state = new_state
+            t += step
             
             # Store trajectory point
-            trajectory.append(TrajectoryPoint(
-                time=t,
-                x=x,
-                y=y,
-                velocity_x=vx,
-                velocity_y=vy
-            ))
-        
-        return trajectory
-    
-    def analyze_trajectory(self, trajectory: List[TrajectoryPoint]) -> Dict[str, float]:
-        """Analyze trajectory to extract key metrics"""
-        if not trajectory:
+            rows.append(t)
+            rows.extend(state)
+        else:
+            self.logger.warning(f"Ball still airborne at the {self.MAX_FLIGHT_TIME:g} s flight time cap "
+                                f"(height {state[1]:.1f} m), result is marked as not landed")
+        
+        return TrajectoryArray.from_rows(rows)
+
+    def simulate_trajectories_batch(self, launches) -> List[Dict[str, float]]:
+        """Simulate many launches at once, advancing all balls in lockstep
+
+        ``launches`` is either a sequence of LaunchConditions or an (N, 3)
+        array-like of (ball_speed, launch_angle, spin_rate) rows. Balls are
+        masked out as they land, and one result dict per shot is returned
+        with the same keys as analyze_trajectory().
+
+        Lockstep needs a shared step, so the adaptive "rk45" integrator is
+        run as fixed-step RK4 here. Shots still airborne at MAX_FLIGHT_TIME
+        come back with ``landed`` False.
+        """
+        if len(launches) == 0:
+            return []
+
+        if isinstance(launches[0], LaunchConditions):
+            launch_array = np.array([
+                (lc.ball_speed, lc.launch_angle, lc.spin_rate) for lc in launches
+            ], dtype=np.float64)
+        else:
+            launch_array = np.asarray(launches, dtype=np.float64).reshape(-1, 3)
+
+        n = launch_array.shape[0]
+        dt = self.timestep
+        step = self._euler_step if self.integrator == "euler" else self._rk4_step
+
+        # Per-shot outputs
+        carry_distance = np.zeros(n)
+        flight_time = np.zeros(n)
+        landing_vx = np.zeros(n)
+        landing_vy = np.zeros(n)
+        max_height = np.full(n, -np.inf)
+        apex_time = np.zeros(n)
+
+        # State of the balls still in flight; idx maps back to the shot index
+        idx = np.arange(n)
+        angle_rad = np.radians(launch_array[:, 1])
+        vx = launch_array[:, 0] * np.cos(angle_rad)
+        vy = launch_array[:, 0] * np.sin(angle_rad)
+        spin = launch_array[:, 2]
+        x = np.zeros(n)
+        y = np.zeros(n)
+        t = 0.0
+
+        while idx.size and t < self.MAX_FLIGHT_TIME:
+            new_x, new_y, new_vx, new_vy = step(x, y, vx, vy, spin, dt)
+
+            landed = new_y < 0
+            if landed.any():
+                landed_idx = idx[landed]
+                t_land, x_land, vx_land, vy_land = self._interpolate_landing(
+                    t, dt,
+                    (x[landed], y[landed], vx[landed], vy[landed]),
+                    (new_x[landed], new_y[landed], new_vx[landed], new_vy[landed])
+                )
+                carry_distance[landed_idx] = x_land
+                flight_time[landed_idx] = t_land
+                landing_vx[landed_idx] = vx_land
+                landing_vy[landed_idx] = vy_land
+
+                in_flight = ~landed
+                idx = idx[in_flight]
+                new_x, new_y = new_x[in_flight], new_y[in_flight]
+                new_vx, new_vy = new_vx[in_flight], new_vy[in_flight]
+                spin = spin[in_flight]
+
+            x, y, vx, vy = new_x, new_y, new_vx, new_vy
+            t += dt
+
+            # Track apex (first sample reaching the maximum, as in analyze_trajectory)
+            higher = y > max_height[idx]
+            if higher.any():
+                max_height[idx[higher]] = y[higher]
+                apex_time[idx[higher]] = t
+
+        # Balls still airborne at the flight time cap end where they are
+        carry_distance[idx] = x
+        flight_time[idx] = t
+        landing_vx[idx] = vx
+        landing_vy[idx] = vy
+        landed = np.ones(n, dtype=bool)
+        landed[idx] = False
+        if idx.size:
+            self.logger.warning(f"{idx.size} of {n} shots still airborne at the {self.MAX_FLIGHT_TIME:g} s "
+                                f"flight time cap, marked as not landed")
+
+        # Shots that land on the first step never recorded an airborne sample
+        never_airborne = np.isinf(max_height)
+        max_height[never_airborne] = 0.0
+        apex_time[never_airborne] = flight_time[never_airborne]
+
+        landing_velocity = np.sqrt(landing_vx**2 + landing_vy**2)
+        landing_angle = np.degrees(np.arctan2(-landing_vy, landing_vx))
+
+        return [
+            {
+                "carry_distance": float(carry_distance[i]),
+                "max_height": float(max_height[i]),
+                "flight_time": float(flight_time[i]),
+                "landing_velocity": float(landing_velocity[i]),
+                "landing_angle": float(landing_angle[i]),
+                "apex_time": float(apex_time[i]),
+                "landed": bool(landed[i])
+            }
+            for i in range(n)
+        ]
+
+    def analyze_trajectory(self, trajectory: TrajectoryArray) -> Dict[str, float]:
+        """Analyze trajectory to extract key metrics
+        
+        ``landed`` is False when the trajectory was cut off by MAX_FLIGHT_TIME
+        before reaching the ground; carry, flight time and landing angle are
+        then those of the last integrated point.
+        """
+        if not len(trajectory):
             return {}
         
-        # Find maximum height and its time
-        max_height = max(point.y for point in trajectory)
-        max_height_time = next(point.time for point in trajectory if point.y == max_height)
+        # Accept plain lists of TrajectoryPoint as well
+        if not hasattr(trajectory, 'data'):
+            trajectory = TrajectoryArray.from_points(trajectory)
+        
+        # Find maximum height and its time (argmax returns the first maximum)
+        apex_index = int(np.argmax(trajectory.y))
+        max_height = float(trajectory.y[apex_index])
+        max_height_time = float(trajectory.time[apex_index])
         
-        # Carry distance (where ball lands)
-        carry_distance = trajectory[-1].x
+        # Landing point (only on the ground if the ball came down before the cap)
+        time, carry_distance, height, landing_vx, landing_vy = trajectory.data[:, -1].tolist()
         
         # Flight time
-        flight_time = trajectory[-1].time
+        flight_time = time
         
         # Landing angle
-        landing_velocity = math.sqrt(trajectory[-1].velocity_x**2 + trajectory[-1].velocity_y**2)
-        landing_angle = math.degrees(math.atan2(-trajectory[-1].velocity_y, trajectory[-1].velocity_x))
+        landing_velocity = math.sqrt(landing_vx**2 + landing_vy**2)
+        landing_angle = math.degrees(math.atan2(-landing_vy, landing_vx))
         
         return {
             "carry_distance": carry_distance,
@@ -202,7 +1068,8 @@ class GolfBallSimulator:
             "flight_time": flight_time,
             "landing_velocity": landing_velocity,
             "landing_angle": landing_angle,
-            "apex_time": max_height_time
+            "apex_time": max_height_time,
+            "landed": height <= 0.0
         }
     
     def simulate_complete_shot(self, swing_data_points: List, club_name: str) -> Dict[str, Any]:
@@ -211,14 +1078,31 @@ class GolfBallSimulator:
         # Analyze swing data
         swing_analysis = self.analyze_swing_data(swing_data_points)
         
+        return self.simulate_shot(swing_analysis, club_name)
+    
+    def simulate_shot(self, swing_analysis: Dict[str, float], club_name: str) -> Dict[str, Any]:
+        """Simulation from an already computed swing analysis (e.g. SwingAccumulator)"""
+        
         # Calculate launch conditions
         launch_conditions = self.calculate_initial_conditions(swing_analysis, club_name)
         
-        # Simulate trajectory
-        trajectory = self.simulate_trajectory(launch_conditions)
+        launch = (launch_conditions.ball_speed, launch_conditions.launch_angle,
+                  launch_conditions.spin_rate)
         
-        # Analyze results
-        results = self.analyze_trajectory(trajectory)
+        if self.lookup_table and self.lookup_table.covers(*launch):
+            # Surrogate mode: numbers from the table, trajectory only on demand
+            results = self.lookup_table.lookup(*launch)
+            trajectory = LazyTrajectory(self, launch_conditions)
+        elif self.trajectory_cache is not None:
+            # Report the snapped launch the cached trajectory was simulated from
+            trajectory, results, launch_conditions = self.trajectory_cache.get_or_simulate(
+                self, launch_conditions)
+        else:
+            # Simulate trajectory
+            trajectory = self.simulate_trajectory(launch_conditions)
+            
+            # Analyze results
+            results = self.analyze_trajectory(trajectory)
         
         return {
             "swing_analysis": swing_analysis,
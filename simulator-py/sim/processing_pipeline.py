@@ -0,0 +1,186 @@
+"""
+Golf HILS System - Staged Processing Pipeline
+
+This module connects the swing processing stages with bounded queues so a
+slow stage (e.g. PNG export) only holds up the stages behind it:
+
+    ingest -> segment -> simulate -> (live display thread)
+                                  -> persist
+                                  -> render_export
+
+Each stage runs a handler on its own worker threads and reports its queue
+depth, the time items spend queued and the handler's service time.
+"""
+
+import time
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from sim.swing_segmenter import LatencyHistogram
+
+_STOP = object()
+
+class PipelineStage:
+    """Bounded queue plus worker threads running ``handler(item)``
+
+    When the queue is full, submit() either blocks the caller
+    (when_full='block', backpressure on the upstream stage) or drops the
+    item (when_full='drop', for work that may be skipped under load).
+    """
+
+    WHEN_FULL = ('block', 'drop')
+
+    def __init__(self, name: str, handler: Callable[[Any], None], workers: int = 1,
+                 queue_size: int = 16, when_full: str = 'block'):
+        if workers < 1:
+            raise ValueError(f"Stage '{name}' needs at least one worker")
+        if when_full not in self.WHEN_FULL:
+            raise ValueError(f"Unknown when_full '{when_full}', expected one of {self.WHEN_FULL}")
+
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.when_full = when_full
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.logger = logging.getLogger(__name__)
+
+        self.wait_latency = LatencyHistogram(f"{name}_wait")
+        self.service_latency = LatencyHistogram(f"{name}_service")
+        self._threads: List[threading.Thread] = []
+
+        # Counters
+        self.processed = 0
+        self.errors = 0
+        self.dropped = 0
+        self.high_water = 0
+        self._counter_lock = threading.Lock()
+
+    def start(self):
+        """Start the worker threads"""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, item: Any) -> bool:
+        """Queue an item; returns False if it was dropped"""
+        entry = (time.perf_counter(), item)
+        if self.when_full == 'drop':
+            try:
+                self.queue.put_nowait(entry)
+            except queue.Full:
+                with self._counter_lock:
+                    self.dropped += 1
+                self.logger.debug(f"Stage '{self.name}' full, dropping item")
+                return False
+        else:
+            self.queue.put(entry)
+
+        depth = self.queue.qsize()
+        if depth > self.high_water:
+            self.high_water = depth
+        return True
+
+    def _run(self):
+        while True:
+            entry = self.queue.get()
+            try:
+                if entry is _STOP:
+                    return
+                queued_at, item = entry
+                started = time.perf_counter()
+                self.wait_latency.record(started - queued_at)
+                try:
+                    self.handler(item)
+                except Exception as e:
+                    with self._counter_lock:
+                        self.errors += 1
+                    self.logger.error(f"Error in stage '{self.name}': {e}")
+                self.service_latency.record(time.perf_counter() - started)
+                with self._counter_lock:
+                    self.processed += 1
+            finally:
+                self.queue.task_done()
+
+    def join(self):
+        """Wait until every queued item has been handled"""
+        self.queue.join()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Let the workers finish the queue, then end them"""
+        for _ in self._threads:
+            self.queue.put(_STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, counters and latency summaries"""
+        return {
+            'workers': self.workers,
+            'queue_depth': self.queue.qsize(),
+            'queue_size': self.queue.maxsize,
+            'high_water': self.high_water,
+            'processed': self.processed,
+            'errors': self.errors,
+            'dropped': self.dropped,
+            'wait': self.wait_latency.summary(),
+            'service': self.service_latency.summary()
+        }
+
+class StagedPipeline:
+    """Ordered set of stages, started, drained and stopped upstream first"""
+
+    def __init__(self):
+        self.stages: Dict[str, PipelineStage] = {}
+        self.started = False
+        self.logger = logging.getLogger(__name__)
+
+    def add_stage(self, stage: PipelineStage) -> PipelineStage:
+        """Append a stage; add them in upstream-to-downstream order"""
+        self.stages[stage.name] = stage
+        return stage
+
+    def __getitem__(self, name: str) -> PipelineStage:
+        return self.stages[name]
+
+    def start(self):
+        """Start every stage (once)"""
+        if self.started:
+            return
+        for stage in self.stages.values():
+            stage.start()
+        self.started = True
+
+    def join(self):
+        """Wait until every stage has handled everything queued so far"""
+        for stage in self.stages.values():
+            stage.join()
+
+    def stop(self, timeout: Optional[float] = 10.0):
+        """Drain and stop the stages in order"""
+        if not self.started:
+            return
+        for stage in self.stages.values():
+            stage.stop(timeout)
+        self.started = False
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage statistics"""
+        return {name: stage.stats() for name, stage in self.stages.items()}
+
+    def format(self) -> str:
+        """One line per stage: depth, counters and p50/p99 wait and service time"""
+        lines = []
+        for name, stats in self.stats().items():
+            wait, service = stats['wait'], stats['service']
+            lines.append(
+                f"{name:>13}: depth {stats['queue_depth']}/{stats['queue_size']} "
+                f"(high {stats['high_water']}) processed {stats['processed']} "
+                f"dropped {stats['dropped']} errors {stats['errors']} | "
+                f"wait p50 {wait.get('p50_ms', 0):.1f} ms p99 {wait.get('p99_ms', 0):.1f} ms | "
+                f"service p50 {service.get('p50_ms', 0):.1f} ms p99 {service.get('p99_ms', 0):.1f} ms"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,203 @@
+"""
+Golf HILS System - Swing Segmentation
+
+This module detects the phases of a golf swing (address, backswing,
+impact, finish) from the streaming IMU samples, so a swing can be closed
+a few samples after impact instead of after a fixed time window.
+"""
+
+import math
+import bisect
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+class SwingSegmenter:
+    """Threshold/hysteresis state machine over gyro and accel magnitude
+
+    Phases:
+        ADDRESS   - club at rest, waiting for a swing
+        BACKSWING - angular velocity rose above start_gyro (covers the downswing too)
+        IMPACT    - acceleration spike seen, collecting post_impact_samples
+        FINISH    - swing closed, waiting for the club to come back to rest
+
+    update() returns one of the event constants when a sample causes a
+    transition that the caller has to act on, otherwise None.
+    """
+
+    ADDRESS = "address"
+    BACKSWING = "backswing"
+    IMPACT = "impact"
+    FINISH = "finish"
+
+    # Events returned by update()
+    SWING_START = "swing_start"
+    IMPACT_DETECTED = "impact_detected"
+    SWING_END = "swing_end"
+    SWING_ABORT = "swing_abort"
+
+    def __init__(self, start_gyro: float = 150.0, rest_gyro: float = 30.0,
+                 impact_accel: float = 4.0, post_impact_samples: int = 5,
+                 max_swing_ms: float = 3000.0):
+        if rest_gyro >= start_gyro:
+            raise ValueError("rest_gyro must be below start_gyro to give hysteresis")
+
+        self.start_gyro = start_gyro          # dps, rest -> swing
+        self.rest_gyro = rest_gyro            # dps, swing/finish -> rest
+        self.impact_accel = impact_accel      # G, impact spike
+        self.post_impact_samples = post_impact_samples
+        self.max_swing_ms = max_swing_ms      # Close a swing that never shows an impact
+
+        self.logger = logging.getLogger(__name__)
+        self.reset()
+
+    def reset(self):
+        """Return to the address phase"""
+        self.phase = self.ADDRESS
+        self.swing_start_timestamp = None
+        self.impact_timestamp = None
+        self.samples_since_impact = 0
+
+    def update(self, sample) -> Optional[str]:
+        """Advance the state machine with one SwingData-like sample"""
+        gyro = math.sqrt(sample.gyro_x**2 + sample.gyro_y**2 + sample.gyro_z**2)
+        accel = math.sqrt(sample.accel_x**2 + sample.accel_y**2 + sample.accel_z**2)
+        return self.step(sample.timestamp, gyro, accel)
+
+    def scan(self, timestamps: np.ndarray, gyro: np.ndarray, accel: np.ndarray) -> List[Tuple[int, str]]:
+        """Advance the state machine over a block of samples at once
+
+        Takes the timestamps and the gyro/accel magnitudes of the block and
+        returns (index, event) for every sample that produced an event, as
+        calling update() per sample would. The block is searched with NumPy
+        for the next transition instead of stepping through every sample.
+        """
+        events = []
+        position = 0
+        count = len(timestamps)
+        while position < count:
+            if self.phase == self.IMPACT:
+                # Fixed number of samples to go, no search needed
+                needed = max(self.post_impact_samples - self.samples_since_impact, 1)
+                if position + needed > count:
+                    self.samples_since_impact += count - position
+                    break
+                position += needed - 1
+                self.samples_since_impact = self.post_impact_samples
+                self.phase = self.FINISH
+                events.append((position, self.SWING_END))
+                position += 1
+                continue
+
+            if self.phase == self.ADDRESS:
+                hits = gyro[position:] >= self.start_gyro
+            elif self.phase == self.BACKSWING:
+                hits = ((accel[position:] >= self.impact_accel) | (gyro[position:] < self.rest_gyro) |
+                        (timestamps[position:] - self.swing_start_timestamp >= self.max_swing_ms))
+            else:
+                hits = gyro[position:] < self.rest_gyro
+
+            offset = int(np.argmax(hits))
+            if not hits[offset]:
+                break
+            position += offset
+            event = self.step(int(timestamps[position]), float(gyro[position]), float(accel[position]))
+            if event:
+                events.append((position, event))
+            position += 1
+        return events
+
+    def step(self, timestamp: int, gyro: float, accel: float) -> Optional[str]:
+        """Advance the state machine with one sample's timestamp and gyro/accel magnitudes"""
+        if self.phase == self.ADDRESS:
+            if gyro >= self.start_gyro:
+                self.phase = self.BACKSWING
+                self.swing_start_timestamp = timestamp
+                return self.SWING_START
+            return None
+
+        if self.phase == self.BACKSWING:
+            if accel >= self.impact_accel:
+                self.phase = self.IMPACT
+                self.impact_timestamp = timestamp
+                self.samples_since_impact = 0
+                return self.IMPACT_DETECTED
+
+            if gyro < self.rest_gyro:
+                # Club came back to rest without an impact (waggle / practice swing)
+                self.reset()
+                return self.SWING_ABORT
+
+            if timestamp - self.swing_start_timestamp >= self.max_swing_ms:
+                self.logger.warning("No impact detected within max_swing_ms, closing swing")
+                self.phase = self.FINISH
+                return self.SWING_END
+            return None
+
+        if self.phase == self.IMPACT:
+            self.samples_since_impact += 1
+            if self.samples_since_impact >= self.post_impact_samples:
+                self.phase = self.FINISH
+                return self.SWING_END
+            return None
+
+        # FINISH: wait for the follow-through to settle before arming again
+        if gyro < self.rest_gyro:
+            self.reset()
+        return None
+
+class LatencyHistogram:
+    """Thread-safe latency recorder with fixed millisecond buckets"""
+
+    BUCKETS_MS = (10, 20, 50, 100, 150, 200, 300, 500, 1000, 2000)
+
+    def __init__(self, name: str = "latency", window: int = 1000):
+        self.name = name
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)  # Last bucket is overflow
+        self.recent = deque(maxlen=window)              # For percentiles
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Add one latency sample"""
+        milliseconds = seconds * 1000.0
+        with self._lock:
+            self.counts[bisect.bisect_left(self.BUCKETS_MS, milliseconds)] += 1
+            self.recent.append(milliseconds)
+            self.total += 1
+
+    def summary(self) -> Dict[str, float]:
+        """Count and p50/p90/p99/max of the recent window in milliseconds"""
+        with self._lock:
+            values = sorted(self.recent)
+            total = self.total
+        if not values:
+            return {"count": total}
+
+        def pick(q):
+            return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+        return {
+            "count": total,
+            "p50_ms": pick(0.50),
+            "p90_ms": pick(0.90),
+            "p99_ms": pick(0.99),
+            "max_ms": values[-1]
+        }
+
+    def format(self) -> str:
+        """Text histogram, one line per non-empty bucket"""
+        with self._lock:
+            counts = list(self.counts)
+
+        lines = [f"{self.name}: {self.summary()}"]
+        lower = 0
+        for upper, count in zip(list(self.BUCKETS_MS) + [None], counts):
+            label = f"{lower}-{upper} ms" if upper is not None else f">{lower} ms"
+            if count:
+                lines.append(f"  {label:>14} {count:>6} {'#' * min(count, 50)}")
+            lower = upper
+        return "\n".join(lines)
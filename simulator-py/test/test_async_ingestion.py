@@ -0,0 +1,124 @@
+"""
+Golf HILS System - asyncio ingestion over a pseudo-terminal
+
+Floods a pty with synthetic swings as JSON lines and checks that the
+asyncio pipeline reads, segments, simulates and stores every one of them,
+keeps up with the flood and reports results within the latency bounds.
+
+Run from simulator-py with: python -m pytest test
+"""
+
+import os
+import pty
+import sys
+import json
+import time
+import asyncio
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.async_ingestion import AsyncIngestionPipeline, open_serial_connection, close_serial_connection
+from main import GolfHILSSimulator, load_default_config
+
+SWINGS = 10
+
+# Bounds with a wide margin over a 1-CPU machine (~15k samples/s, result
+# p99 < 10 ms, stored p99 < 20 ms); the sensor itself sends 100 samples/s
+MIN_SAMPLES_PER_S = 2000
+MAX_RESULT_P50_MS = 50.0
+MAX_RESULT_P99_MS = 250.0
+MAX_STORED_P99_MS = 500.0
+
+def swing_packets(start_timestamp: int, seed: int) -> list:
+    """One 100 Hz swing (address, downswing, impact, follow-through) as JSON lines"""
+    rng = np.random.default_rng(seed)
+    phases = [(50, 5.0, 5.0, 1.0), (60, 20.0, 300.0, 1.2), (25, 300.0, 1200.0, 2.0),
+              (1, 1200.0, 1200.0, 8.0), (40, 1000.0, 50.0, 1.5), (50, 10.0, 5.0, 1.0)]
+    packets = []
+    timestamp = start_timestamp
+    for count, gyro_start, gyro_end, accel in phases:
+        for gyro in np.linspace(gyro_start, gyro_end, count):
+            noise = rng.normal(0.0, 0.02, 6)
+            packets.append(json.dumps({
+                'timestamp': timestamp,
+                'accel_x': accel * 0.3 + noise[0], 'accel_y': accel * 0.3 + noise[1],
+                'accel_z': accel * 0.9 + noise[2], 'gyro_x': gyro * 0.2 + noise[3],
+                'gyro_y': gyro * 0.95 + noise[4], 'gyro_z': gyro * 0.2 + noise[5],
+                'club': '7-Iron', 'player': 'TestPlayer', 'device_id': 'M5StickCPlus2_TEST'
+            }) + "\n")
+            timestamp += 10
+    return packets
+
+def write_swings(master_fd: int):
+    timestamp = 0
+    for swing in range(SWINGS):
+        packets = swing_packets(timestamp, seed=swing)
+        timestamp += len(packets) * 10
+        os.write(master_fd, "".join(packets).encode())
+
+@pytest.fixture
+def pty_pair():
+    master_fd, slave_fd = pty.openpty()
+    yield master_fd, os.ttyname(slave_fd)
+    os.close(master_fd)
+    os.close(slave_fd)
+
+@pytest.fixture
+def app(tmp_path):
+    config = load_default_config()
+    config['display']['mode'] = 'none'
+    config['database']['path'] = str(tmp_path / "test_async_ingestion.db")
+    app = GolfHILSSimulator(config)
+    assert app.initialize_components()
+    assert app.start_session("TestPlayer")
+    yield app
+    app.cleanup()
+
+def test_swings_from_pty_are_simulated_and_stored(pty_pair, app):
+    master_fd, port = pty_pair
+    samples = SWINGS * len(swing_packets(0, 0))
+
+    async def run():
+        reader, serial_connection = await open_serial_connection(port)
+        pipeline = AsyncIngestionPipeline(app, reader)
+        run_task = asyncio.create_task(pipeline.run())
+        writer = threading.Thread(target=write_swings, args=(master_fd,))
+        start = time.perf_counter()
+        writer.start()
+
+        deadline = time.monotonic() + 30.0
+        while pipeline.samples_received < samples and time.monotonic() < deadline:
+            await asyncio.sleep(0.001)
+        flood_s = time.perf_counter() - start
+        while pipeline.swings_processed < SWINGS and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+        await asyncio.get_running_loop().run_in_executor(None, writer.join)
+        pipeline.stop()
+        await run_task
+        close_serial_connection(serial_connection)
+        return pipeline, flood_s
+
+    pipeline, flood_s = asyncio.run(run())
+    app.data_store.flush()
+    stored = app.data_store.connection.execute("SELECT COUNT(*) FROM simulation_results").fetchone()[0]
+
+    assert pipeline.samples_received == samples
+    assert pipeline.swings_processed == SWINGS
+    assert app.result_latency.total == SWINGS
+    assert stored == SWINGS
+
+    # Throughput over the flood and impact-to-result / impact-to-stored latency
+    assert samples / flood_s >= MIN_SAMPLES_PER_S
+    result_latency = app.result_latency.summary()
+    stored_latency = app.stored_latency.summary()
+    assert result_latency['p50_ms'] <= MAX_RESULT_P50_MS
+    assert result_latency['p99_ms'] <= MAX_RESULT_P99_MS
+    assert stored_latency['count'] == SWINGS
+    assert stored_latency['p99_ms'] <= MAX_STORED_P99_MS
@@ -0,0 +1,192 @@
+"""
+Golf HILS System - binary sensor frame protocol
+
+Checks COBS framing, CRC and sequence counters, frames split across reads
+and the switch from JSON lines to binary frames in SerialDataListener.
+
+Run from simulator-py with: python -m pytest test
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.binary_protocol import (
+    BinaryFrameDecoder, cobs_decode, cobs_encode, encode_frame, encode_header_frame,
+    encode_sample_frame, FRAME_SAMPLES
+)
+from comm.serial_data_listener import SAMPLE_DTYPE, SampleBlock, SerialDataListener, SwingData
+
+def make_samples(count: int, start_timestamp: int = 0) -> np.ndarray:
+    samples = np.zeros(count, dtype=SAMPLE_DTYPE)
+    samples['timestamp'] = start_timestamp + np.arange(count) * 10
+    for index, axis in enumerate(SAMPLE_DTYPE.names[1:]):
+        samples[axis] = np.linspace(-2.0, 2.0, count) * (index + 1)
+    return samples
+
+def binary_stream(blocks: int = 3, samples_per_block: int = 8) -> tuple:
+    """HEADER frame then SAMPLES frames; returns (bytes, all samples)"""
+    frames = [encode_header_frame("M5StickCPlus2_TEST", "7-Iron", "TestPlayer", seq=0)]
+    samples = make_samples(blocks * samples_per_block)
+    for block in range(blocks):
+        frames.append(encode_sample_frame(
+            samples[block * samples_per_block:(block + 1) * samples_per_block], seq=block + 1))
+    return b"".join(frames), samples
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"\x00",
+    b"\x00\x00\x00",
+    b"abc",
+    b"\x00abc\x00\x00def\x00",
+    b"\x11" * 253,
+    b"\x11" * 254,
+    b"\x11" * 255,
+    b"\x11" * 254 + b"\x00" + b"\x22" * 254,
+    b"\x00" * 300,
+    bytes(range(256)) * 3
+], ids=lambda data: f"{len(data)}B")
+def test_cobs_round_trip(data):
+    encoded = cobs_encode(data)
+    assert b"\x00" not in encoded
+    assert cobs_decode(encoded) == data
+
+def test_cobs_round_trip_random():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        data = rng.choice([0, 1, 255], size=rng.integers(0, 600), p=[0.2, 0.7, 0.1])
+        data = data.astype(np.uint8).tobytes()
+        assert cobs_decode(cobs_encode(data)) == data
+
+@pytest.mark.parametrize("frame", [b"\x03a", b"\x02a\x00b", b"\x05ab"])
+def test_cobs_decode_rejects_malformed_frames(frame):
+    with pytest.raises(ValueError):
+        cobs_decode(frame)
+
+def test_crc_error_is_counted_and_skipped():
+    samples = make_samples(4)
+    good = encode_sample_frame(samples, seq=1)
+    corrupt = bytearray(encode_sample_frame(samples, seq=2))
+    corrupt[10] ^= 0x01 if corrupt[10] != 0x01 else 0x03    # Flip a bit, keep it non-zero
+
+    decoder = BinaryFrameDecoder()
+    decoder.feed(encode_header_frame("dev", "Driver", "P", seq=0))
+    blocks = decoder.feed(bytes(corrupt) + good)
+
+    assert decoder.frame_errors == 1
+    assert len(blocks) == 1
+    assert np.array_equal(blocks[0].samples, samples)
+
+def test_sequence_gaps_are_counted_with_wraparound():
+    decoder = BinaryFrameDecoder()
+    decoder.feed(encode_header_frame("dev", "Driver", "P", seq=250))
+    for seq in (251, 254, 255, 0, 1, 3):
+        decoder.feed(encode_sample_frame(make_samples(1), seq=seq))
+
+    # 252, 253 and 2 never arrived
+    assert decoder.frames_lost == 3
+    assert decoder.frames_received == 7
+    assert decoder.frame_errors == 0
+
+def test_samples_before_header_are_dropped():
+    decoder = BinaryFrameDecoder()
+    assert decoder.feed(encode_sample_frame(make_samples(5), seq=0)) == []
+    assert decoder.samples_without_header == 5
+    assert decoder.samples_received == 0
+
+def test_unknown_frame_type_and_truncated_body_are_errors():
+    decoder = BinaryFrameDecoder()
+    decoder.feed(encode_header_frame("dev", "Driver", "P"))
+    decoder.feed(encode_frame(0x7F, 1, b"xyz"))
+    decoder.feed(encode_frame(FRAME_SAMPLES, 2, make_samples(2).tobytes()[:-1]))
+    assert decoder.frame_errors == 2
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 29, 64, 1000])
+def test_frames_split_across_feed_binary_calls(chunk_size):
+    stream, samples = binary_stream()
+    listener = SerialDataListener(read_mode='select', protocol='binary')
+
+    blocks = []
+    for start in range(0, len(stream), chunk_size):
+        blocks.extend(listener.feed(stream[start:start + chunk_size]))
+
+    assert all(isinstance(block, SampleBlock) for block in blocks)
+    assert [block.club for block in blocks] == ["7-Iron"] * 3
+    assert blocks[0].player == "TestPlayer"
+    assert np.array_equal(np.concatenate([block.samples for block in blocks]), samples)
+    assert listener.packets_received == len(samples)
+    assert listener.parse_errors == 0
+    assert listener.frame_decoder.frames_lost == 0
+
+def test_header_and_samples_split_at_every_offset():
+    stream, samples = binary_stream(blocks=1, samples_per_block=4)
+    for split in range(1, len(stream)):
+        listener = SerialDataListener(read_mode='select', protocol='binary')
+        blocks = listener.feed(stream[:split]) + listener.feed(stream[split:])
+        assert len(blocks) == 1, split
+        assert np.array_equal(blocks[0].samples, samples)
+
+def json_line(timestamp: int) -> bytes:
+    return (json.dumps({
+        'timestamp': timestamp, 'accel_x': 0.1, 'accel_y': 0.2, 'accel_z': 1.0,
+        'gyro_x': 1.0, 'gyro_y': 2.0, 'gyro_z': 3.0,
+        'club': '7-Iron', 'player': 'TestPlayer', 'device_id': 'M5StickCPlus2_TEST'
+    }) + "\n").encode()
+
+def test_auto_switches_from_json_lines_to_binary():
+    stream, samples = binary_stream()
+    listener = SerialDataListener(read_mode='select', protocol='auto')
+
+    # Two JSON lines, then the binary stream in the same read
+    items = listener.feed(json_line(0) + json_line(10) + stream[:20])
+    items += listener.feed(stream[20:])
+
+    assert [type(item) for item in items[:2]] == [SwingData, SwingData]
+    assert [item.timestamp for item in items[:2]] == [0, 10]
+    assert all(isinstance(item, SampleBlock) for item in items[2:])
+    assert np.array_equal(np.concatenate([item.samples for item in items[2:]]), samples)
+    assert listener.frame_decoder is not None
+    assert listener.packets_received == 2 + len(samples)
+
+def test_auto_switch_discards_partial_json_line():
+    stream, samples = binary_stream(blocks=1)
+    listener = SerialDataListener(read_mode='select', protocol='auto')
+
+    assert listener.feed(json_line(0)[:15]) == []
+    items = listener.feed(stream)
+
+    assert len(items) == 1
+    assert np.array_equal(items[0].samples, samples)
+    assert listener.parse_errors == 0
+
+def test_json_protocol_never_switches():
+    listener = SerialDataListener(read_mode='select', protocol='json')
+    listener.feed(json_line(0) + b"\x00")
+    assert listener.frame_decoder is None
+
+def test_auto_switch_with_stream_split_at_every_offset():
+    stream, samples = binary_stream(blocks=1, samples_per_block=4)
+    data = json_line(0) + json_line(10) + stream
+    for split in range(1, len(data)):
+        listener = SerialDataListener(read_mode='select', protocol='auto')
+        items = listener.feed(data[:split]) + listener.feed(data[split:])
+        assert [item.timestamp for item in items[:2]] == [0, 10], split
+        assert len(items) == 3, split
+        assert np.array_equal(items[2].samples, samples)
+
+def test_auto_switch_after_boot_noise():
+    stream, samples = binary_stream(blocks=1)
+    listener = SerialDataListener(read_mode='select', protocol='auto')
+
+    items = listener.feed(b"ets Jul 29 2019 12:21:46\r\nrst:0x1 (POWERON_RESET)\r\n")
+    items += listener.feed(json_line(0) + b"boot: ok\n" + stream)
+
+    assert [type(item) for item in items] == [SwingData, SampleBlock]
+    assert np.array_equal(items[1].samples, samples)
+    assert listener.parse_errors == 3
@@ -0,0 +1,354 @@
+"""
+Golf HILS System - SQLite data store
+
+Checks the streaming player statistics (Welford UPSERT and histogram
+percentiles), including on a database created before those columns, and
+the packed swing sample and trajectory encodings and their migration
+from JSON rows.
+
+Run from simulator-py with: python -m pytest test
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.golf_data_store import GolfDataStore
+from sim.ball_flight_simulator import TrajectoryArray
+
+# Tables as created before the packed-storage and streaming-statistics columns
+OLD_SCHEMA = """
+    CREATE TABLE swings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id INTEGER,
+        timestamp INTEGER NOT NULL,
+        club_name TEXT NOT NULL,
+        player_name TEXT NOT NULL,
+        device_id TEXT,
+        raw_data TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE simulation_results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        swing_id INTEGER,
+        carry_distance REAL,
+        max_height REAL,
+        flight_time REAL,
+        ball_speed REAL,
+        launch_angle REAL,
+        spin_rate REAL,
+        landing_angle REAL,
+        trajectory_data TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE player_statistics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        player_name TEXT NOT NULL,
+        club_name TEXT NOT NULL,
+        avg_distance REAL,
+        max_distance REAL,
+        avg_accuracy REAL,
+        total_swings INTEGER,
+        last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(player_name, club_name)
+    );
+"""
+
+@pytest.fixture
+def store(tmp_path):
+    store = GolfDataStore(str(tmp_path / "golf.db"))
+    yield store
+    store.close()
+
+def carry_distances(count: int, seed: int = 0) -> np.ndarray:
+    return np.clip(np.random.default_rng(seed).normal(150.0, 25.0, count), 1.0, 390.0)
+
+def statistics_by_club(store: GolfDataStore, player_name: str) -> dict:
+    return {row['club_name']: row for row in store.get_player_statistics(player_name)}
+
+@pytest.mark.parametrize("read_pool_size", [0, -1])
+def test_empty_read_pool_is_rejected(tmp_path, read_pool_size):
+    # Every reader() call would otherwise block forever
+    with pytest.raises(ValueError):
+        GolfDataStore(str(tmp_path / "golf.db"), read_pool_size=read_pool_size)
+
+def test_player_statistics_match_numpy(store):
+    distances = {'7-Iron': carry_distances(500, seed=1), 'Driver': carry_distances(40, seed=2) + 60.0}
+    for club, club_distances in distances.items():
+        for distance in club_distances:
+            store.update_player_statistics("TestPlayer", club, distance)
+
+    statistics = statistics_by_club(store, "TestPlayer")
+    assert sorted(statistics) == sorted(distances)
+    for club, club_distances in distances.items():
+        row = statistics[club]
+        assert row['total_swings'] == len(club_distances)
+        assert row['avg_distance'] == pytest.approx(np.mean(club_distances), rel=1e-12)
+        assert row['std_distance'] == pytest.approx(np.std(club_distances, ddof=1), rel=1e-9)
+        assert row['max_distance'] == pytest.approx(np.max(club_distances))
+
+        # Interpolated within a histogram bin
+        for key, percentile in (('p50_distance', 50), ('p90_distance', 90)):
+            assert abs(row[key] - np.percentile(club_distances, percentile)) <= GolfDataStore.DISTANCE_SKETCH_BIN_M
+
+def test_single_shot_statistics(store):
+    store.update_player_statistics("TestPlayer", "Putter", 12.5)
+    row = statistics_by_club(store, "TestPlayer")['Putter']
+    assert row['total_swings'] == 1
+    assert row['avg_distance'] == 12.5
+    assert row['std_distance'] == 0.0
+    # Capped at the exact maximum rather than the end of the bin
+    assert row['p50_distance'] <= 12.5
+    assert row['p90_distance'] <= 12.5
+
+def test_distance_sketch_clamps_out_of_range_distances():
+    sketch = None
+    for distance in (-5.0, 0.0, 10_000.0):
+        sketch = GolfDataStore.distance_sketch_add(sketch, distance)
+    counts = np.frombuffer(sketch, dtype='<u4')
+    assert len(counts) == GolfDataStore.DISTANCE_SKETCH_BINS
+    assert counts[0] == 2
+    assert counts[-1] == 1
+    assert GolfDataStore.distance_sketch_quantile(None, 0.5) is None
+
+def test_statistics_on_an_upgraded_database(tmp_path):
+    path = tmp_path / "old.db"
+    connection = sqlite3.connect(path)
+    connection.executescript(OLD_SCHEMA)
+    connection.execute("""
+        INSERT INTO player_statistics (player_name, club_name, avg_distance, max_distance,
+                                       avg_accuracy, total_swings)
+        VALUES ('TestPlayer', '7-Iron', 140.0, 160.0, 0.0, 4)
+    """)
+    connection.commit()
+    connection.close()
+
+    store = GolfDataStore(str(path))
+    try:
+        columns = {row[1] for row in store.connection.execute("PRAGMA table_info(player_statistics)")}
+        assert {'m2_distance', 'distance_sketch'} <= columns
+
+        # Old row: no spread or percentiles recorded yet
+        row = statistics_by_club(store, "TestPlayer")['7-Iron']
+        assert row['std_distance'] == 0.0
+        assert row['p50_distance'] is None
+
+        new_distances = [150.0, 130.0, 170.0]
+        for distance in new_distances:
+            store.update_player_statistics("TestPlayer", "7-Iron", distance)
+        store.update_player_statistics("TestPlayer", "Driver", 220.0)
+
+        row = statistics_by_club(store, "TestPlayer")['7-Iron']
+        assert row['total_swings'] == 7
+        assert row['avg_distance'] == pytest.approx((140.0 * 4 + sum(new_distances)) / 7)
+        assert row['max_distance'] == 170.0
+        assert row['std_distance'] > 0.0
+        assert 130.0 <= row['p50_distance'] <= 170.0
+        assert statistics_by_club(store, "TestPlayer")['Driver']['total_swings'] == 1
+
+        # The other upgraded tables keep working too
+        session_id = store.create_session("TestPlayer")
+        swing_id = store.store_swing_data(session_id, {
+            'timestamp': 0, 'club': '7-Iron', 'player': 'TestPlayer', 'device_id': 'dev',
+            'accel_x': 0.0, 'accel_y': 0.0, 'accel_z': 1.0, 'gyro_x': 0.0, 'gyro_y': 0.0, 'gyro_z': 0.0
+        })
+        assert swing_id > 0
+    finally:
+        store.close()
+
+def swing_sample(timestamp: int, club: str = '7-Iron', device_id: str = 'dev') -> dict:
+    return {'timestamp': timestamp, 'club': club, 'player': 'TestPlayer', 'device_id': device_id,
+            'accel_x': 0.001 * timestamp, 'accel_y': -0.5, 'accel_z': 1.0,
+            'gyro_x': 10.0, 'gyro_y': 0.25 * timestamp, 'gyro_z': -3.0}
+
+def sample_block(count: int, start_timestamp: int = 1_700_000_000_000) -> tuple:
+    rng = np.random.default_rng(count)
+    timestamps = start_timestamp + np.cumsum(rng.integers(1, 20, count))
+    samples = rng.normal(0.0, 500.0, (count, GolfDataStore.SAMPLE_COLUMNS)).astype(np.float32)
+    return timestamps, samples
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("count", [0, 1, 250])
+def test_swing_samples_round_trip(compress, count):
+    timestamps, samples = sample_block(count)
+    start_timestamp, blob, encoding = GolfDataStore.encode_swing_samples(timestamps, samples, compress)
+    assert encoding == ('zlib-v1' if compress else 'raw-v1')
+
+    decoded_timestamps, decoded_samples = GolfDataStore.decode_swing_samples(
+        blob, encoding, start_timestamp, count)
+    assert decoded_timestamps.dtype == np.int64
+    assert np.array_equal(decoded_timestamps, timestamps)
+    assert np.array_equal(decoded_samples, samples)
+
+def test_decode_swing_samples_rejects_unknown_encoding():
+    with pytest.raises(ValueError):
+        GolfDataStore.decode_swing_samples(b"", 'bz2-v1', 0, 0)
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_stored_swing_samples_round_trip(tmp_path, compress):
+    store = GolfDataStore(str(tmp_path / "golf.db"), sample_storage='blob', compress_samples=compress)
+    try:
+        session_id = store.create_session("TestPlayer")
+        stored = {}
+        for count in (5, 120):
+            timestamps, samples = sample_block(count)
+            swing_id = store.store_swing_samples(session_id, timestamps, samples, '7-Iron', 'TestPlayer')
+            stored[swing_id] = (timestamps, samples)
+
+        for swing_id, (timestamps, samples) in stored.items():
+            decoded_timestamps, decoded_samples = store.get_swing_samples(swing_id)
+            assert np.array_equal(decoded_timestamps, timestamps)
+            assert np.array_equal(decoded_samples, samples)
+
+        assert [swing_id for swing_id, _, _ in store.iter_swing_samples(session_id)] == sorted(stored)
+        assert store.get_swing_samples(max(stored) + 1) is None
+    finally:
+        store.close()
+
+def test_migrate_to_blob_storage(store):
+    session_id = store.create_session("TestPlayer")
+    # Two swings 2 s apart, the first with process_swing's duplicated first
+    # sample, plus a swing from another club interleaved in time
+    first = [store.store_swing_data(session_id, swing_sample(timestamp))
+             for timestamp in (1000, 1000, 1010, 1020, 1030)]
+    second = [store.store_swing_data(session_id, swing_sample(timestamp))
+              for timestamp in (3000, 3010)]
+    driver = [store.store_swing_data(session_id, swing_sample(timestamp, club='Driver'))
+              for timestamp in (1005, 1015)]
+    result_id = store.store_simulation_result(first[2], {'results': {'carry_distance': 140.0}})
+
+    connection = store.connection
+    connection.executemany("UPDATE swings SET created_at = ? WHERE id = ?",
+                           [(f"2024-01-01 10:00:{index:02d}", row_id)
+                            for index, row_id in enumerate(first + second + driver)])
+    connection.execute("UPDATE swings SET created_at = '2023-12-31 23:59:59' WHERE id = ?", (first[3],))
+    connection.commit()
+
+    assert store.migrate_to_blob_storage(gap_ms=500) == 3
+    assert connection.execute("SELECT COUNT(*) FROM swings WHERE samples IS NULL").fetchone()[0] == 0
+
+    rows = connection.execute("""
+        SELECT id, club_name, timestamp, sample_count, created_at FROM swings ORDER BY timestamp, club_name
+    """).fetchall()
+    assert [(club, timestamp, count) for _, club, timestamp, count, _ in rows] == [
+        ('7-Iron', 1000, 4), ('Driver', 1005, 2), ('7-Iron', 3000, 2)
+    ]
+    # Earliest created_at of the rows each swing replaced
+    assert [created_at for *_, created_at in rows] == [
+        '2023-12-31 23:59:59', '2024-01-01 10:00:07', '2024-01-01 10:00:05'
+    ]
+
+    timestamps, samples = store.get_swing_samples(rows[0][0])
+    assert timestamps.tolist() == [1000, 1010, 1020, 1030]
+    expected = [[swing_sample(timestamp)[field] for field in GolfDataStore.EXPORT_SAMPLE_COLUMNS]
+                for timestamp in timestamps]
+    assert np.allclose(samples, expected)
+
+    # Results follow their swing to the packed row
+    swing_id = connection.execute("SELECT swing_id FROM simulation_results WHERE id = ?",
+                                  (result_id,)).fetchone()[0]
+    assert swing_id == rows[0][0]
+
+    # Nothing left to migrate
+    assert store.migrate_to_blob_storage() == 0
+
+def flight(point_count: int = 300) -> TrajectoryArray:
+    time = np.linspace(0.0, 6.0, point_count)
+    vx, vy = 55.0 - 2.0 * time, 25.0 - 9.81 * time
+    return TrajectoryArray(np.vstack((time, 55.0 * time - time ** 2, 25.0 * time - 4.905 * time ** 2, vx, vy)))
+
+def as_float32(trajectory: TrajectoryArray) -> dict:
+    return dict(zip(GolfDataStore.TRAJECTORY_COLUMNS, trajectory.data.astype(np.float32)))
+
+def assert_same_trajectory(actual: dict, expected: dict):
+    assert list(actual) == list(GolfDataStore.TRAJECTORY_COLUMNS)
+    for column in GolfDataStore.TRAJECTORY_COLUMNS:
+        assert np.array_equal(actual[column], expected[column]), column
+
+@pytest.mark.parametrize("compression", list(GolfDataStore.TRAJECTORY_COMPRESSION))
+@pytest.mark.parametrize("representation", ['array', 'points', 'records', 'columns'])
+def test_trajectory_round_trip(compression, representation):
+    trajectory = flight()
+    source = {
+        'array': trajectory,
+        'points': list(trajectory),
+        'records': GolfDataStore._trajectory_to_records(trajectory),
+        'columns': as_float32(trajectory)
+    }[representation]
+
+    blob, point_count, encoding = GolfDataStore.encode_trajectory(source, compression)
+    assert point_count == len(trajectory)
+    assert encoding == GolfDataStore.TRAJECTORY_COMPRESSION[compression]
+    # Lossless at float32, including the delta encoding's wrapping bit differences
+    assert_same_trajectory(GolfDataStore.decode_trajectory(blob, encoding, point_count), as_float32(trajectory))
+
+@pytest.mark.parametrize("compression", list(GolfDataStore.TRAJECTORY_COMPRESSION))
+def test_empty_trajectory_round_trip(compression):
+    blob, point_count, encoding = GolfDataStore.encode_trajectory([], compression)
+    decoded = GolfDataStore.decode_trajectory(blob, encoding, point_count)
+    assert point_count == 0
+    assert all(len(column) == 0 for column in decoded.values())
+
+def test_unknown_trajectory_formats_are_rejected():
+    with pytest.raises(ValueError):
+        GolfDataStore.encode_trajectory(flight(), 'lzma')
+    with pytest.raises(ValueError):
+        GolfDataStore.decode_trajectory(b"", 'f64-v1', 0)
+    with pytest.raises(ValueError):
+        GolfDataStore(trajectory_compression='lzma')
+
+@pytest.mark.parametrize("storage,compression", [('json', 'none'), ('blob', 'none'),
+                                                 ('blob', 'zlib'), ('blob', 'delta-zlib')])
+def test_load_trajectory(tmp_path, storage, compression):
+    store = GolfDataStore(str(tmp_path / "golf.db"), trajectory_storage=storage,
+                          trajectory_compression=compression)
+    try:
+        trajectory = flight()
+        result_id = store.store_simulation_result(1, {'results': {'carry_distance': 150.0},
+                                                      'trajectory': trajectory})
+        loaded = store.load_trajectory(result_id)
+        if storage == 'blob':
+            assert_same_trajectory(loaded, as_float32(trajectory))
+        else:
+            # JSON keeps the full float64 values
+            assert_same_trajectory(loaded, dict(zip(GolfDataStore.TRAJECTORY_COLUMNS, trajectory.data)))
+        assert store.load_trajectory(result_id + 1) is None
+    finally:
+        store.close()
+
+def test_convert_trajectories_to_blob(tmp_path):
+    path = str(tmp_path / "golf.db")
+    store = GolfDataStore(path)
+    trajectories = {}
+    for point_count in (10, 50, 120, 300, 7):
+        trajectory = flight(point_count)
+        result_id = store.store_simulation_result(1, {'trajectory': trajectory})
+        trajectories[result_id] = trajectory
+    unreadable_id = store.store_simulation_result(1, {})
+    store.connection.execute("UPDATE simulation_results SET trajectory_data = 'not json' WHERE id = ?",
+                             (unreadable_id,))
+    store.connection.commit()
+    store.close()
+
+    store = GolfDataStore(path, trajectory_storage='blob', trajectory_compression='delta-zlib')
+    try:
+        # Several batches, the unreadable row is skipped and left as it was
+        assert store.convert_trajectories_to_blob(batch_size=2) == len(trajectories)
+        for result_id, trajectory in trajectories.items():
+            assert_same_trajectory(store.load_trajectory(result_id), as_float32(trajectory))
+
+        rows = dict(store.connection.execute("""
+            SELECT id, trajectory_encoding FROM simulation_results WHERE trajectory_data IS NULL
+        """).fetchall())
+        assert rows == {result_id: 'f32-delta-zlib-v1' for result_id in trajectories}
+        assert store.load_trajectory(unreadable_id) is None
+
+        assert store.convert_trajectories_to_blob() == 0
+    finally:
+        store.close()
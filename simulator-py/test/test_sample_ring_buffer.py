@@ -0,0 +1,201 @@
+"""
+Golf HILS System - SPSC sample ring buffer
+
+Checks overflow policies and their counters, commit/rollback of the
+pending block, wrap-around reads and tag pairing.
+
+Run from simulator-py with: python -m pytest test
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.sample_ring_buffer import SampleRingBuffer
+from comm.serial_data_listener import SAMPLE_DTYPE, SwingData
+
+def sample(timestamp: int) -> SwingData:
+    return SwingData(timestamp, 0.1 * timestamp, 0.2, 1.0, 1.0, 2.0 * timestamp, 3.0,
+                     '7-Iron', 'TestPlayer', 'M5StickCPlus2_TEST')
+
+def records(timestamps) -> np.ndarray:
+    samples = np.zeros(len(timestamps), dtype=SAMPLE_DTYPE)
+    samples['timestamp'] = timestamps
+    samples['gyro_y'] = np.asarray(timestamps) * 2.0
+    return samples
+
+def push_all(ring: SampleRingBuffer, timestamps) -> list:
+    return [ring.push(sample(timestamp)) for timestamp in timestamps]
+
+def read_timestamps(ring: SampleRingBuffer) -> tuple:
+    samples, tag = ring.read_block()
+    return samples['timestamp'].tolist(), tag
+
+def test_invalid_options_are_rejected():
+    with pytest.raises(ValueError):
+        SampleRingBuffer(capacity=0)
+    with pytest.raises(ValueError):
+        SampleRingBuffer(overflow='overwrite')
+
+def test_commit_and_read_one_block():
+    ring = SampleRingBuffer(capacity=8)
+    push_all(ring, range(5))
+    assert ring.pending == 5
+    assert ring.read_block() is None    # Nothing committed yet
+
+    assert ring.commit('swing-1') == 5
+    assert ring.pending == 0
+
+    samples, tag = ring.read_block()
+    assert tag == 'swing-1'
+    assert samples['timestamp'].tolist() == [0, 1, 2, 3, 4]
+    assert samples['gyro_y'].tolist() == [0.0, 2.0, 4.0, 6.0, 8.0]
+    assert len(ring) == 0
+    assert ring.read_block() is None
+
+def test_rollback_discards_only_the_pending_block():
+    ring = SampleRingBuffer(capacity=8)
+    push_all(ring, range(3))
+    ring.commit('kept')
+    push_all(ring, range(10, 14))
+
+    assert ring.rollback() == 4
+    assert ring.pending == 0
+    assert len(ring) == 3
+    assert ring.commit('empty') == 0    # Empty blocks are not published
+    assert ring.blocks_committed == 1
+
+    assert read_timestamps(ring) == ([0, 1, 2], 'kept')
+    assert ring.read_block() is None
+
+def test_rolled_back_slots_are_reused():
+    ring = SampleRingBuffer(capacity=4)
+    push_all(ring, range(4))
+    ring.rollback()
+    assert push_all(ring, range(10, 14)) == [True] * 4
+    ring.commit()
+    assert read_timestamps(ring) == ([10, 11, 12, 13], None)
+    assert ring.dropped == 0
+
+def test_read_block_wraps_around():
+    ring = SampleRingBuffer(capacity=5)
+    push_all(ring, range(3))
+    ring.commit('first')
+    assert read_timestamps(ring) == ([0, 1, 2], 'first')
+
+    # Slots 3, 4, 0, 1: the block crosses the end of the buffer
+    push_all(ring, range(10, 14))
+    ring.commit('wrapped')
+    assert read_timestamps(ring) == ([10, 11, 12, 13], 'wrapped')
+    assert ring.dropped == 0
+
+def test_tags_pair_with_their_blocks_in_order():
+    ring = SampleRingBuffer(capacity=16)
+    expected = []
+    for swing, size in enumerate((3, 1, 4, 2)):
+        timestamps = list(range(swing * 100, swing * 100 + size))
+        push_all(ring, timestamps)
+        ring.commit({'swing': swing})
+        expected.append((timestamps, {'swing': swing}))
+
+    # Read in between further commits as well
+    assert read_timestamps(ring) == expected[0]
+    push_all(ring, [900, 901])
+    ring.commit('late')
+    expected.append(([900, 901], 'late'))
+
+    assert [read_timestamps(ring) for _ in range(4)] == expected[1:]
+    assert ring.read_block() is None
+    assert ring.blocks_committed == ring.blocks_read == 5
+
+def test_drop_oldest_drops_oldest_pending_samples():
+    ring = SampleRingBuffer(capacity=4, overflow='drop_oldest')
+    assert push_all(ring, range(6)) == [True] * 6
+    assert ring.dropped == 2
+    assert ring.pushed == 6
+    assert ring.pending == 4
+
+    ring.commit()
+    assert read_timestamps(ring) == ([2, 3, 4, 5], None)
+
+def test_drop_oldest_never_overwrites_committed_blocks():
+    ring = SampleRingBuffer(capacity=4, overflow='drop_oldest')
+    push_all(ring, range(3))
+    ring.commit('unread')
+
+    # One free slot, then the new samples are the ones dropped
+    assert push_all(ring, [10, 11, 12]) == [True, False, False]
+    assert ring.dropped == 2
+    assert ring.high_water == 4
+    ring.commit('partial')
+
+    assert read_timestamps(ring) == ([0, 1, 2], 'unread')
+    assert read_timestamps(ring) == ([10], 'partial')
+
+def test_block_policy_waits_then_drops():
+    ring = SampleRingBuffer(capacity=4, overflow='block', block_timeout_s=0.05)
+    push_all(ring, range(4))
+    ring.commit()
+
+    start = time.monotonic()
+    assert ring.push(sample(10)) is False
+    assert time.monotonic() - start >= 0.05
+    assert ring.dropped == 1
+
+def test_block_policy_resumes_when_consumer_reads():
+    ring = SampleRingBuffer(capacity=4, overflow='block', block_timeout_s=5.0)
+    push_all(ring, range(4))
+    ring.commit('full')
+
+    blocks = []
+    consumer = threading.Timer(0.05, lambda: blocks.append(read_timestamps(ring)))
+    consumer.start()
+    assert ring.push(sample(10)) is True    # Waits for the read above
+    consumer.join()
+
+    assert blocks == [([0, 1, 2, 3], 'full')]
+    assert ring.dropped == 0
+    ring.commit('next')
+    assert read_timestamps(ring) == ([10], 'next')
+
+def test_block_policy_drops_oldest_of_a_block_larger_than_the_ring():
+    ring = SampleRingBuffer(capacity=4, overflow='block', block_timeout_s=5.0)
+    start = time.monotonic()
+    push_all(ring, range(6))
+    assert time.monotonic() - start < 1.0    # Nothing to wait for
+    assert ring.dropped == 2
+    ring.commit()
+    assert read_timestamps(ring) == ([2, 3, 4, 5], None)
+
+@pytest.mark.parametrize("overflow", SampleRingBuffer.OVERFLOW_POLICIES)
+def test_push_block_matches_push(overflow):
+    rng = np.random.default_rng(1)
+    by_sample = SampleRingBuffer(capacity=16, overflow=overflow, block_timeout_s=0.0)
+    by_block = SampleRingBuffer(capacity=16, overflow=overflow, block_timeout_s=0.0)
+    timestamp = 0
+    for _ in range(300):
+        action = rng.integers(0, 4)
+        if action == 0:
+            size = int(rng.integers(1, 24))
+            timestamps = list(range(timestamp, timestamp + size))
+            timestamp += size
+            stored = sum(push_all(by_sample, timestamps))
+            assert by_block.push_block(records(timestamps)) == stored
+        elif action == 1:
+            assert by_sample.commit(timestamp) == by_block.commit(timestamp)
+        elif action == 2:
+            assert by_sample.rollback() == by_block.rollback()
+        else:
+            expected, actual = by_sample.read_block(), by_block.read_block()
+            assert (expected is None) == (actual is None)
+            if expected is not None:
+                assert expected[1] == actual[1]
+                assert np.array_equal(expected[0]['timestamp'], actual[0]['timestamp'])
+        assert by_sample.stats() == by_block.stats()
@@ -0,0 +1,123 @@
+"""
+Golf HILS System - swing segmentation
+
+Checks that SwingSegmenter.scan() over sample blocks produces the same
+events, at the same sample indices, as calling update() per sample.
+
+Run from simulator-py with: python -m pytest test
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent))
+
+from comm.serial_data_listener import SwingData
+from sim.swing_segmenter import SwingSegmenter
+
+def phase(count: int, gyro: float, accel: float = 1.0) -> list:
+    return [(gyro, accel)] * count
+
+def synthetic_session() -> np.ndarray:
+    """(timestamp, gyro_x..z, accel_x..z) rows at 100 Hz
+
+    Rest, a waggle that never reaches impact (abort), a full swing with
+    impact and follow-through, and a slow swing without impact that has to
+    be closed by max_swing_ms.
+    """
+    magnitudes = (
+        phase(20, 5.0) +
+        phase(8, 200.0) + phase(5, 10.0) +                        # Waggle, then back to rest
+        phase(10, 5.0) +
+        phase(30, 400.0) + phase(40, 1500.0) + [(1800.0, 9.0)] +   # Backswing, downswing, impact
+        phase(20, 900.0, 3.0) + phase(15, 60.0) + phase(10, 5.0) +  # Follow-through, settle
+        phase(350, 180.0) + phase(20, 5.0)                         # No impact: times out
+    )
+    rng = np.random.default_rng(0)
+    rows = []
+    for index, (gyro, accel) in enumerate(magnitudes):
+        # Split the magnitudes over the axes with a little noise
+        gyro_axes = gyro * np.array([0.2, 0.96, 0.2]) * rng.uniform(0.99, 1.0)
+        accel_axes = accel * np.array([0.6, 0.0, 0.8]) * rng.uniform(0.99, 1.0)
+        rows.append((index * 10, *gyro_axes, *accel_axes))
+    return np.array(rows)
+
+def magnitudes(rows: np.ndarray) -> tuple:
+    return (rows[:, 0].astype(np.int64), np.linalg.norm(rows[:, 1:4], axis=1),
+            np.linalg.norm(rows[:, 4:7], axis=1))
+
+def update_events(segmenter: SwingSegmenter, rows: np.ndarray) -> list:
+    events = []
+    for index, (timestamp, gx, gy, gz, ax, ay, az) in enumerate(rows):
+        event = segmenter.update(SwingData(int(timestamp), ax, ay, az, gx, gy, gz,
+                                           '7-Iron', 'TestPlayer', 'M5StickCPlus2_TEST'))
+        if event:
+            events.append((index, event))
+    return events
+
+def scan_events(segmenter: SwingSegmenter, rows: np.ndarray, block_sizes) -> list:
+    timestamps, gyro, accel = magnitudes(rows)
+    events = []
+    start = 0
+    for size in block_sizes:
+        end = min(start + size, len(rows))
+        events.extend((start + index, event)
+                      for index, event in segmenter.scan(timestamps[start:end], gyro[start:end], accel[start:end]))
+        start = end
+    assert start == len(rows)
+    return events
+
+def segmenter_state(segmenter: SwingSegmenter) -> tuple:
+    return (segmenter.phase, segmenter.swing_start_timestamp, segmenter.impact_timestamp,
+            segmenter.samples_since_impact)
+
+def test_synthetic_session_events():
+    rows = synthetic_session()
+    events = update_events(SwingSegmenter(max_swing_ms=3000.0), rows)
+    assert [event for _, event in events] == [
+        SwingSegmenter.SWING_START, SwingSegmenter.SWING_ABORT,
+        SwingSegmenter.SWING_START, SwingSegmenter.IMPACT_DETECTED, SwingSegmenter.SWING_END,
+        SwingSegmenter.SWING_START, SwingSegmenter.SWING_END
+    ]
+    indices = {event: index for index, event in events[2:5]}
+    assert indices[SwingSegmenter.SWING_END] - indices[SwingSegmenter.IMPACT_DETECTED] == 5
+
+    # The last swing is closed after max_swing_ms
+    (start_index, _), (end_index, _) = events[5:]
+    assert rows[end_index, 0] - rows[start_index, 0] == 3000
+
+@pytest.mark.parametrize("post_impact_samples", [0, 1, 5, 30])
+def test_scan_matches_update_in_one_block(post_impact_samples):
+    rows = synthetic_session()
+    by_sample = SwingSegmenter(post_impact_samples=post_impact_samples)
+    by_block = SwingSegmenter(post_impact_samples=post_impact_samples)
+
+    assert scan_events(by_block, rows, [len(rows)]) == update_events(by_sample, rows)
+    assert segmenter_state(by_block) == segmenter_state(by_sample)
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 7, 16, 64])
+def test_scan_matches_update_across_blocks(block_size):
+    rows = synthetic_session()
+    expected = update_events(SwingSegmenter(), rows)
+    assert scan_events(SwingSegmenter(), rows, [block_size] * len(rows)) == expected
+
+def test_scan_matches_update_with_random_blocks():
+    rows = synthetic_session()
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        by_sample, by_block = SwingSegmenter(), SwingSegmenter()
+        block_sizes = rng.integers(1, 40, len(rows))
+        assert scan_events(by_block, rows, block_sizes) == update_events(by_sample, rows)
+        assert segmenter_state(by_block) == segmenter_state(by_sample)
+
+def test_scan_of_an_empty_block_keeps_state():
+    segmenter = SwingSegmenter()
+    rows = synthetic_session()[:25]
+    scan_events(segmenter, rows, [len(rows)])
+    state = segmenter_state(segmenter)
+    assert segmenter.scan(np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros(0)) == []
+    assert segmenter_state(segmenter) == state